@@ -7,10 +7,16 @@ set -o errexit
 pip install -r requirements.txt
 
 
-# Convert static asset files
+# Convert static asset files: builds the STATIC_BUNDLES, writes content-hashed
+# copies and their gzip/brotli variants for WhiteNoise
 python manage.py collectstatic --no-input
 
 
+# Fail the deploy on configuration errors, e.g. core.E002 for a result cache
+# that each gunicorn worker would keep to itself
+python manage.py check
+
+
 # Apply any outstanding database migrations
 python manage.py migrate
 
@@ -0,0 +1,57 @@
+"""
+Moving old completed tasks out of core_task.
+
+archive_tasks() copies completed tasks whose deadline is older than a
+cutoff into ArchivedTask, keeping their primary keys, and deletes them
+from core_task, BATCH_SIZE tasks per transaction. The live table and its
+indexes then only grow with the work still in progress. Archived tasks
+leave the project counters and the deadline calendar; the task list
+shows them again on request (TaskFilterSet.with_archive).
+"""
+
+from datetime import datetime
+
+from django.db import transaction
+
+from core.models import ArchivedTask, Task
+from core.result_cache import bump_generation
+from core.stats import TaskState, apply_task_changes
+from core.task_calendar import invalidate_months
+
+BATCH_SIZE = 500
+FIELDS = [field.attname for field in Task._meta.concrete_fields]
+
+
+def archive_batch(older_than: datetime) -> int:
+    """Archives up to BATCH_SIZE tasks; returns how many"""
+
+    with transaction.atomic():
+        rows = list(
+            Task.objects.filter(is_completed=True, deadline__lt=older_than)
+            .order_by()
+            .values(*FIELDS)[:BATCH_SIZE]
+        )
+        if not rows:
+            return 0
+        ArchivedTask.objects.bulk_create(ArchivedTask(**row) for row in rows)
+        batch = Task.objects.filter(pk__in=[row["id"] for row in rows]).order_by()
+        # A single DELETE without the collector and the per-row signals,
+        # whose bookkeeping is done below once for the whole batch
+        batch._raw_delete(batch.db)
+        states = [
+            TaskState(row["project_id"], True, row["priority"], row["deadline"])
+            for row in rows
+        ]
+        apply_task_changes([(state, None) for state in states])
+    bump_generation(Task)
+    invalidate_months(*states)
+    return len(rows)
+
+
+def archive_tasks(older_than: datetime) -> int:
+    """Archives the tasks completed with a deadline before older_than"""
+
+    archived = 0
+    while moved := archive_batch(older_than):
+        archived += moved
+    return archived
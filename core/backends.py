@@ -0,0 +1,31 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.exceptions import PermissionDenied
+
+from core.models import Worker
+
+
+class WorkerBackend(ModelBackend):
+    """
+    ModelBackend that loads the session's worker together with its position
+    and project, so request.user.position / .project cost no extra queries.
+    The middleware keeps the result on the request for its whole lifetime.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        user = super().authenticate(request, username, password, **kwargs)
+        if user is None:
+            # Ends authenticate() here: ModelBackend, listed after this
+            # backend for older sessions, would hash the password again
+            raise PermissionDenied
+        return user
+
+    def get_user(self, user_id: int) -> Worker | None:
+        user_model = get_user_model()
+        try:
+            user = user_model._default_manager.select_related(
+                "position", "project"
+            ).get(pk=user_id)
+        except user_model.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
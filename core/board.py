@@ -0,0 +1,128 @@
+"""
+Kanban columns of a project's tasks.
+
+The first page of every column comes from a single query: each task is
+labelled with its column, numbered within it by ROW_NUMBER() and counted
+by COUNT() over the same partition, and only the first rows of every
+partition are kept. Further pages are loaded one column at a time.
+"""
+
+from datetime import datetime
+from typing import NamedTuple
+
+from django.core.paginator import Paginator
+from django.db.models import (
+    Case,
+    CharField,
+    Count,
+    F,
+    Q,
+    QuerySet,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.functions import RowNumber
+
+from core.models import Project, Task
+
+COLUMNS = {
+    "open": "Open",
+    "in_progress": "In progress",
+    "overdue": "Overdue",
+    "done": "Done",
+}
+
+
+class Column(NamedTuple):
+    key: str
+    title: str
+    count: int
+    tasks: list[Task]
+    next_page: int | None
+
+
+def column_conditions(now: datetime) -> dict[str, Q]:
+    """Mutually exclusive conditions selecting the tasks of each column"""
+
+    upcoming = Q(is_completed=False, deadline__gte=now)
+    return {
+        "open": upcoming & Q(assignee__isnull=True),
+        "in_progress": upcoming & Q(assignee__isnull=False),
+        "overdue": Q(is_completed=False, deadline__lt=now),
+        "done": Q(is_completed=True),
+    }
+
+
+def board_tasks(project: Project) -> QuerySet:
+    return (
+        Task.objects.filter(project=project)
+        .select_related("task_type", "assignee")
+        .order_by("deadline", "pk")
+    )
+
+
+def load_columns(project: Project, now: datetime, per_column: int) -> list[Column]:
+    """The first per_column tasks and the size of every column"""
+
+    # The same columns as column_conditions(), each When relying on the
+    # previous ones not having matched
+    column = Case(
+        When(is_completed=True, then=Value("done")),
+        When(deadline__lt=now, then=Value("overdue")),
+        When(assignee__isnull=True, then=Value("open")),
+        default=Value("in_progress"),
+        output_field=CharField(),
+    )
+    # Number only the primary keys; the few tasks shown are loaded by pk
+    # instead of carrying every column of every task through the sort.
+    rows = (
+        Task.objects.filter(project=project)
+        .annotate(column=column)
+        .annotate(
+            position=Window(
+                RowNumber(), partition_by=F("column"), order_by=("deadline", "pk")
+            ),
+            column_count=Window(Count("pk"), partition_by=F("column")),
+        )
+        .filter(position__lte=per_column)
+        .order_by()
+        .values_list("pk", "column", "column_count", "position")
+    )
+
+    by_column = {key: [] for key in COLUMNS}
+    counts = dict.fromkeys(COLUMNS, 0)
+    for pk, key, count, _ in sorted(rows, key=lambda row: row[3]):
+        by_column[key].append(pk)
+        counts[key] = count
+    tasks = board_tasks(project).in_bulk(
+        [pk for pks in by_column.values() for pk in pks]
+    )
+    return [
+        Column(
+            key,
+            title,
+            counts[key],
+            [tasks[pk] for pk in by_column[key]],
+            2 if counts[key] > per_column else None,
+        )
+        for key, title in COLUMNS.items()
+    ]
+
+
+def load_column_page(
+    project: Project, key: str, now: datetime, number: int | str, per_column: int
+) -> Column:
+    """One page of a single column; raises InvalidPage past its end"""
+
+    paginator = Paginator(
+        board_tasks(project).filter(column_conditions(now)[key]), per_column
+    )
+    page = paginator.page(number)
+    return Column(
+        key,
+        COLUMNS[key],
+        paginator.count,
+        list(page.object_list),
+        page.next_page_number() if page.has_next() else None,
+    )
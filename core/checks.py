@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.core.checks import Error, Warning, register
+
+PROCESS_LOCAL_CACHES = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+SESSION_CACHE_EFFECTS = {
+    "django.contrib.sessions.backends.cache": (
+        "users are logged out whenever a request lands on another worker"
+    ),
+    "django.contrib.sessions.backends.cached_db": (
+        "a session logged out on one worker stays valid on the others "
+        "until their cached copy expires"
+    ),
+}
+
+
+@register()
+def check_session_cache(app_configs, **kwargs) -> list[Warning]:
+    """Sessions read from a cache must live in a cache every worker can see"""
+
+    effect = SESSION_CACHE_EFFECTS.get(settings.SESSION_ENGINE)
+    if effect is None:
+        return []
+    backend = settings.CACHES[settings.SESSION_CACHE_ALIAS]["BACKEND"]
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Warning(
+            f"The session engine reads sessions from a per-process cache; "
+            f"{effect}.",
+            hint="Point CACHES at a shared cache or use SESSION_BACKEND=db.",
+            id="core.W001",
+        )
+    ]
+
+
+@register()
+def check_result_cache(app_configs, **kwargs) -> list[Error]:
+    """Cached task pages and months are only invalidated in a shared cache"""
+
+    alias = settings.TASK_RESULT_CACHE_ALIAS
+    if not alias or settings.SERVER_PROCESSES < 2:
+        return []
+    if settings.CACHES[alias]["BACKEND"] not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Error(
+            "TASK_RESULT_CACHE_ALIAS points at a per-process cache, but "
+            f"{settings.SERVER_PROCESSES} server processes share the site; a "
+            "task change made on one leaves the others serving stale task "
+            "pages and calendar counts.",
+            hint="Set REDIS_URL in prod, or set TASK_RESULT_CACHE_ALIAS to None.",
+            id="core.E002",
+        )
+    ]
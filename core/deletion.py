@@ -0,0 +1,174 @@
+"""
+Deleting projects and workers without one long transaction.
+
+Deleting a project cascades to all its tasks, and deleting a worker nulls
+the assignee and author of theirs. Left to Django's collector, both load
+every affected row and change them in a single transaction. Instead, the
+object is marked as deleting (which hides it from lists and choices) and
+a Deletion records the job. A runner then works through the children in
+batches of BATCH_SIZE primary keys, each batch in its own short
+transaction, and deletes the object itself once nothing points at it.
+
+The runner is started in a background thread once the request commits;
+the process_deletions command resumes jobs whose thread died with its
+worker process.
+"""
+
+import threading
+from datetime import timedelta
+from typing import NamedTuple
+
+from django.db import close_old_connections, transaction
+from django.db.models import Model, Q, QuerySet
+from django.utils import timezone
+
+from core.models import (
+    ArchivedTask,
+    Deletion,
+    Project,
+    Task,
+    TaskEvent,
+    TaskRollup,
+    Worker,
+)
+from core.result_cache import bump_generation
+from core.task_calendar import invalidate_all_months
+
+BATCH_SIZE = 500
+# A job whose heartbeat is older than this is taken over by another runner
+STALE_AFTER = timedelta(minutes=2)
+
+
+class Step(NamedTuple):
+    """Rows pointing at the deleted object, deleted or detached in batches"""
+
+    model: type[Model]
+    field: str
+    detach: bool = False
+
+    def rows(self, object_id: int) -> QuerySet:
+        return self.model.objects.filter(**{f"{self.field}_id": object_id})
+
+    def apply(self, pks: list[int]) -> None:
+        batch = self.model.objects.filter(pk__in=pks).order_by()
+        if self.detach:
+            batch.update(**{self.field: None})
+        else:
+            # A single DELETE without the collector and the per-row signals;
+            # run_step() accounts for their effects once per batch.
+            batch._raw_delete(batch.db)
+
+
+STEPS = {
+    Deletion.Target.PROJECT: (
+        Step(Task, "project"),
+        Step(ArchivedTask, "project"),
+        Step(TaskEvent, "project"),
+        Step(TaskRollup, "project"),
+    ),
+    Deletion.Target.WORKER: (
+        Step(Task, "assignee", detach=True),
+        Step(Task, "created_by", detach=True),
+        Step(ArchivedTask, "assignee", detach=True),
+        Step(ArchivedTask, "created_by", detach=True),
+        Step(TaskEvent, "assignee", detach=True),
+        Step(TaskRollup, "assignee", detach=True),
+    ),
+}
+MODELS = {Deletion.Target.PROJECT: Project, Deletion.Target.WORKER: Worker}
+
+
+def start_deletion(obj: Project | Worker) -> Deletion:
+    """Marks obj as deleting and schedules its deletion"""
+
+    target = (
+        Deletion.Target.PROJECT if isinstance(obj, Project) else Deletion.Target.WORKER
+    )
+    with transaction.atomic():
+        deletion = Deletion.objects.filter(
+            target=target, object_id=obj.pk, finished_at__isnull=True
+        ).first()
+        if deletion is not None:
+            return deletion
+        fields = {"is_deleting": True}
+        if target == Deletion.Target.WORKER:
+            fields["is_active"] = False
+        MODELS[target].objects.filter(pk=obj.pk).update(**fields)
+        deletion = Deletion.objects.create(
+            target=target,
+            object_id=obj.pk,
+            name=str(obj),
+            total=sum(step.rows(obj.pk).count() for step in STEPS[target]),
+        )
+        transaction.on_commit(lambda: start_runner(deletion.pk))
+    return deletion
+
+
+def start_runner(deletion_id: int) -> None:
+    threading.Thread(
+        target=run_in_thread, args=(deletion_id,), daemon=True
+    ).start()
+
+
+def run_in_thread(deletion_id: int) -> None:
+    try:
+        run_deletion(deletion_id)
+    finally:
+        close_old_connections()
+
+
+def claim(deletion_id: int) -> bool:
+    """Takes the job unless a live runner holds it"""
+
+    now = timezone.now()
+    return bool(
+        Deletion.objects.filter(pk=deletion_id, finished_at__isnull=True)
+        .filter(Q(heartbeat__isnull=True) | Q(heartbeat__lt=now - STALE_AFTER))
+        .update(heartbeat=now)
+    )
+
+
+def run_step(deletion: Deletion, step: Step) -> None:
+    while True:
+        with transaction.atomic():
+            pks = list(
+                step.rows(deletion.object_id)
+                .order_by()
+                .values_list("pk", flat=True)[:BATCH_SIZE]
+            )
+            if not pks:
+                return
+            step.apply(pks)
+            deletion.done += len(pks)
+            deletion.heartbeat = timezone.now()
+            deletion.save(update_fields=["done", "heartbeat"])
+        if step.model is Task:
+            bump_generation(Task)
+            invalidate_all_months()
+
+
+def run_deletion(deletion_id: int) -> bool:
+    """
+    Works through a claimed job batch by batch and deletes its object.
+    Returns False if another runner holds the job or it is finished.
+    """
+
+    if not claim(deletion_id):
+        return False
+    deletion = Deletion.objects.get(pk=deletion_id)
+    for step in STEPS[deletion.target]:
+        run_step(deletion, step)
+    with transaction.atomic():
+        MODELS[deletion.target].objects.filter(pk=deletion.object_id).delete()
+        deletion.finished_at = timezone.now()
+        deletion.save(update_fields=["finished_at"])
+    return True
+
+
+def resume_deletions() -> int:
+    """Runs every unfinished job no live runner holds; returns how many"""
+
+    pending = Deletion.objects.filter(finished_at__isnull=True).values_list(
+        "pk", flat=True
+    )
+    return sum(run_deletion(deletion_id) for deletion_id in list(pending))
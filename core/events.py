@@ -0,0 +1,207 @@
+import asyncio
+import itertools
+import json
+import threading
+from collections import defaultdict
+from functools import cache
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import HttpRequest
+from django.utils.module_loading import import_string
+
+from core.models import Task
+
+
+class Subscription:
+    """A single listener's view of a broker channel"""
+
+    async def get(self, timeout: float) -> dict | None:
+        """Returns the next event, or None if nothing arrived within timeout"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+
+class BaseBroker:
+    """Pub/sub interface used to fan task events out to SSE listeners"""
+
+    # Whether events reach listeners in every server process
+    shared = False
+
+    def publish(self, channel: str, event: dict) -> None:
+        raise NotImplementedError
+
+    def subscribe(self, channel: str) -> Subscription:
+        """Must be called from the event loop that will consume the events"""
+        raise NotImplementedError
+
+
+class LocalSubscription(Subscription):
+    def __init__(self, broker: "LocalBroker", channel: str, max_queued: int) -> None:
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_queued)
+
+    def offer(self, event: dict) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The listener's loop is already closed.
+            self.close()
+
+    def _put(self, event: dict) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: float) -> dict | None:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class LocalBroker(BaseBroker):
+    """
+    In-process broker: events only reach listeners in the same worker.
+
+    Publishing is thread-safe, so sync views running in a thread pool can
+    publish to listeners waiting on the ASGI event loop.
+    """
+
+    max_queued = 100
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+        self._ids = itertools.count(1)
+
+    def publish(self, channel: str, event: dict) -> None:
+        with self._lock:
+            event = {**event, "id": next(self._ids)}
+            subscriptions = list(self._subscriptions[channel])
+        for subscription in subscriptions:
+            subscription.offer(event)
+
+    def subscribe(self, channel: str) -> LocalSubscription:
+        subscription = LocalSubscription(self, channel, self.max_queued)
+        with self._lock:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LocalSubscription) -> None:
+        with self._lock:
+            listeners = self._subscriptions.get(subscription.channel)
+            if listeners is not None:
+                listeners.discard(subscription)
+                if not listeners:
+                    del self._subscriptions[subscription.channel]
+
+
+class RedisSubscription(Subscription):
+    def __init__(self, url: str, channel: str) -> None:
+        from redis.asyncio import Redis
+
+        self.client = Redis.from_url(url)
+        self.pubsub = self.client.pubsub()
+        self.channel = channel
+        self.subscribed = False
+
+    async def get(self, timeout: float) -> dict | None:
+        if not self.subscribed:
+            await self.pubsub.subscribe(self.channel)
+            self.subscribed = True
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        # Subscription confirmations come back as None before the timeout
+        while (remaining := deadline - loop.time()) > 0:
+            message = await self.pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=remaining
+            )
+            if message is not None:
+                return json.loads(message["data"])
+        return None
+
+    def close(self) -> None:
+        # Called from the stream's finally block, on the listener's loop
+        task = asyncio.get_running_loop().create_task(self._close())
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+
+    async def _close(self) -> None:
+        await self.pubsub.aclose()
+        await self.client.aclose()
+
+
+# Keeps pending RedisSubscription._close() tasks from being garbage collected
+_closing: set[asyncio.Task] = set()
+
+
+class RedisBroker(BaseBroker):
+    """
+    Redis pub/sub on TASK_EVENTS_REDIS_URL: events reach listeners in every
+    worker process. Each listener holds its own Redis connection.
+    """
+
+    shared = True
+
+    def __init__(self) -> None:
+        from redis import Redis
+
+        self.url = settings.TASK_EVENTS_REDIS_URL
+        self.client = Redis.from_url(self.url)
+
+    def publish(self, channel: str, event: dict) -> None:
+        event = {**event, "id": self.client.incr("task-events:id")}
+        self.client.publish(channel, json.dumps(event))
+
+    def subscribe(self, channel: str) -> RedisSubscription:
+        return RedisSubscription(self.url, channel)
+
+
+@cache
+def get_broker() -> BaseBroker:
+    return import_string(settings.TASK_EVENTS_BROKER)()
+
+
+def streams_events(request: HttpRequest) -> bool:
+    """
+    True when the request is served over ASGI and the broker reaches every
+    listener. Under WSGI an event stream would hold its worker thread for as
+    long as the page stays open; with a process-local broker and several
+    server processes, most events would never reach the page.
+    """
+
+    return isinstance(request, ASGIRequest) and (
+        settings.SERVER_PROCESSES == 1 or get_broker().shared
+    )
+
+
+def project_channel(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+def publish_task_event(task: Task, event_type: str) -> None:
+    """Publishes a task event to its project's channel once the transaction commits"""
+
+    event = {
+        "type": event_type,
+        "task": {
+            "id": task.pk,
+            "name": task.name,
+            "deadline": task.deadline.isoformat(),
+            "priority": task.priority,
+            "is_completed": task.is_completed,
+            "project": task.project_id,
+            "assignee": task.assignee_id,
+        },
+    }
+    channel = project_channel(task.project_id)
+    transaction.on_commit(lambda: get_broker().publish(channel, event))
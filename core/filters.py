@@ -0,0 +1,252 @@
+"""
+Declarative filters shared by the list views, the JSON API and CSV export.
+
+A FilterSet validates request data with its search form and compiles the
+active filters into a single Q, ordered so that cheap, selective, indexed
+conditions come first and pattern matches last. canonical_key() names the
+resulting row set independently of parameter order, defaults and unrelated
+query parameters, so equal filters can share cached results.
+"""
+
+from datetime import datetime
+from typing import Callable, NamedTuple
+from urllib.parse import urlencode
+
+from django.db.models import BooleanField, Model, Q, QuerySet, Value
+from django.forms import Form
+from django.utils import timezone
+
+from core.forms.search_forms import (
+    ProjectSearchForm,
+    TaskSearchForm,
+    WorkerSearchForm,
+)
+from core.models import Worker
+
+# Compiled predicates run in rank order
+INDEXED = 0  # equality on an indexed column, e.g. a foreign key
+RANGE = 1  # boolean and range conditions, partly covered by partial indexes
+SCAN = 2  # pattern matches that have to read every remaining row
+
+
+class FilterContext(NamedTuple):
+    user: Worker | None
+    now: datetime
+
+
+class Filter:
+    """Passes the cleaned value of a search-form field to an ORM lookup"""
+
+    uses_user = False
+
+    def __init__(self, lookup: str, rank: int = INDEXED) -> None:
+        self.lookup = lookup
+        self.rank = rank
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def condition(self, value, context: FilterContext) -> Q:
+        return Q(**{self.lookup: value})
+
+    def depends_on_time(self, value) -> bool:
+        return False
+
+
+class ChoiceFilter(Filter):
+    """Maps each choice of a search-form field to the condition it selects"""
+
+    def __init__(
+        self,
+        choices: dict[str, Callable[[FilterContext], Q]],
+        rank: int = INDEXED,
+        uses_user: bool = False,
+        time_dependent: tuple[str, ...] = (),
+    ) -> None:
+        super().__init__(lookup="", rank=rank)
+        self.choices = choices
+        self.uses_user = uses_user
+        self.time_dependent = time_dependent
+
+    def condition(self, value: str, context: FilterContext) -> Q:
+        return self.choices[value](context)
+
+    def depends_on_time(self, value: str) -> bool:
+        return value in self.time_dependent
+
+
+class FilterSet:
+    """Filters declared as class attributes, validated by form_class"""
+
+    form_class: type[Form]
+    filters: dict[str, Filter] = {}
+    # Values of the form's sort field, "" being the default. Each one is
+    # backed by an index so that no choice sorts the whole table.
+    orderings: dict[str, tuple[str, ...]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.filters = {
+            name: value
+            for name, value in vars(cls).items()
+            if isinstance(value, Filter)
+        }
+
+    def __init__(self, data, user: Worker | None = None) -> None:
+        self.form = self.form_class(data)
+        self.context = FilterContext(user, timezone.now())
+
+    def is_valid(self) -> bool:
+        return self.form.is_valid()
+
+    @property
+    def errors(self):
+        return self.form.errors
+
+    def active(self) -> list[tuple[Filter, object]]:
+        """Filters with a value, most selective first"""
+
+        if not self.is_valid():
+            return []
+        active = [
+            (spec, self.form.cleaned_data[name])
+            for name, spec in self.filters.items()
+            if self.form.cleaned_data.get(name) not in (None, "")
+        ]
+        return sorted(active, key=lambda item: (item[0].rank, item[0].name))
+
+    def condition(self) -> Q:
+        return Q(
+            *(spec.condition(value, self.context) for spec, value in self.active())
+        )
+
+    def sort(self) -> str:
+        """The requested sort key, the default one for invalid input"""
+
+        if not self.is_valid():
+            return ""
+        return self.form.cleaned_data.get("sort") or ""
+
+    def order(self, queryset: QuerySet) -> QuerySet:
+        ordering = self.orderings.get(self.sort())
+        return queryset.order_by(*ordering) if ordering else queryset
+
+    def filter(self, queryset: QuerySet) -> QuerySet:
+        return self.order(queryset.filter(self.condition()))
+
+    def depends_on_time(self) -> bool:
+        """True when the row set changes as time passes, without any write"""
+
+        return any(spec.depends_on_time(value) for spec, value in self.active())
+
+    def canonical_key(self) -> str:
+        values = {
+            spec.name: value.pk if isinstance(value, Model) else value
+            for spec, value in self.active()
+        }
+        if any(spec.uses_user for spec, _ in self.active()):
+            values["user"] = self.context.user.pk
+        if self.sort():
+            values["sort"] = self.sort()
+        return urlencode(sorted(values.items()))
+
+
+class TaskFilterSet(FilterSet):
+    form_class = TaskSearchForm
+
+    project = Filter("project")
+    task_type = Filter("task_type")
+    priority = Filter("priority", rank=RANGE)
+    assigned_to_me = ChoiceFilter(
+        {
+            "yes": lambda context: Q(assignee=context.user),
+            "no": lambda context: ~Q(assignee=context.user),
+        },
+        uses_user=True,
+    )
+    created_by_me = ChoiceFilter(
+        {
+            "yes": lambda context: Q(created_by=context.user),
+            "no": lambda context: ~Q(created_by=context.user),
+        },
+        uses_user=True,
+    )
+    status = ChoiceFilter(
+        {
+            "done": lambda context: Q(is_completed=True),
+            "not_done": lambda context: Q(is_completed=False),
+            "overdue": lambda context: Q(
+                is_completed=False, deadline__lt=context.now
+            ),
+        },
+        rank=RANGE,
+        time_dependent=("overdue",),
+    )
+    name = Filter("name__icontains", rank=SCAN)
+
+    # The primary key breaks ties so that pages never overlap; it is the
+    # implicit last column of every index on SQLite
+    orderings = {
+        "": ("deadline", "pk"),  # task_deadline_idx
+        "-deadline": ("-deadline", "-pk"),  # task_deadline_idx, backwards
+        "priority": ("-priority", "deadline", "pk"),  # task_priority_deadline_idx
+        "name": ("name", "pk"),  # task_name_idx
+    }
+
+    def includes_archived(self) -> bool:
+        return (
+            self.is_valid() and self.form.cleaned_data["include_archived"] == "yes"
+        )
+
+    def with_archive(self, queryset: QuerySet, archive: QuerySet) -> QuerySet:
+        """
+        The filtered rows of queryset and of the ArchivedTask queryset archive
+        as a single sorted UNION ALL, each row's archived attribute telling
+        which table it came from. Only slicing, count() and values() work on
+        the result.
+        """
+
+        condition = self.condition()
+        parts = [
+            part.filter(condition)
+            .annotate(archived=Value(is_archive, output_field=BooleanField()))
+            .order_by()
+            for part, is_archive in ((queryset, False), (archive, True))
+        ]
+        return self.order(parts[0].union(parts[1], all=True))
+
+
+class WorkerFilterSet(FilterSet):
+    form_class = WorkerSearchForm
+
+    position = Filter("position")
+    project = Filter("project")
+    username = Filter("username__icontains", rank=SCAN)
+
+    orderings = {
+        "": ("username",),  # unique
+        "-username": ("-username",),
+        "-date_joined": ("-date_joined", "-pk"),  # worker_date_joined_idx
+    }
+
+
+class ProjectFilterSet(FilterSet):
+    form_class = ProjectSearchForm
+
+    name = Filter("name__icontains", rank=SCAN)
+
+    # The task counters are denormalized in ProjectStats
+    orderings = {
+        "": ("name",),  # unique
+        "-name": ("-name",),
+        # stats_open_idx and stats_overdue_idx, backwards
+        "-open": ("-stats__open_count", "-stats__project_id"),
+        "-overdue": ("-stats__overdue_count", "-stats__project_id"),
+    }
+
+    def order(self, queryset: QuerySet) -> QuerySet:
+        if self.sort() in ("-open", "-overdue"):
+            # Every project has stats (core.signals); the inner join lets the
+            # counter index drive the query instead of the project table
+            queryset = queryset.filter(stats__isnull=False)
+        return super().order(queryset)
@@ -1,7 +1,10 @@
+from datetime import date
+
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.forms import Form
 from django import forms
 
-from core.models import Task, TaskType, Project, Position
+from core.models import Task, TaskType, Project, Position, Worker
 
 
 class ProjectSearchForm(Form):
@@ -12,6 +15,17 @@ class ProjectSearchForm(Form):
             attrs={"placeholder": "Enter the project name"}
         )
     )
+    sort = forms.ChoiceField(
+        choices=[
+            ("", "Name"),
+            ("-name", "Name, descending"),
+            ("-open", "Most open tasks"),
+            ("-overdue", "Most overdue tasks"),
+        ],
+        required=False,
+        widget=forms.Select(attrs={"class": "select-field"}),
+        label="Sort by"
+    )
 
 
 class WorkerSearchForm(Form):
@@ -22,7 +36,7 @@ class WorkerSearchForm(Form):
         label="Position"
     )
     project = forms.ModelChoiceField(
-        queryset=Project.objects.all(),
+        queryset=Project.objects.filter(is_deleting=False),
         required=False,
         widget=forms.Select(attrs={"class": "select-field"}),
         label="Project"
@@ -34,6 +48,16 @@ class WorkerSearchForm(Form):
             attrs={"placeholder": "Enter the username"}
         )
     )
+    sort = forms.ChoiceField(
+        choices=[
+            ("", "Username"),
+            ("-username", "Username, descending"),
+            ("-date_joined", "Newest first"),
+        ],
+        required=False,
+        widget=forms.Select(attrs={"class": "select-field"}),
+        label="Sort by"
+    )
 
 
 class TaskSearchForm(Form):
@@ -51,7 +75,8 @@ class TaskSearchForm(Form):
         choices=[
             ("", "----------"),
             ("done", "Completed"),
-            ("not_done", "Not completed")
+            ("not_done", "Not completed"),
+            ("overdue", "Overdue")
         ],
         required=False,
         widget=forms.Select(attrs={"class": "select-field"}),
@@ -67,12 +92,25 @@ class TaskSearchForm(Form):
         widget=forms.Select(attrs={"class": "select-field"}),
         label="Created by me"
     )
-    priority = forms.ChoiceField(
-        choices=[("", "----------")] + Task.PRIORITY_CHOICES,
+    priority = forms.TypedChoiceField(
+        choices=[("", "----------")] + Task.Priority.choices,
+        coerce=int,
+        empty_value=None,
         required=False,
         widget=forms.Select(attrs={"class": "select-field"}),
         label="Priority"
     )
+    sort = forms.ChoiceField(
+        choices=[
+            ("", "Deadline"),
+            ("-deadline", "Deadline, latest first"),
+            ("priority", "Priority, then deadline"),
+            ("name", "Name"),
+        ],
+        required=False,
+        widget=forms.Select(attrs={"class": "select-field"}),
+        label="Sort by"
+    )
     task_type = forms.ModelChoiceField(
         queryset=TaskType.objects.all(),
         required=False,
@@ -80,11 +118,20 @@ class TaskSearchForm(Form):
         label="Task Type"
     )
     project = forms.ModelChoiceField(
-        queryset=Project.objects.all(),
+        queryset=Project.objects.filter(is_deleting=False),
         required=False,
         widget=forms.Select(attrs={"class": "select-field"}),
         label="Project"
     )
+    include_archived = forms.ChoiceField(
+        choices=[
+            ("", "No"),
+            ("yes", "Yes")
+        ],
+        required=False,
+        widget=forms.Select(attrs={"class": "select-field"}),
+        label="Include archived"
+    )
     name = forms.CharField(
         required=False,
         label="",
@@ -94,3 +141,60 @@ class TaskSearchForm(Form):
             }
         )
     )
+
+
+# The calendar links to the previous and next month or week, and reads the
+# month around a week; keep a year of room from date.min and date.max
+CALENDAR_RANGE = [
+    MinValueValidator(date(2, 1, 1)),
+    MaxValueValidator(date(9998, 12, 31)),
+]
+
+
+class CalendarSearchForm(Form):
+    project = forms.ModelChoiceField(
+        queryset=Project.objects.filter(is_deleting=False),
+        required=False,
+        widget=forms.Select(attrs={"class": "select-field"}),
+        label="Project"
+    )
+    assignee = forms.ModelChoiceField(
+        queryset=Worker.objects.filter(is_deleting=False),
+        required=False,
+        widget=forms.Select(attrs={"class": "select-field"}),
+        label="Assignee"
+    )
+    month = forms.DateField(
+        input_formats=["%Y-%m"],
+        required=False,
+        validators=CALENDAR_RANGE,
+        widget=forms.DateInput(attrs={"type": "month"}, format="%Y-%m"),
+        label="Month"
+    )
+    week = forms.DateField(
+        required=False,
+        validators=CALENDAR_RANGE,
+        widget=forms.DateInput(attrs={"type": "date"}, format="%Y-%m-%d"),
+        label="Week of"
+    )
+
+
+class ReportSearchForm(Form):
+    project = forms.ModelChoiceField(
+        queryset=Project.objects.filter(is_deleting=False),
+        required=False,
+        widget=forms.Select(attrs={"class": "select-field"}),
+        label="Project"
+    )
+    days = forms.TypedChoiceField(
+        choices=[
+            (7, "Last 7 days"),
+            (30, "Last 30 days"),
+            (90, "Last 90 days"),
+        ],
+        coerce=int,
+        empty_value=30,
+        required=False,
+        widget=forms.Select(attrs={"class": "select-field"}),
+        label="Period"
+    )
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.archive import archive_tasks
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves completed tasks whose deadline is more than --older-than days "
+        "in the past to the archive table, in batches. Meant to run "
+        "periodically (e.g. nightly)."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            required=True,
+            metavar="DAYS",
+            help="Archive completed tasks due more than DAYS days ago.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["older_than"] < 0:
+            raise CommandError("--older-than must not be negative.")
+        cutoff = timezone.now() - timedelta(days=options["older_than"])
+        archived = archive_tasks(cutoff)
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} task(s)."))
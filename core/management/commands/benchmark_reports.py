@@ -0,0 +1,108 @@
+import random
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from core.models import Project, Task, TaskEvent, Worker
+from core.rollups import daily_trend, overdue_by_project, roll_up_events
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the 30-day report as the event history grows, read from "
+        "the rollups and, for comparison, aggregated from the raw event log. "
+        "The generated history is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--steps", type=int, default=4)
+        parser.add_argument("--days-per-step", type=int, default=365)
+        parser.add_argument("--events-per-day", type=int, default=200)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options) -> None:
+        projects = list(Project.objects.values_list("pk", flat=True))
+        workers = list(Worker.objects.values_list("pk", flat=True))
+        if not projects or not workers:
+            raise CommandError("Run seed_demo_data first.")
+
+        try:
+            with transaction.atomic():
+                self.run(projects, workers, options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, projects: list[int], workers: list[int], options: dict) -> None:
+        rng = random.Random(0)
+        now = timezone.now()
+        end = timezone.localdate(now) + timedelta(days=1)
+        start = end - timedelta(days=30)
+        step = options["days_per_step"]
+
+        self.stdout.write(
+            f"{'history':>12} {'events':>10} {'rollups ms':>11} {'raw log ms':>11}"
+        )
+        for number in range(options["steps"]):
+            oldest = now - timedelta(days=step * (number + 1))
+            TaskEvent.objects.bulk_create(
+                (
+                    TaskEvent(
+                        kind=rng.choice(TaskEvent.Kind.values),
+                        occurred_at=oldest
+                        + timedelta(seconds=rng.randint(0, step * 86400)),
+                        project_id=rng.choice(projects),
+                        assignee_id=rng.choice(workers),
+                        priority=rng.choice(Task.Priority.values),
+                    )
+                    for _ in range(step * options["events_per_day"])
+                ),
+                batch_size=2000,
+            )
+            # Older than the cursor, so rolled up as a window of its own
+            roll_up_events(oldest, oldest + timedelta(days=step))
+
+            rollups = self.measure(
+                lambda: (daily_trend(start, end), overdue_by_project(start, end)),
+                options["repeat"],
+            )
+            raw = self.measure(
+                lambda: list(
+                    TaskEvent.objects.annotate(
+                        day=TruncDate(
+                            "occurred_at", tzinfo=timezone.get_current_timezone()
+                        )
+                    )
+                    .filter(day__gte=start, day__lt=end)
+                    .values("day")
+                    .annotate(
+                        created=Count("pk", filter=Q(kind=TaskEvent.Kind.CREATED)),
+                        completed=Count("pk", filter=Q(kind=TaskEvent.Kind.COMPLETED)),
+                    )
+                ),
+                options["repeat"],
+            )
+            self.stdout.write(
+                f"{step * (number + 1):>7} days {TaskEvent.objects.count():>10} "
+                f"{rollups:>11.2f} {raw:>11.2f}"
+            )
+
+    @staticmethod
+    def measure(report, repeat: int) -> float:
+        report()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            report()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,169 @@
+import http.client
+import os
+import re
+import runpy
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+PRESETS = ("sync", "gthread", "uvicorn")
+CSRF_INPUT = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-tests the gunicorn.conf.py presets. Starts gunicorn once per "
+        "preset, logs in as a seeded user (see seed_demo_data) and hammers "
+        "the given pages over keep-alive connections, reporting throughput "
+        "and latency percentiles."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--presets", nargs="+", choices=PRESETS, default=PRESETS)
+        parser.add_argument(
+            "--paths", nargs="+", default=["/", "/tasks/", "/projects/"]
+        )
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--duration", type=float, default=10)
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--username", default="user")
+        parser.add_argument("--password", default="ytrewq123")
+
+    def handle(self, *args, **options) -> None:
+        self.stdout.write(
+            f"{options['concurrency']} clients x {options['duration']:g}s "
+            f"on {', '.join(options['paths'])}"
+        )
+        self.stdout.write(
+            f"{'preset':<10}{'workers':>8}{'threads':>8}"
+            f"{'req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'errors':>8}"
+        )
+        for preset in options["presets"]:
+            result = self.run_preset(preset, options)
+            self.stdout.write(
+                f"{preset:<10}{result['workers']:>8}{result['threads']:>8}"
+                f"{result['rps']:>10.1f}{result['p50']:>9.1f}"
+                f"{result['p95']:>9.1f}{result['errors']:>8}"
+            )
+
+    def run_preset(self, preset: str, options: dict) -> dict:
+        # Both gunicorn and the config evaluated here read the preset from env
+        os.environ.update(GUNICORN_PRESET=preset, PORT=str(options["port"]))
+        config = runpy.run_path(str(settings.BASE_DIR / "gunicorn.conf.py"))
+        error_log = tempfile.TemporaryFile(mode="w+")
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "--config", "gunicorn.conf.py"],
+            cwd=settings.BASE_DIR,
+            stdout=subprocess.DEVNULL,
+            stderr=error_log,
+        )
+        try:
+            self.wait_until_ready(server, error_log, options["port"])
+            cookie = self.log_in(options)
+            result = self.load(cookie, options)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+            error_log.close()
+        result["workers"] = config["workers"]
+        result["threads"] = config["threads"]
+        return result
+
+    @staticmethod
+    def wait_until_ready(server: subprocess.Popen, error_log, port: int) -> None:
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                error_log.seek(0)
+                raise CommandError(error_log.read())
+            try:
+                connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+                connection.request("GET", "/accounts/login/")
+                connection.getresponse().read()
+                return
+            except OSError:
+                time.sleep(0.2)
+        raise CommandError("gunicorn did not start within 30 seconds.")
+
+    @staticmethod
+    def log_in(options: dict) -> str:
+        connection = http.client.HTTPConnection("127.0.0.1", options["port"])
+        connection.request("GET", "/accounts/login/")
+        response = connection.getresponse()
+        csrf_token = CSRF_INPUT.search(response.read().decode()).group(1)
+        cookies = SimpleCookie(response.getheader("Set-Cookie"))
+        body = urlencode(
+            {
+                "username": options["username"],
+                "password": options["password"],
+                "csrfmiddlewaretoken": csrf_token,
+            }
+        )
+        connection.request(
+            "POST",
+            "/accounts/login/",
+            body=body,
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded",
+                "Cookie": f"csrftoken={cookies['csrftoken'].value}",
+            },
+        )
+        response = connection.getresponse()
+        response.read()
+        cookies.load(response.getheader("Set-Cookie") or "")
+        if response.status != 302 or "sessionid" not in cookies:
+            raise CommandError(
+                f"Could not log in as {options['username']!r}; "
+                f"run `manage.py seed_demo_data` first."
+            )
+        return f"sessionid={cookies['sessionid'].value}"
+
+    @staticmethod
+    def load(cookie: str, options: dict) -> dict:
+        latencies, errors = [], []
+        deadline = time.monotonic() + options["duration"]
+
+        def client(offset: int) -> None:
+            connection = http.client.HTTPConnection("127.0.0.1", options["port"])
+            paths = options["paths"]
+            sent = offset
+            while time.monotonic() < deadline:
+                start = time.perf_counter()
+                try:
+                    connection.request(
+                        "GET", paths[sent % len(paths)], headers={"Cookie": cookie}
+                    )
+                    response = connection.getresponse()
+                    response.read()
+                    if response.status != 200:
+                        errors.append(response.status)
+                except (OSError, http.client.HTTPException) as error:
+                    errors.append(error)
+                    connection.close()
+                latencies.append((time.perf_counter() - start) * 1000)
+                sent += 1
+
+        clients = [
+            threading.Thread(target=client, args=(i,))
+            for i in range(options["concurrency"])
+        ]
+        for thread in clients:
+            thread.start()
+        for thread in clients:
+            thread.join()
+
+        percentiles = statistics.quantiles(latencies, n=20)
+        return {
+            "rps": len(latencies) / options["duration"],
+            "p50": statistics.median(latencies),
+            "p95": percentiles[18],
+            "errors": len(errors),
+        }
@@ -0,0 +1,195 @@
+import multiprocessing
+import queue
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+from contextlib import closing
+from datetime import timedelta
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connections
+from django.http import HttpResponse
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+STARTUP_TIMEOUT = 120
+
+
+def copy_database(source: str, target: Path) -> None:
+    with closing(sqlite3.connect(source)) as src, closing(
+        sqlite3.connect(target)
+    ) as dst:
+        src.backup(dst)
+        # WAL is recorded in the file; every profile starts from the default
+        dst.execute("PRAGMA journal_mode=DELETE")
+
+
+def write_load(
+    path: str,
+    db_options: dict,
+    username: str,
+    duration: float,
+    ready: threading.Barrier,
+    results: multiprocessing.Queue,
+) -> None:
+    """
+    Runs in its own process, like a server worker: creates, updates,
+    completes and deletes tasks until the duration is up
+    """
+
+    django.setup()
+    connections["default"].settings_dict.update(NAME=path, OPTIONS=db_options)
+
+    from core.models import Project, Worker
+
+    user = Worker.objects.get(username=username)
+    project_id = user.project_id or Project.objects.values_list("pk", flat=True)[0]
+    client = Client(SERVER_NAME="localhost")
+    client.force_login(user)
+    latencies, errors = [], 0
+
+    def send(request, expected_status: int) -> HttpResponse | None:
+        nonlocal errors
+        start = time.perf_counter()
+        try:
+            response = request()
+        except OperationalError:  # database is locked
+            response = None
+        latencies.append((time.perf_counter() - start) * 1000)
+        if response is None or response.status_code != expected_status:
+            errors += 1
+            return None
+        return response
+
+    ready.wait(timeout=STARTUP_TIMEOUT)
+    deadline = time.monotonic() + duration
+    sent = 0
+    while time.monotonic() < deadline:
+        sent += 1
+        response = send(
+            lambda: client.post(
+                reverse("core:api-task-list"),
+                {
+                    "name": f"Benchmark task {sent}",
+                    "description": "Written by benchmark_sqlite_writes",
+                    "deadline": (timezone.now() + timedelta(days=1)).isoformat(),
+                    "priority": 2,
+                    "project": project_id,
+                    "assignee": user.pk,
+                },
+                content_type="application/json",
+            ),
+            201,
+        )
+        if response is None:
+            continue
+        pk = response.json()["data"]["id"]
+        send(
+            lambda: client.patch(
+                reverse("core:api-task-detail", args=(pk,)),
+                {"priority": 3},
+                content_type="application/json",
+            ),
+            200,
+        )
+        send(lambda: client.post(reverse("core:task-mark-completed", args=(pk,))), 302)
+        send(lambda: client.delete(reverse("core:api-task-detail", args=(pk,))), 204)
+    results.put((latencies, errors))
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures concurrent writes to SQLite through the task endpoints, "
+        "with Django's default connection settings and with the OPTIONS of "
+        "the default database. Each profile runs on its own copy of the "
+        "database: several processes, each a full Django stack like a "
+        "server worker, create, update, complete and delete tasks as a "
+        "seeded user (see seed_demo_data)."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--processes", type=int, default=4)
+        parser.add_argument("--duration", type=float, default=10)
+        parser.add_argument("--username", default="user")
+
+    def handle(self, *args, **options) -> None:
+        # Imported here and in write_load(): the spawned processes import
+        # this module before django.setup()
+        from core.models import Worker
+
+        database = settings.DATABASES["default"]
+        if database["ENGINE"] != "django.db.backends.sqlite3":
+            raise CommandError("The default database is not SQLite.")
+        if not Worker.objects.filter(username=options["username"]).exists():
+            raise CommandError(
+                f"No worker {options['username']!r}; "
+                f"run `manage.py seed_demo_data` first."
+            )
+        connections.close_all()
+
+        profiles = {"defaults": {}, "configured": database.get("OPTIONS", {})}
+        self.stdout.write(
+            f"{options['processes']} processes x {options['duration']:g}s of "
+            f"create, update, complete and delete requests"
+        )
+        self.stdout.write(
+            f"{'profile':<12}{'req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'errors':>8}"
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            for name, db_options in profiles.items():
+                path = Path(directory) / f"{name}.sqlite3"
+                copy_database(str(database["NAME"]), path)
+                result = self.run_profile(str(path), db_options, options)
+                self.stdout.write(
+                    f"{name:<12}{result['rps']:>10.1f}{result['p50']:>9.1f}"
+                    f"{result['p95']:>9.1f}{result['errors']:>8}"
+                )
+
+    @staticmethod
+    def run_profile(path: str, db_options: dict, options: dict) -> dict:
+        # Fresh interpreters, so no process inherits an open connection
+        context = multiprocessing.get_context("spawn")
+        ready = context.Barrier(options["processes"] + 1)
+        results = context.Queue()
+        processes = [
+            context.Process(
+                target=write_load,
+                args=(
+                    path,
+                    db_options,
+                    options["username"],
+                    options["duration"],
+                    ready,
+                    results,
+                ),
+            )
+            for _ in range(options["processes"])
+        ]
+        for process in processes:
+            process.start()
+        try:
+            ready.wait(timeout=STARTUP_TIMEOUT)
+            collected = [
+                results.get(timeout=options["duration"] + STARTUP_TIMEOUT)
+                for _ in processes
+            ]
+        except (threading.BrokenBarrierError, queue.Empty):
+            raise CommandError("A benchmark process failed; see its traceback above.")
+        finally:
+            for process in processes:
+                process.join(timeout=STARTUP_TIMEOUT)
+
+        latencies = [latency for part, _ in collected for latency in part]
+        percentiles = statistics.quantiles(latencies, n=20)
+        return {
+            "rps": len(latencies) / options["duration"],
+            "p50": statistics.median(latencies),
+            "p95": percentiles[18],
+            "errors": sum(errors for _, errors in collected),
+        }
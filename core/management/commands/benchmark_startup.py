@@ -0,0 +1,97 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Runs in a fresh interpreter so imports and django.setup() are really cold.
+CHILD_SCRIPT = """
+import io, json, sys, time
+
+start = time.perf_counter()
+import django
+django.setup()
+setup_done = time.perf_counter()
+from task_manager.wsgi import application
+app_loaded = time.perf_counter()
+
+
+def request(path):
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": path,
+        "QUERY_STRING": "",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "HTTP_HOST": "localhost",
+        "wsgi.input": io.BytesIO(),
+        "wsgi.errors": sys.stderr,
+        "wsgi.url_scheme": "http",
+    }
+    statuses = []
+    b"".join(application(environ, lambda status, *args: statuses.append(status)))
+    return statuses[0]
+
+
+status = request(sys.argv[1])
+first_done = time.perf_counter()
+request(sys.argv[1])
+second_done = time.perf_counter()
+print(json.dumps({
+    "setup": (setup_done - start) * 1000,
+    "application": (app_loaded - setup_done) * 1000,
+    "first_request": (first_done - app_loaded) * 1000,
+    "second_request": (second_done - first_done) * 1000,
+    "status": status,
+    "modules": len(sys.modules),
+    "debug_toolbar": "debug_toolbar" in sys.modules,
+}))
+"""
+
+TIMINGS = ("setup", "application", "first_request", "second_request")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures django.setup(), WSGI application load and first-request "
+        "latency in fresh processes for the given settings module."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--settings-module",
+            default=os.environ.get("DJANGO_SETTINGS_MODULE"),
+            help="Settings module to start the child processes with.",
+        )
+        parser.add_argument("--path", default="/accounts/login/")
+        parser.add_argument("--runs", type=int, default=5)
+
+    def handle(self, *args, **options) -> None:
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": options["settings_module"]}
+        results = []
+        for _ in range(options["runs"]):
+            child = subprocess.run(
+                [sys.executable, "-c", CHILD_SCRIPT, options["path"]],
+                cwd=settings.BASE_DIR,
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+            if child.returncode:
+                raise CommandError(child.stderr)
+            results.append(json.loads(child.stdout.splitlines()[-1]))
+
+        last = results[-1]
+        self.stdout.write(
+            f"{options['settings_module']}, GET {options['path']} -> "
+            f"{last['status']}, median of {len(results)} fresh processes"
+        )
+        for timing in TIMINGS:
+            median = statistics.median(result[timing] for result in results)
+            self.stdout.write(f"  {timing:<15} {median:8.1f} ms")
+        self.stdout.write(f"  modules loaded  {last['modules']:8d}")
+        toolbar = "imported" if last["debug_toolbar"] else "absent"
+        self.stdout.write(f"  debug_toolbar   {toolbar:>8}")
@@ -0,0 +1,73 @@
+import io
+import sys
+import time
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.templatetags.static import static
+from django.test.utils import override_settings
+
+# The previous stack: WhiteNoise misses fall through to sessions, auth and
+# URL resolution before ending in the 404 handler
+FALLTHROUGH_MIDDLEWARE = [
+    "whitenoise.middleware.WhiteNoiseMiddleware"
+    if entry == "core.middleware.StaticFilesMiddleware"
+    else entry
+    for entry in settings.MIDDLEWARE
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures static file throughput through the full WSGI handler: a "
+        "bundle hit, and a miss under STATIC_URL with StaticFilesMiddleware "
+        "and with plain WhiteNoise. Run collectstatic first."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--requests", type=int, default=2000)
+
+    def handle(self, *args, **options) -> None:
+        missing = f"{settings.STATIC_URL}css/missing.css"
+        cases = (
+            ("hit", static("css/bundle.css"), settings.MIDDLEWARE),
+            ("miss", missing, settings.MIDDLEWARE),
+            ("miss, plain WhiteNoise", missing, FALLTHROUGH_MIDDLEWARE),
+        )
+        self.stdout.write(f"{options['requests']} requests per case")
+        for label, path, middleware in cases:
+            with override_settings(MIDDLEWARE=middleware):
+                handler = WSGIHandler()
+            status = self.request(handler, path)
+            if label == "hit" and not status.startswith("200"):
+                raise CommandError(f"{path} answered {status}; run collectstatic.")
+
+            start = time.perf_counter()
+            for _ in range(options["requests"]):
+                self.request(handler, path)
+            elapsed = time.perf_counter() - start
+            self.stdout.write(
+                f"{label:<24}{status:<16}{options['requests'] / elapsed:>9.0f} req/s"
+                f"{elapsed * 1e6 / options['requests']:>9.0f} us/req"
+            )
+
+    @staticmethod
+    def request(handler: WSGIHandler, path: str) -> str:
+        environ = {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path,
+            "QUERY_STRING": "",
+            "SERVER_NAME": "localhost",
+            "SERVER_PORT": "80",
+            "HTTP_HOST": "localhost",
+            "HTTP_ACCEPT_ENCODING": "gzip, deflate, br",
+            "wsgi.input": io.BytesIO(),
+            "wsgi.errors": sys.stderr,
+            "wsgi.url_scheme": "http",
+        }
+        statuses = []
+        response = handler(environ, lambda status, *args: statuses.append(status))
+        b"".join(response)
+        response.close()
+        return statuses[0]
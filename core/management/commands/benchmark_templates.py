@@ -0,0 +1,101 @@
+import statistics
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.template import Context, Template
+from django.template.loader import get_template
+from django.test import RequestFactory
+from django.utils import timezone
+
+from core.forms.search_forms import TaskSearchForm, WorkerSearchForm
+from core.models import Position, Project, Task, TaskType, Worker
+
+CRISPY_FIELDS = Template(
+    "{% load crispy_forms_filters %}"
+    "{% for field in form %}{{ field|as_crispy_field }}{% endfor %}"
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures render time of task_list.html and worker_list.html with N "
+        "rows, reporting crispy-forms search form rendering separately."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--rows", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=50)
+
+    def handle(self, *args, **options) -> None:
+        rows, repeat = options["rows"], options["repeat"]
+        request = RequestFactory().get("/")
+        request.user = Worker(pk=rows + 1, username="viewer")
+        project = Project(pk=1, name="Project", description="Description")
+        position = Position(pk=1, name="Developer")
+        task_type = TaskType(pk=1, name="Feature")
+        workers = [
+            Worker(
+                pk=i,
+                username=f"worker{i}",
+                first_name="John",
+                last_name="Doe",
+                email=f"worker{i}@example.com",
+                position=position,
+                project=project,
+            )
+            for i in range(1, rows + 1)
+        ]
+        for worker in workers:
+            worker.tasks_count = 3
+        tasks = [
+            Task(
+                pk=i,
+                name=f"Task {i}",
+                description="Description for the task",
+                deadline=timezone.now() + timedelta(days=i),
+                priority=Task.Priority.MEDIUM,
+                task_type=task_type,
+                project=project,
+                assignee=workers[i - 1],
+            )
+            for i in range(1, rows + 1)
+        ]
+
+        pages = (
+            ("core/task_list.html", "task_list", tasks, TaskSearchForm),
+            ("core/worker_list.html", "worker_list", workers, WorkerSearchForm),
+        )
+        self.stdout.write(f"{rows} rows, median of {repeat} renders")
+        for template_name, context_name, objects, form_class in pages:
+            template = get_template(template_name)
+            context = {
+                context_name: objects,
+                "search_form": form_class(),
+                "now": timezone.now(),
+                "is_paginated": False,
+            }
+            page = self.measure(
+                lambda: template.render(context, request), repeat
+            )
+            crispy = self.measure(
+                lambda: CRISPY_FIELDS.render(
+                    Context({"form": context["search_form"]})
+                ),
+                repeat,
+            )
+            self.stdout.write(
+                f"{template_name:<24} page {page:7.2f} ms | "
+                f"crispy search form {crispy:7.2f} ms "
+                f"({crispy / page:.0%} of page)"
+            )
+
+    @staticmethod
+    def measure(render, repeat: int) -> float:
+        render()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            render()
+            timings.append((time.perf_counter() - start) * 1000)
+        return statistics.median(timings)
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from core.rollups import build_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Rolls task events logged since the previous run up into the daily "
+        "report tables and records today's overdue counts. Meant to run "
+        "periodically (e.g. every 15 minutes)."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Recompute the event counts from the whole event log instead.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        rolled_up = build_rollups(rebuild=options["rebuild"])
+        self.stdout.write(self.style.SUCCESS(f"Rolled up {rolled_up} event(s)."))
@@ -0,0 +1,46 @@
+import csv
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from core.onboarding import onboard_workers
+
+
+class Command(BaseCommand):
+    help = (
+        "Creates workers from a CSV file with the columns username, password, "
+        "email, first_name, last_name, position and project (names). "
+        "Passwords are hashed in a process pool; nothing is created if any "
+        "row is invalid."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("csv_file")
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help="Hashing processes, one per CPU by default.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        with open(options["csv_file"], newline="", encoding="utf-8") as csv_file:
+            rows = list(csv.DictReader(csv_file))
+
+        start = time.perf_counter()
+        try:
+            workers = onboard_workers(rows, options["processes"])
+        except ValidationError as error:
+            raise CommandError(
+                "\n".join(
+                    f"{row}: {' '.join(problems)}"
+                    for row, problems in error.message_dict.items()
+                )
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {len(workers)} worker(s) "
+                f"in {time.perf_counter() - start:.1f}s."
+            )
+        )
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from core.deletion import resume_deletions
+
+
+class Command(BaseCommand):
+    help = (
+        "Finishes project and worker deletions whose background runner "
+        "stopped, e.g. because its worker process was restarted. Meant to "
+        "run periodically (e.g. every 5 minutes)."
+    )
+
+    def handle(self, *args, **options) -> None:
+        resumed = resume_deletions()
+        self.stdout.write(self.style.SUCCESS(f"Finished {resumed} deletion(s)."))
@@ -0,0 +1,122 @@
+import random
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import Position, Project, Task, TaskEvent, TaskType, Worker
+from core.result_cache import bump_generation
+from core.rollups import build_rollups
+from core.stats import rebuild_project_stats
+from core.task_calendar import invalidate_all_months
+
+DEMO_PASSWORD = "ytrewq123"
+POSITIONS = ("Developer", "QA Engineer", "Designer", "Project Manager")
+TASK_TYPES = ("Feature", "Bug", "Refactoring", "Research")
+
+
+class Command(BaseCommand):
+    help = (
+        "Fills the database with demo projects, workers and tasks, plus the "
+        "`admin` and `user` demo accounts. Used by the benchmarks."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--projects", type=int, default=5)
+        parser.add_argument("--workers", type=int, default=50)
+        parser.add_argument("--tasks", type=int, default=2000)
+        parser.add_argument("--seed", type=int, default=0)
+
+    @transaction.atomic
+    def handle(self, *args, **options) -> None:
+        rng = random.Random(options["seed"])
+        now = timezone.now()
+        # Hashed once: every demo account shares the same password
+        password = make_password(DEMO_PASSWORD)
+
+        positions = [Position.objects.get_or_create(name=name)[0] for name in POSITIONS]
+        task_types = [
+            TaskType.objects.get_or_create(name=name)[0] for name in TASK_TYPES
+        ]
+        projects = [
+            Project.objects.get_or_create(
+                name=f"Demo project {i}",
+                defaults={"description": f"Demo project number {i}"},
+            )[0]
+            for i in range(1, options["projects"] + 1)
+        ]
+
+        accounts = {"admin": True, "user": False}
+        accounts.update({f"worker{i}": False for i in range(1, options["workers"] + 1)})
+        existing = set(Worker.objects.values_list("username", flat=True))
+        Worker.objects.bulk_create(
+            Worker(
+                username=username,
+                password=password,
+                is_staff=is_superuser,
+                is_superuser=is_superuser,
+                position=rng.choice(positions),
+                project=rng.choice(projects),
+            )
+            for username, is_superuser in accounts.items()
+            if username not in existing
+        )
+        workers = list(Worker.objects.filter(username__in=accounts))
+
+        missing = options["tasks"] - Task.objects.filter(project__in=projects).count()
+        tasks = Task.objects.bulk_create(
+            (
+                Task(
+                    name=f"Demo task {i}",
+                    description="Generated by seed_demo_data",
+                    deadline=now + timedelta(hours=rng.randint(-24 * 30, 24 * 60)),
+                    priority=rng.choice(Task.Priority.values),
+                    is_completed=rng.random() < 0.3,
+                    task_type=rng.choice(task_types),
+                    project=rng.choice(projects),
+                    assignee=rng.choice(workers),
+                    created_by=rng.choice(workers),
+                )
+                for i in range(max(missing, 0))
+            ),
+            batch_size=500,
+        )
+        TaskEvent.objects.bulk_create(self.history(tasks, now, rng), batch_size=500)
+        # bulk_create skips the signals that keep project stats, cached
+        # task pages and calendar counts and the report rollups current
+        rebuild_project_stats(now)
+        bump_generation(Task)
+        invalidate_all_months()
+        build_rollups(now)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(projects)} projects, {len(workers)} workers, "
+                f"{Task.objects.count()} tasks. "
+                f"Log in as admin or user with password {DEMO_PASSWORD!r}."
+            )
+        )
+
+    @staticmethod
+    def history(
+        tasks: list[Task], now: datetime, rng: random.Random
+    ) -> Iterator[TaskEvent]:
+        """Creation and completion events spread over the last 60 days"""
+
+        for task in tasks:
+            created_at = now - timedelta(hours=rng.randint(1, 24 * 60))
+            fields = {
+                "project_id": task.project_id,
+                "assignee_id": task.assignee_id,
+                "priority": task.priority,
+            }
+            yield TaskEvent(
+                kind=TaskEvent.Kind.CREATED, occurred_at=created_at, **fields
+            )
+            if task.is_completed:
+                completed_at = created_at + (now - created_at) * rng.random()
+                yield TaskEvent(
+                    kind=TaskEvent.Kind.COMPLETED, occurred_at=completed_at, **fields
+                )
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from core.stats import rebuild_project_stats, sweep_overdue
+
+
+class Command(BaseCommand):
+    help = (
+        "Moves tasks whose deadline has passed into the overdue bucket of "
+        "their project's stats. Meant to run periodically (e.g. every minute)."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Recompute all project stats from the task table instead.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["rebuild"]:
+            rebuild_project_stats()
+            self.stdout.write(self.style.SUCCESS("Rebuilt project stats."))
+            return
+        moved = sweep_overdue()
+        self.stdout.write(self.style.SUCCESS(f"Moved {moved} task(s) to overdue."))
@@ -0,0 +1,23 @@
+from django.http import HttpResponseNotFound
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise that owns the whole STATIC_URL prefix.
+
+    Files are served from the index built at startup, and a path under the
+    prefix that is not in the index gets a bare 404 right here instead of
+    going through sessions, auth and URL resolution.
+    """
+
+    def __call__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        if request.path_info.startswith(self.static_prefix):
+            return HttpResponseNotFound()
+        return self.get_response(request)
@@ -0,0 +1,67 @@
+# Generated by Django 5.2 on 2026-10-19 10:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_project_stats(apps, schema_editor) -> None:
+    Project = apps.get_model("core", "Project")
+    ProjectStats = apps.get_model("core", "ProjectStats")
+    now = django.utils.timezone.now()
+    rows = Project.objects.values("id").annotate(
+        completed_count=Count("tasks", filter=Q(tasks__is_completed=True)),
+        overdue_count=Count(
+            "tasks", filter=Q(tasks__is_completed=False, tasks__deadline__lte=now)
+        ),
+        open_count=Count(
+            "tasks", filter=Q(tasks__is_completed=False, tasks__deadline__gt=now)
+        ),
+        low_priority_count=Count("tasks", filter=Q(tasks__priority="LOW")),
+        medium_priority_count=Count("tasks", filter=Q(tasks__priority="MEDIUM")),
+        high_priority_count=Count("tasks", filter=Q(tasks__priority="HIGH")),
+    )
+    ProjectStats.objects.bulk_create(
+        ProjectStats(project_id=row.pop("id"), overdue_as_of=now, **row)
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0007_alter_task_project"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectStats",
+            fields=[
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="core.project",
+                    ),
+                ),
+                ("open_count", models.IntegerField(default=0)),
+                ("overdue_count", models.IntegerField(default=0)),
+                ("completed_count", models.IntegerField(default=0)),
+                ("low_priority_count", models.IntegerField(default=0)),
+                ("medium_priority_count", models.IntegerField(default=0)),
+                ("high_priority_count", models.IntegerField(default=0)),
+                (
+                    "overdue_as_of",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "project stats",
+            },
+        ),
+        migrations.RunPython(backfill_project_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+PRIORITIES = {"LOW": "1", "MEDIUM": "2", "HIGH": "3"}
+
+
+def priority_names_to_numbers(apps, schema_editor) -> None:
+    Task = apps.get_model("core", "Task")
+    for name, number in PRIORITIES.items():
+        Task.objects.filter(priority=name).update(priority=number)
+
+
+def priority_numbers_to_names(apps, schema_editor) -> None:
+    Task = apps.get_model("core", "Task")
+    for name, number in PRIORITIES.items():
+        Task.objects.filter(priority=number).update(priority=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_task_open_deadline_indexes"),
+    ]
+
+    operations = [
+        # The column still holds text here; the numbers are cast by AlterField
+        migrations.RunPython(priority_names_to_numbers, priority_numbers_to_names),
+        migrations.AlterField(
+            model_name="task",
+            name="priority",
+            field=models.SmallIntegerField(
+                choices=[(1, "Low"), (2, "Medium"), (3, "High")]
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["-priority", "deadline"],
+                name="task_priority_deadline_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-19 11:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("core", "0010_task_priority_smallint"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="projectstats",
+            index=models.Index(fields=["open_count", "project"], name="stats_open_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="projectstats",
+            index=models.Index(
+                fields=["overdue_count", "project"], name="stats_overdue_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["deadline"], name="task_deadline_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["name"], name="task_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="worker",
+            index=models.Index(fields=["date_joined"], name="worker_date_joined_idx"),
+        ),
+    ]
@@ -0,0 +1,97 @@
+# Generated by Django 5.2 on 2026-10-19 11:35
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0012_task_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="is_deleting",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="worker",
+            name="is_deleting",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="assignee",
+            field=models.ForeignKey(
+                blank=True,
+                limit_choices_to={"is_deleting": False},
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="assigned_tasks",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="task",
+            name="project",
+            field=models.ForeignKey(
+                limit_choices_to={"is_deleting": False},
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tasks",
+                to="core.project",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="worker",
+            name="project",
+            field=models.ForeignKey(
+                blank=True,
+                limit_choices_to={"is_deleting": False},
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="workers",
+                to="core.project",
+            ),
+        ),
+        migrations.CreateModel(
+            name="Deletion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "target",
+                    models.CharField(
+                        choices=[("project", "Project"), ("worker", "Worker")],
+                        max_length=20,
+                    ),
+                ),
+                ("object_id", models.BigIntegerField()),
+                ("name", models.CharField(max_length=150)),
+                ("total", models.IntegerField(default=0)),
+                ("done", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("heartbeat", models.DateTimeField(null=True)),
+                ("finished_at", models.DateTimeField(null=True)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        condition=models.Q(("finished_at__isnull", True)),
+                        fields=("target", "object_id"),
+                        name="deletion_running_unique",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -8,6 +8,8 @@ from datetime import timedelta
 class Project(models.Model):
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField()
+    # Set while core.deletion removes the project's tasks in the background
+    is_deleting = models.BooleanField(default=False)
 
     class Meta:
         ordering = ["name"]
@@ -39,11 +41,20 @@ class Worker(AbstractUser):
         on_delete=models.SET_NULL,
         null=True,
         related_name="workers",
-        blank=True
+        blank=True,
+        limit_choices_to={"is_deleting": False}
     )
+    # Set while core.deletion detaches the worker's tasks in the background
+    is_deleting = models.BooleanField(default=False)
 
     class Meta:
         ordering = ["username"]
+        indexes = [
+            models.Index(
+                fields=["date_joined"],
+                name="worker_date_joined_idx"
+            ),
+        ]
 
     def clean(self) -> None:
         super().clean()
@@ -74,15 +85,13 @@ class Task(models.Model):
     name = models.CharField(max_length=255)
     description = models.TextField()
     deadline = models.DateTimeField()
-    PRIORITY_CHOICES = [
-        ("LOW", "Low"),
-        ("MEDIUM", "Medium"),
-        ("HIGH", "High")
-    ]
-    priority = models.CharField(
-        max_length=10,
-        choices=PRIORITY_CHOICES
-    )
+
+    class Priority(models.IntegerChoices):
+        LOW = 1, "Low"
+        MEDIUM = 2, "Medium"
+        HIGH = 3, "High"
+
+    priority = models.SmallIntegerField(choices=Priority)
     is_completed = models.BooleanField(default=False)
 
     task_type = models.ForeignKey(
@@ -96,13 +105,15 @@ class Task(models.Model):
         to=Project,
         on_delete=models.CASCADE,
         related_name="tasks",
+        limit_choices_to={"is_deleting": False}
     )
     assignee = models.ForeignKey(
         to=Worker,
         on_delete=models.SET_NULL,
         null=True,
         related_name="assigned_tasks",
-        blank=True
+        blank=True,
+        limit_choices_to={"is_deleting": False}
     )
     created_by = models.ForeignKey(
         to=Worker,
@@ -114,6 +125,24 @@ class Task(models.Model):
 
     class Meta:
         ordering = ["deadline"]
+        indexes = [
+            models.Index(
+                fields=["deadline"],
+                condition=models.Q(is_completed=False),
+                name="task_open_deadline_idx"
+            ),
+            models.Index(
+                fields=["assignee", "deadline"],
+                condition=models.Q(is_completed=False),
+                name="task_open_assignee_dl_idx"
+            ),
+            models.Index(
+                fields=["-priority", "deadline"],
+                name="task_priority_deadline_idx"
+            ),
+            models.Index(fields=["deadline"], name="task_deadline_idx"),
+            models.Index(fields=["name"], name="task_name_idx"),
+        ]
 
     def clean(self) -> None:
         super().clean()
@@ -128,3 +157,196 @@ class Task(models.Model):
 
     def __str__(self) -> str:
         return self.name
+
+
+class ProjectStats(models.Model):
+    """Task counters per project, kept up to date by core.stats"""
+
+    project = models.OneToOneField(
+        to=Project,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats"
+    )
+    open_count = models.IntegerField(default=0)
+    overdue_count = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+    low_priority_count = models.IntegerField(default=0)
+    medium_priority_count = models.IntegerField(default=0)
+    high_priority_count = models.IntegerField(default=0)
+    overdue_as_of = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name_plural = "project stats"
+        indexes = [
+            models.Index(fields=["open_count", "project"], name="stats_open_idx"),
+            models.Index(fields=["overdue_count", "project"], name="stats_overdue_idx"),
+        ]
+
+    @property
+    def tasks_count(self) -> int:
+        return self.open_count + self.overdue_count + self.completed_count
+
+    @property
+    def progress(self) -> int:
+        if not self.tasks_count:
+            return 0
+        return round(self.completed_count * 100 / self.tasks_count)
+
+    def __str__(self) -> str:
+        return f"Stats for {self.project}"
+
+
+class ArchivedTask(models.Model):
+    """
+    A completed task moved out of core_task by core.archive. The columns
+    match Task's, in the same order, so both tables can be queried as one
+    with UNION ALL.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    name = models.CharField(max_length=255)
+    description = models.TextField()
+    deadline = models.DateTimeField()
+    priority = models.SmallIntegerField(choices=Task.Priority)
+    is_completed = models.BooleanField(default=True)
+    task_type = models.ForeignKey(
+        to=TaskType,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+"
+    )
+    project = models.ForeignKey(
+        to=Project,
+        on_delete=models.CASCADE,
+        related_name="archived_tasks"
+    )
+    assignee = models.ForeignKey(
+        to=Worker,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+"
+    )
+    created_by = models.ForeignKey(
+        to=Worker,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+"
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["deadline"], name="archived_task_deadline_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class TaskEvent(models.Model):
+    """Append-only log of task creations and completions, see core.rollups"""
+
+    class Kind(models.TextChoices):
+        CREATED = "created", "Created"
+        COMPLETED = "completed", "Completed"
+
+    kind = models.CharField(max_length=20, choices=Kind)
+    occurred_at = models.DateTimeField(default=timezone.now)
+    project = models.ForeignKey(
+        to=Project,
+        on_delete=models.CASCADE,
+        related_name="task_events"
+    )
+    assignee = models.ForeignKey(
+        to=Worker,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+"
+    )
+    priority = models.SmallIntegerField(choices=Task.Priority)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["occurred_at"], name="task_event_occurred_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()} at {self.occurred_at}"
+
+
+class TaskRollup(models.Model):
+    """Task activity per local day, project, assignee and priority"""
+
+    day = models.DateField()
+    project = models.ForeignKey(
+        to=Project,
+        on_delete=models.CASCADE,
+        related_name="rollups"
+    )
+    assignee = models.ForeignKey(
+        to=Worker,
+        on_delete=models.SET_NULL,
+        null=True,
+        related_name="+"
+    )
+    priority = models.SmallIntegerField(choices=Task.Priority)
+    created_count = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+    # Open tasks past their deadline when the day was last rolled up
+    overdue_count = models.IntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["day", "project"], name="rollup_day_project_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"Rollup of {self.project} on {self.day}"
+
+
+class RollupCursor(models.Model):
+    """How far core.rollups has rolled up an event log"""
+
+    name = models.CharField(max_length=50, primary_key=True)
+    position = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.name} rolled up until {self.position}"
+
+
+class Deletion(models.Model):
+    """A project or worker being deleted in batches by core.deletion"""
+
+    class Target(models.TextChoices):
+        PROJECT = "project", "Project"
+        WORKER = "worker", "Worker"
+
+    target = models.CharField(max_length=20, choices=Target)
+    object_id = models.BigIntegerField()
+    name = models.CharField(max_length=150)
+    total = models.IntegerField(default=0)
+    done = models.IntegerField(default=0)
+    created_at = models.DateTimeField(default=timezone.now)
+    # Refreshed after every batch; a stale one means the runner died
+    heartbeat = models.DateTimeField(null=True)
+    finished_at = models.DateTimeField(null=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["target", "object_id"],
+                condition=models.Q(finished_at__isnull=True),
+                name="deletion_running_unique"
+            ),
+        ]
+
+    @property
+    def progress(self) -> int:
+        if self.finished_at:
+            return 100
+        if not self.total:
+            return 0
+        return min(round(self.done * 100 / self.total), 99)
+
+    def __str__(self) -> str:
+        return f"Deletion of {self.get_target_display().lower()} {self.name}"
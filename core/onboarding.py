@@ -0,0 +1,92 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from core.models import Position, Project, Worker
+
+WORKER_FIELDS = ("username", "first_name", "last_name", "email")
+COLUMNS = ("username", "password", *WORKER_FIELDS[1:], "position", "project")
+
+
+def hash_passwords(passwords: list[str], processes: int | None = None) -> list[str]:
+    """
+    Hashes passwords with the primary PASSWORD_HASHERS entry, spread over a
+    process pool. Slow hashers are slow on purpose, so one core per hash is
+    the only way to onboard a few hundred workers in reasonable time.
+    """
+
+    processes = processes or os.cpu_count() or 1
+    # Daemonic processes (parallel test runner, prefork task workers) cannot
+    # start a pool of their own
+    if processes == 1 or len(passwords) < 2 or multiprocessing.current_process().daemon:
+        return [make_password(password) for password in passwords]
+    chunksize = max(1, len(passwords) // (processes * 4))
+    with ProcessPoolExecutor(max_workers=processes, initializer=django.setup) as pool:
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+
+def build_workers(rows: list[dict]) -> list[Worker]:
+    """
+    Validates onboarding rows (username, password, email, first_name,
+    last_name, position and project names) into unsaved workers.
+    Raises ValidationError listing the missing columns, or else the
+    problems of every invalid row.
+    """
+
+    missing = [column for column in COLUMNS if any(column not in row for row in rows)]
+    if missing:
+        raise ValidationError(
+            {"header": [f"Missing column(s): {', '.join(missing)}."]}
+        )
+
+    positions = {position.name: position for position in Position.objects.all()}
+    projects = {project.name: project for project in Project.objects.all()}
+    taken = set(
+        Worker.objects.filter(
+            username__in=[row["username"] for row in rows]
+        ).values_list("username", flat=True)
+    )
+
+    workers, errors = [], {}
+    for number, row in enumerate(rows, start=1):
+        worker = Worker(**{field: row.get(field) or "" for field in WORKER_FIELDS})
+        problems = []
+        for name, lookup, attribute in (
+            (row.get("position"), positions, "position"),
+            (row.get("project"), projects, "project"),
+        ):
+            if name and name not in lookup:
+                problems.append(f"Unknown {attribute} {name!r}.")
+            setattr(worker, attribute, lookup.get(name))
+        if worker.username in taken:
+            problems.append(f"Username {worker.username!r} is already taken.")
+        taken.add(worker.username)
+        try:
+            worker.full_clean(exclude=["password"], validate_unique=False)
+            validate_password(row["password"], worker)
+        except ValidationError as error:
+            problems.extend(error.messages)
+        if problems:
+            errors[f"row {number}"] = problems
+        workers.append(worker)
+
+    if errors:
+        raise ValidationError(errors)
+    return workers
+
+
+def onboard_workers(rows: list[dict], processes: int | None = None) -> list[Worker]:
+    """Creates workers from onboarding rows; nothing is created if any row is invalid"""
+
+    workers = build_workers(rows)
+    hashes = hash_passwords([row["password"] for row in rows], processes)
+    for worker, password in zip(workers, hashes):
+        worker.password = password
+    with transaction.atomic():
+        return Worker.objects.bulk_create(workers)
@@ -0,0 +1,124 @@
+"""
+Serving list pages from a read replica.
+
+When DATABASES defines the alias named by REPLICA_DATABASE_ALIAS, views
+marked with replica_reads (function views) or replica_reads = True (class
+views) read from it; every other view, and every write, uses the default
+database.
+
+A replica lags behind the primary, so a request that writes sets a cookie
+that keeps the browser on the primary for REPLICA_STICKY_SECONDS and lets
+the user see their own changes. Within a request, reads that follow a write
+go to the primary as well, and so do the session and the logged-in user.
+"""
+
+from collections.abc import Callable
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.contrib.auth.middleware import get_user
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+from django.http import HttpRequest, HttpResponse
+
+STICKY_COOKIE = "primary_reads"
+
+# Read from the primary even in replica views: a login, logout or password
+# change has to take effect on the very next request
+PRIMARY_APPS = {"auth", "sessions"}
+
+
+class RequestRouting:
+    """Where the current request reads from, and whether it has written"""
+
+    def __init__(self) -> None:
+        self.read_alias: str | None = None
+        self.wrote = False
+
+
+# Set by ReplicaMiddleware for the duration of a request, including the
+# rendering of its template response
+_routing: ContextVar[RequestRouting | None] = ContextVar(
+    "replica_routing", default=None
+)
+
+
+def replica_alias() -> str | None:
+    alias = settings.REPLICA_DATABASE_ALIAS
+    return alias if alias in settings.DATABASES else None
+
+
+def replica_reads(view: Callable) -> Callable:
+    """Marks a function view whose reads may be served by the replica"""
+
+    view.replica_reads = True
+    return view
+
+
+def reads_from_replica() -> bool:
+    routing = _routing.get()
+    return routing is not None and routing.read_alias is not None
+
+
+class ReplicaRouter:
+    """Sends the reads of marked views to the replica, everything else to default"""
+
+    def db_for_read(self, model: type[Model], **hints) -> str | None:
+        routing = _routing.get()
+        if routing is None or model._meta.app_label in PRIMARY_APPS:
+            return None
+        return routing.read_alias
+
+    def db_for_write(self, model: type[Model], **hints) -> str:
+        routing = _routing.get()
+        if routing is not None:
+            routing.wrote = True
+            routing.read_alias = None
+        # Also for objects read from the replica, which Django would
+        # otherwise save back to the database they came from
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints) -> bool | None:
+        aliases = {DEFAULT_DB_ALIAS, replica_alias()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+
+class ReplicaMiddleware:
+    """Chooses the database the view reads from and sets the sticky cookie"""
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        routing = RequestRouting()
+        token = _routing.set(routing)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing.reset(token)
+        if routing.wrote:
+            response.set_cookie(
+                STICKY_COOKIE,
+                "1",
+                max_age=settings.REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(
+        self, request: HttpRequest, view_func: Callable, view_args, view_kwargs
+    ) -> None:
+        view = getattr(view_func, "view_class", view_func)
+        if (
+            getattr(view, "replica_reads", False)
+            and request.method in ("GET", "HEAD")
+            and STICKY_COOKIE not in request.COOKIES
+        ):
+            if hasattr(request, "user"):
+                # Loads the lazy request.user, and with it the session, from
+                # the primary before the view's reads move to the replica
+                get_user(request)
+            _routing.get().read_alias = replica_alias()
@@ -0,0 +1,86 @@
+"""
+Cache of filtered list pages: the primary keys and total count of a page.
+
+Every entry is keyed on the generation of its table, a counter kept in the
+cache and bumped by every write to that table. A write therefore retires
+all cached pages of the table at once, without tracking which pages it
+touched; the stale entries simply expire. Results that only part of a
+table affects, like a month of the deadline calendar, are keyed on the
+generation of a named scope instead, bumped only by writes within it.
+"""
+
+import hashlib
+import time
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.db import transaction
+from django.db.models import Model
+
+
+class CachedPage(NamedTuple):
+    count: int
+    pks: list[int]
+
+
+def get_cache() -> BaseCache | None:
+    """The cache holding the results, None when result caching is disabled"""
+
+    alias = settings.TASK_RESULT_CACHE_ALIAS
+    return caches[alias] if alias else None
+
+
+def generation_key(model: type[Model], scope: str = "") -> str:
+    if scope:
+        return f"results:{model._meta.label_lower}:{scope}:generation"
+    return f"results:{model._meta.label_lower}:generation"
+
+
+def generation(model: type[Model], scope: str = "") -> int:
+    """
+    The generation of model's table, or of a part of it named by scope
+    that is invalidated separately from the rest.
+    """
+
+    # Starting from the clock keeps a counter lost to eviction from ever
+    # coming back to a value that older entries are still stored under.
+    return get_cache().get_or_set(generation_key(model, scope), time.time_ns, None)
+
+
+def _increment(model: type[Model], scope: str) -> None:
+    cache = get_cache()
+    try:
+        cache.incr(generation_key(model, scope))
+    except ValueError:
+        cache.add(generation_key(model, scope), time.time_ns(), None)
+
+
+def bump_generation(model: type[Model], scope: str = "") -> None:
+    """Invalidates every cached result of model's table, or of scope"""
+
+    if get_cache() is None:
+        return
+    _increment(model, scope)
+    # A page read between the write and the commit still sees the old rows
+    # and would be cached under the new generation; bump again once they
+    # are visible to everyone.
+    transaction.on_commit(lambda: _increment(model, scope))
+
+
+def page_key(model: type[Model], filters: str, page: str, per_page: int) -> str:
+    """Names a page of model's rows; call it before running the query"""
+
+    digest = hashlib.md5(
+        f"{per_page}:{page}:{filters}".encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"results:{model._meta.label_lower}:{generation(model)}:{digest}"
+
+
+def get_page(key: str) -> CachedPage | None:
+    page = get_cache().get(key)
+    return CachedPage(*page) if page is not None else None
+
+
+def set_page(key: str, page: CachedPage) -> None:
+    get_cache().set(key, tuple(page), settings.TASK_RESULT_CACHE_TIMEOUT)
@@ -0,0 +1,220 @@
+"""
+Daily rollups of task activity for the reports page.
+
+Signals append a TaskEvent whenever a task is created or completed. The
+build_rollups command folds the events of the window since its last run
+into TaskRollup rows, one per local day, project, assignee and priority,
+and records how many tasks are overdue today. Reports read only the
+rollups, so they cost the same however long the task history gets.
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from typing import NamedTuple
+
+from django.db import transaction
+from django.db.models import Count, Q, QuerySet, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from core.models import Project, RollupCursor, Task, TaskEvent, TaskRollup
+from core.stats import TaskState
+
+CURSOR_NAME = "task_events"
+EPOCH = datetime(2000, 1, 1, tzinfo=UTC)
+# Events are rolled up only once they are this old, so that a transaction
+# still open when a window is closed has committed its events by then.
+SETTLE_TIME = timedelta(minutes=5)
+KEY_FIELDS = ("day", "project_id", "assignee_id", "priority")
+
+
+class DayTrend(NamedTuple):
+    day: date
+    created: int
+    completed: int
+    overdue: int
+
+
+class ProjectOverdue(NamedTuple):
+    project: str
+    first: int
+    last: int
+
+    @property
+    def change(self) -> int:
+        return self.last - self.first
+
+
+def record_task_events(task: Task, previous: TaskState | None) -> None:
+    """Logs the creation and completion of task, given its previous state"""
+
+    kinds = []
+    if previous is None:
+        kinds.append(TaskEvent.Kind.CREATED)
+    if task.is_completed and not (previous and previous.is_completed):
+        kinds.append(TaskEvent.Kind.COMPLETED)
+    TaskEvent.objects.bulk_create(
+        TaskEvent(
+            kind=kind,
+            project_id=task.project_id,
+            assignee_id=task.assignee_id,
+            priority=task.priority,
+        )
+        for kind in kinds
+    )
+
+
+def merge_rollups(rows: list[dict], counter: str, replace: bool = False) -> None:
+    """Adds (or, with replace, writes) counter of each row to its rollup"""
+
+    if not rows:
+        return
+    existing = {
+        tuple(getattr(rollup, field) for field in KEY_FIELDS): rollup
+        for rollup in TaskRollup.objects.filter(
+            day__in={row["day"] for row in rows},
+            project_id__in={row["project_id"] for row in rows},
+        )
+    }
+    changed, created = {}, []
+    for row in rows:
+        key = tuple(row[field] for field in KEY_FIELDS)
+        rollup = existing.get(key)
+        if rollup is None:
+            rollup = TaskRollup(**{field: row[field] for field in KEY_FIELDS})
+            existing[key] = rollup
+            created.append(rollup)
+        elif rollup.pk is not None:
+            changed[key] = rollup
+        value = row[counter] if replace else getattr(rollup, counter) + row[counter]
+        setattr(rollup, counter, value)
+    TaskRollup.objects.bulk_update(changed.values(), [counter], batch_size=500)
+    TaskRollup.objects.bulk_create(created, batch_size=500)
+
+
+def roll_up_events(start: datetime, end: datetime) -> int:
+    """Folds the events of [start, end) into the rollups"""
+
+    rows = list(
+        TaskEvent.objects.filter(occurred_at__gte=start, occurred_at__lt=end)
+        .annotate(
+            day=TruncDate("occurred_at", tzinfo=timezone.get_current_timezone())
+        )
+        .values(*KEY_FIELDS)
+        .annotate(
+            created_count=Count("pk", filter=Q(kind=TaskEvent.Kind.CREATED)),
+            completed_count=Count("pk", filter=Q(kind=TaskEvent.Kind.COMPLETED)),
+        )
+        .order_by()
+    )
+    for counter in ("created_count", "completed_count"):
+        merge_rollups([row for row in rows if row[counter]], counter)
+    return sum(row["created_count"] + row["completed_count"] for row in rows)
+
+
+def snapshot_overdue(now: datetime) -> None:
+    """Records how many open tasks are past their deadline today"""
+
+    today = timezone.localdate(now)
+    TaskRollup.objects.filter(day=today).update(overdue_count=0)
+    rows = list(
+        Task.objects.filter(is_completed=False, deadline__lte=now)
+        .values("project_id", "assignee_id", "priority")
+        .annotate(overdue_count=Count("pk"))
+        .order_by()
+    )
+    for row in rows:
+        row["day"] = today
+    merge_rollups(rows, "overdue_count", replace=True)
+
+
+def build_rollups(now: datetime | None = None, rebuild: bool = False) -> int:
+    """
+    Rolls up the events logged since the previous run, up to SETTLE_TIME
+    ago, and refreshes today's overdue counts. With rebuild, the event
+    counts are recomputed from the whole log; past overdue snapshots are
+    kept, as they cannot be recomputed. Returns the number of events
+    rolled up.
+    """
+
+    now = now or timezone.now()
+    with transaction.atomic():
+        cursor, _ = RollupCursor.objects.select_for_update().get_or_create(
+            name=CURSOR_NAME, defaults={"position": EPOCH}
+        )
+        if rebuild:
+            TaskRollup.objects.update(created_count=0, completed_count=0)
+            cursor.position = EPOCH
+        end = max(now - SETTLE_TIME, cursor.position)
+        rolled_up = roll_up_events(cursor.position, end)
+        cursor.position = end
+        cursor.save(update_fields=["position"])
+        snapshot_overdue(now)
+    return rolled_up
+
+
+def report_rollups(
+    start: date, end: date, project: Project | None = None
+) -> QuerySet:
+    rollups = TaskRollup.objects.filter(day__gte=start, day__lt=end)
+    if project is not None:
+        rollups = rollups.filter(project=project)
+    return rollups
+
+
+def daily_trend(
+    start: date, end: date, project: Project | None = None
+) -> list[DayTrend]:
+    """Tasks created, completed and overdue on every day of [start, end)"""
+
+    totals = {
+        row["day"]: row
+        for row in report_rollups(start, end, project)
+        .values("day")
+        .annotate(
+            created=Sum("created_count"),
+            completed=Sum("completed_count"),
+            overdue=Sum("overdue_count"),
+        )
+        .order_by()
+    }
+    trend = []
+    for offset in range((end - start).days):
+        day = start + timedelta(days=offset)
+        row = totals.get(day, {})
+        trend.append(
+            DayTrend(
+                day,
+                row.get("created", 0),
+                row.get("completed", 0),
+                row.get("overdue", 0),
+            )
+        )
+    return trend
+
+
+def overdue_by_project(
+    start: date, end: date, project: Project | None = None
+) -> list[ProjectOverdue]:
+    """Overdue tasks per project on the first and last snapshot of [start, end)"""
+
+    snapshots = (
+        report_rollups(start, end, project)
+        .filter(overdue_count__gt=0)
+        .values("project__name", "day")
+        .annotate(overdue=Sum("overdue_count"))
+        .order_by()
+    )
+    by_project = {}
+    for row in snapshots:
+        by_project.setdefault(row["project__name"], {})[row["day"]] = row["overdue"]
+    days = {day for counts in by_project.values() for day in counts}
+    if not days:
+        return []
+    first, last = min(days), max(days)
+    return sorted(
+        (
+            ProjectOverdue(name, counts.get(first, 0), counts.get(last, 0))
+            for name, counts in by_project.items()
+        ),
+        key=lambda project: (-project.last, project.project),
+    )
@@ -0,0 +1,38 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.events import publish_task_event
+from core.models import Project, ProjectStats, Task
+from core.result_cache import bump_generation
+from core.rollups import record_task_events
+from core.stats import apply_task_change, stored_task_state, task_state
+from core.task_calendar import invalidate_months
+
+
+@receiver(post_save, sender=Project)
+def project_saved(sender, instance: Project, created: bool, **kwargs) -> None:
+    if created:
+        ProjectStats.objects.get_or_create(project=instance)
+
+
+@receiver(pre_save, sender=Task)
+def task_saving(sender, instance: Task, **kwargs) -> None:
+    instance._stats_previous = stored_task_state(instance.pk)
+
+
+@receiver(post_save, sender=Task)
+def task_saved(sender, instance: Task, created: bool, **kwargs) -> None:
+    current = task_state(instance)
+    apply_task_change(instance._stats_previous, current)
+    record_task_events(instance, instance._stats_previous)
+    bump_generation(Task)
+    if instance._stats_previous != current:
+        invalidate_months(instance._stats_previous, current)
+    publish_task_event(instance, "task.created" if created else "task.updated")
+
+
+@receiver(post_delete, sender=Task)
+def task_deleted(sender, instance: Task, **kwargs) -> None:
+    apply_task_change(task_state(instance), None)
+    bump_generation(Task)
+    invalidate_months(task_state(instance))
@@ -0,0 +1,69 @@
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.contrib.staticfiles.finders import BaseFinder
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.storage import FileSystemStorage
+
+# Keeps /*! ... */ license banners
+CSS_COMMENT = re.compile(r"/\*(?!!).*?\*/", re.DOTALL)
+CSS_SPACE_AROUND = re.compile(r"\s*([{};,>])\s*")
+CSS_SPACE_AFTER_COLON = re.compile(r":\s+")
+
+
+def minify_css(css: str) -> str:
+    css = CSS_COMMENT.sub("", css)
+    css = " ".join(css.split())
+    css = CSS_SPACE_AROUND.sub(r"\1", css)
+    css = CSS_SPACE_AFTER_COLON.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+class BundleFinder(BaseFinder):
+    """
+    Exposes the bundles declared in STATIC_BUNDLES as regular static files.
+
+    Each bundle is the concatenation of its sources (CSS is minified on the
+    way), written to STATIC_BUNDLE_ROOT whenever collectstatic or findstatic
+    asks for it, so the manifest storage hashes and compresses it like any
+    other file.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.storage = FileSystemStorage(location=settings.STATIC_BUNDLE_ROOT)
+
+    def find(self, path: str, find_all: bool = False, **kwargs) -> str | list:
+        if path not in settings.STATIC_BUNDLES:
+            return [] if find_all else None
+        built = self.build(path)
+        return [built] if find_all else built
+
+    def list(self, ignore_patterns: list[str]):
+        for path in settings.STATIC_BUNDLES:
+            self.build(path)
+            yield path, self.storage
+
+    def build(self, path: str) -> str:
+        chunks = []
+        for source in settings.STATIC_BUNDLES[path]:
+            source_path = finders.find(source)
+            if source_path is None:
+                raise ImproperlyConfigured(
+                    f"Static bundle {path!r} lists missing file {source!r}."
+                )
+            content = Path(source_path).read_text(encoding="utf-8")
+            if source.endswith(".css") and not source.endswith(".min.css"):
+                content = minify_css(content)
+            chunks.append(content.strip())
+
+        target = Path(self.storage.path(path))
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Pre-minified vendor files and scripts are concatenated as-is.
+        separator = "\n" if path.endswith(".css") else ";\n"
+        content = separator.join(chunks) + "\n"
+        if not target.exists() or target.read_text(encoding="utf-8") != content:
+            target.write_text(content, encoding="utf-8")
+        return str(target)
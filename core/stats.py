@@ -0,0 +1,164 @@
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import NamedTuple
+
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from core.models import Project, ProjectStats, Task
+
+PRIORITY_COUNTERS = {
+    Task.Priority.LOW: "low_priority_count",
+    Task.Priority.MEDIUM: "medium_priority_count",
+    Task.Priority.HIGH: "high_priority_count",
+}
+
+
+class TaskState(NamedTuple):
+    project_id: int
+    is_completed: bool
+    priority: int
+    deadline: datetime
+    # Not counted here, but the calendar caches counts per assignee
+    assignee_id: int | None = None
+
+
+def task_state(task: Task) -> TaskState:
+    return TaskState(
+        task.project_id,
+        task.is_completed,
+        task.priority,
+        task.deadline,
+        task.assignee_id,
+    )
+
+
+def stored_task_state(pk: int | None) -> TaskState | None:
+    """Loads the state of a task as currently stored in the database"""
+
+    if pk is None:
+        return None
+    row = (
+        Task.objects.filter(pk=pk)
+        .values_list(
+            "project_id", "is_completed", "priority", "deadline", "assignee_id"
+        )
+        .first()
+    )
+    return TaskState(*row) if row else None
+
+
+def state_counters(state: TaskState, overdue_as_of: datetime) -> list[str]:
+    if state.is_completed:
+        status = "completed_count"
+    elif state.deadline <= overdue_as_of:
+        status = "overdue_count"
+    else:
+        status = "open_count"
+    counters = [status]
+    if state.priority in PRIORITY_COUNTERS:
+        counters.append(PRIORITY_COUNTERS[state.priority])
+    return counters
+
+
+def apply_task_change(
+    previous: TaskState | None, current: TaskState | None
+) -> None:
+    """Moves a task's contribution from its previous to its current counters"""
+
+    if previous == current or (
+        previous is not None
+        and current is not None
+        and previous._replace(assignee_id=None) == current._replace(assignee_id=None)
+    ):
+        return
+    apply_task_changes([(previous, current)])
+
+
+def apply_task_changes(
+    changes: list[tuple[TaskState | None, TaskState | None]]
+) -> None:
+    """apply_task_change() for many tasks, with one UPDATE per project"""
+
+    project_ids = {
+        state.project_id for change in changes for state in change if state
+    }
+    with transaction.atomic():
+        watermarks = dict(
+            ProjectStats.objects.select_for_update()
+            .filter(project_id__in=project_ids)
+            .values_list("project_id", "overdue_as_of")
+        )
+        deltas = defaultdict(Counter)
+        for previous, current in changes:
+            for state, sign in ((previous, -1), (current, 1)):
+                if state is None or state.project_id not in watermarks:
+                    continue
+                for counter in state_counters(state, watermarks[state.project_id]):
+                    deltas[state.project_id][counter] += sign
+
+        for project_id, delta in deltas.items():
+            updates = {
+                counter: F(counter) + amount
+                for counter, amount in delta.items()
+                if amount
+            }
+            if updates:
+                ProjectStats.objects.filter(project_id=project_id).update(**updates)
+
+
+def sweep_overdue(now: datetime | None = None) -> int:
+    """
+    Moves open tasks whose deadline passed since the last sweep into the
+    overdue bucket. Returns the number of tasks moved.
+    """
+
+    now = now or timezone.now()
+    with transaction.atomic():
+        list(ProjectStats.objects.select_for_update().values_list("pk"))
+        newly_overdue = (
+            Task.objects.filter(
+                is_completed=False,
+                deadline__gt=F("project__stats__overdue_as_of"),
+                deadline__lte=now,
+            )
+            .values("project_id")
+            .annotate(moved=Count("pk"))
+            .order_by()
+        )
+        moved_total = 0
+        for row in newly_overdue:
+            ProjectStats.objects.filter(project_id=row["project_id"]).update(
+                open_count=F("open_count") - row["moved"],
+                overdue_count=F("overdue_count") + row["moved"],
+            )
+            moved_total += row["moved"]
+        ProjectStats.objects.update(overdue_as_of=now)
+    return moved_total
+
+
+def rebuild_project_stats(now: datetime | None = None) -> None:
+    """Recomputes every project's counters from scratch"""
+
+    now = now or timezone.now()
+    aggregates = {
+        "completed_count": Count("tasks", filter=Q(tasks__is_completed=True)),
+        "overdue_count": Count(
+            "tasks",
+            filter=Q(tasks__is_completed=False, tasks__deadline__lte=now),
+        ),
+        "open_count": Count(
+            "tasks",
+            filter=Q(tasks__is_completed=False, tasks__deadline__gt=now),
+        ),
+    }
+    for priority, counter in PRIORITY_COUNTERS.items():
+        aggregates[counter] = Count("tasks", filter=Q(tasks__priority=priority))
+
+    with transaction.atomic():
+        ProjectStats.objects.all().delete()
+        ProjectStats.objects.bulk_create(
+            ProjectStats(project_id=row.pop("id"), overdue_as_of=now, **row)
+            for row in Project.objects.values("id").annotate(**aggregates)
+        )
@@ -0,0 +1,148 @@
+"""
+Deadline calendar: per-day task counts of a month and the tasks of a week.
+
+Both read half-open ranges [start, end) of the deadline index whose bounds
+are local midnights in TIME_ZONE, so a task due exactly at midnight falls
+on the day that starts then, and days are cut in the database with
+TruncDate in the same zone. Month counts are cached per project and month;
+a task write bumps the generations of the months its old and new
+deadlines fall into (core.signals), which retires only those months.
+The counts and generations live in the TASK_RESULT_CACHE_ALIAS cache, which
+has to be shared by the server processes (Redis in prod, see
+core.checks.check_result_cache) for a write to retire a month everywhere.
+"""
+
+from calendar import Calendar
+from datetime import date, datetime, time, timedelta
+from typing import NamedTuple
+
+from django.conf import settings
+from django.db.models import Count, Q, QuerySet
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from core import result_cache
+from core.models import Project, Task, Worker
+from core.stats import TaskState
+
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+
+class DayCount(NamedTuple):
+    total: int
+    done: int
+
+
+def local_midnight(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def month_range(month: date) -> tuple[datetime, datetime]:
+    first = month.replace(day=1)
+    following = (first + timedelta(days=31)).replace(day=1)
+    return local_midnight(first), local_midnight(following)
+
+
+def week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def week_range(day: date) -> tuple[datetime, datetime]:
+    monday = week_start(day)
+    return local_midnight(monday), local_midnight(monday + timedelta(days=7))
+
+
+def month_weeks(month: date) -> list[list[date]]:
+    """The Monday-to-Sunday weeks covering month"""
+
+    return Calendar().monthdatescalendar(month.year, month.month)
+
+
+def deadline_tasks(
+    start: datetime,
+    end: datetime,
+    project: Project | None = None,
+    assignee: Worker | None = None,
+) -> QuerySet:
+    tasks = Task.objects.filter(deadline__gte=start, deadline__lt=end)
+    if project is not None:
+        tasks = tasks.filter(project=project)
+    if assignee is not None:
+        tasks = tasks.filter(assignee=assignee)
+    return tasks
+
+
+def count_days(
+    month: date, project: Project | None, assignee: Worker | None
+) -> dict[date, DayCount]:
+    rows = (
+        deadline_tasks(*month_range(month), project, assignee)
+        .annotate(day=TruncDate("deadline", tzinfo=timezone.get_current_timezone()))
+        .values("day")
+        .annotate(total=Count("pk"), done=Count("pk", filter=Q(is_completed=True)))
+        .order_by("day")
+    )
+    return {row["day"]: DayCount(row["total"], row["done"]) for row in rows}
+
+
+def month_scope(project_id: int | None, month: date) -> str:
+    return f"calendar:{project_id or 'all'}:{month:%Y-%m}"
+
+
+def month_counts(
+    month: date, project: Project | None = None, assignee: Worker | None = None
+) -> dict[date, DayCount]:
+    """Tasks due on each day of month, cached until a task of it changes"""
+
+    cache = result_cache.get_cache()
+    if cache is None:
+        return count_days(month, project, assignee)
+
+    scope = month_scope(project.pk if project else None, month)
+    key = (
+        f"{scope}:{result_cache.generation(Task, 'calendar')}:"
+        f"{result_cache.generation(Task, scope)}:"
+        f"{assignee.pk if assignee else 'all'}"
+    )
+    counts = cache.get(key)
+    if counts is None:
+        counts = count_days(month, project, assignee)
+        cache.set(key, counts, settings.TASK_RESULT_CACHE_TIMEOUT)
+    return counts
+
+
+def week_tasks(
+    day: date, project: Project | None = None, assignee: Worker | None = None
+) -> dict[date, list[Task]]:
+    """The tasks due on each day of the week containing day"""
+
+    monday = week_start(day)
+    days = {monday + timedelta(days=offset): [] for offset in range(7)}
+    tasks = (
+        deadline_tasks(*week_range(day), project, assignee)
+        .select_related("task_type", "project", "assignee")
+        .order_by("deadline", "pk")
+    )
+    for task in tasks:
+        days[timezone.localdate(task.deadline)].append(task)
+    return days
+
+
+def invalidate_months(*states: TaskState | None) -> None:
+    """Retires the cached months the given task states fall into"""
+
+    scopes = set()
+    for state in states:
+        if state is None:
+            continue
+        month = timezone.localdate(state.deadline).replace(day=1)
+        scopes.add(month_scope(state.project_id, month))
+        scopes.add(month_scope(None, month))
+    for scope in scopes:
+        result_cache.bump_generation(Task, scope)
+
+
+def invalidate_all_months() -> None:
+    """For bulk writes that bypass the signals"""
+
+    result_cache.bump_generation(Task, "calendar")
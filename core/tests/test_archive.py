@@ -0,0 +1,127 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from core import archive
+from core.deletion import run_deletion, start_deletion
+from core.models import ArchivedTask, Project, ProjectStats, Task
+from core.stats import rebuild_project_stats
+
+
+class ArchiveTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        cls.tasks = {}
+        for name, is_completed, days in (
+            ("old_done", True, -60),
+            ("old_done_2", True, -45),
+            ("old_open", False, -60),
+            ("recent_done", True, -1),
+            ("upcoming", False, 5),
+        ):
+            task = Task.objects.create(
+                name=name,
+                description="Description for Task",
+                deadline=timezone.now() + timedelta(hours=1),
+                priority=Task.Priority.LOW,
+                project=cls.project,
+                assignee=cls.user,
+                created_by=cls.user,
+                is_completed=is_completed,
+            )
+            Task.objects.filter(pk=task.pk).update(
+                deadline=timezone.now() + timedelta(days=days)
+            )
+            cls.tasks[name] = task
+        rebuild_project_stats()
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def counters(self) -> tuple:
+        return tuple(
+            ProjectStats.objects.filter(project=self.project).values_list(
+                "open_count", "overdue_count", "completed_count", "low_priority_count"
+            )[0]
+        )
+
+    def test_old_completed_tasks_are_moved_in_batches(self):
+        with mock.patch.object(archive, "BATCH_SIZE", 1):
+            with mock.patch.object(
+                archive, "archive_batch", wraps=archive.archive_batch
+            ) as archive_batch:
+                archived = archive.archive_tasks(timezone.now() - timedelta(days=30))
+        self.assertEqual(archived, 2)
+        self.assertEqual(archive_batch.call_count, 3)
+        self.assertEqual(
+            set(ArchivedTask.objects.values_list("pk", "name")),
+            {
+                (self.tasks["old_done"].pk, "old_done"),
+                (self.tasks["old_done_2"].pk, "old_done_2"),
+            },
+        )
+        self.assertEqual(
+            set(Task.objects.values_list("name", flat=True)),
+            {"old_open", "recent_done", "upcoming"},
+        )
+
+    def test_archived_tasks_leave_the_project_counters(self):
+        archive.archive_tasks(timezone.now() - timedelta(days=30))
+        counters = self.counters()
+        rebuild_project_stats()
+        self.assertEqual(counters, self.counters())
+
+    def test_command(self):
+        out = StringIO()
+        call_command("archive_tasks", "--older-than", "0", stdout=out)
+        self.assertIn("Archived 3 task(s).", out.getvalue())
+        with self.assertRaises(CommandError):
+            call_command("archive_tasks", "--older-than", "-1")
+
+    @override_settings(TASK_RESULT_CACHE_ALIAS="default")
+    def test_task_list_reads_the_archive_only_when_asked(self):
+        cache.clear()
+        archive.archive_tasks(timezone.now() - timedelta(days=30))
+        url = reverse("core:task-list")
+        response = self.client.get(url, data={"status": "done"})
+        self.assertEqual(response.context["paginator"].count, 1)
+
+        response = self.client.get(
+            url, data={"status": "done", "include_archived": "yes"}
+        )
+        self.assertEqual(
+            [
+                (task.name, task.archived)
+                for task in response.context["task_list"]
+            ],
+            [("old_done", True), ("old_done_2", True), ("recent_done", False)],
+        )
+        self.assertContains(response, ">Archived<", count=2)
+
+    def test_export_includes_archive_when_asked(self):
+        archive.archive_tasks(timezone.now() - timedelta(days=30))
+        response = self.client.get(
+            reverse("core:task-export"), data={"include_archived": "yes"}
+        )
+        rows = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(rows), 1 + 5)
+
+    def test_deleting_the_project_deletes_its_archive(self):
+        archive.archive_tasks(timezone.now() - timedelta(days=30))
+        with self.captureOnCommitCallbacks():
+            deletion = start_deletion(self.project)
+        run_deletion(deletion.pk)
+        self.assertFalse(ArchivedTask.objects.exists())
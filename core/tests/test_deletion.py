@@ -0,0 +1,199 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from core import deletion
+from core.forms.create_update_forms import TaskForm
+from core.forms.search_forms import (
+    CalendarSearchForm,
+    ReportSearchForm,
+    TaskSearchForm,
+    WorkerSearchForm,
+)
+from core.models import Deletion, Project, Task, TaskEvent
+
+
+class DeletionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser(
+            username="admin_user", password="ytrewq123"
+        )
+        cls.worker = get_user_model().objects.create_user(
+            username="worker", password="ytrewq123"
+        )
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        cls.other_project = Project.objects.create(
+            name="OtherProject", description="Description for project"
+        )
+        for project in (cls.project, cls.project, cls.project, cls.other_project):
+            Task.objects.create(
+                name="TaskName",
+                description="Description for Task",
+                deadline=timezone.now() + timedelta(hours=1),
+                priority=Task.Priority.LOW,
+                project=project,
+                assignee=cls.worker,
+                created_by=cls.worker,
+            )
+
+    def test_project_is_deleted_in_batches(self):
+        with self.captureOnCommitCallbacks():
+            job = deletion.start_deletion(self.project)
+        # Three tasks and their three creation events
+        self.assertEqual(job.total, 6)
+        with mock.patch.object(deletion, "BATCH_SIZE", 2):
+            with CaptureQueriesContext(connection) as queries:
+                self.assertTrue(deletion.run_deletion(job.pk))
+        task_deletes = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('DELETE FROM "core_task" ')
+        ]
+        self.assertEqual(len(task_deletes), 2)
+        job.refresh_from_db()
+        self.assertEqual((job.done, job.progress), (6, 100))
+        self.assertIsNotNone(job.finished_at)
+        self.assertFalse(Project.objects.filter(pk=self.project.pk).exists())
+        self.assertEqual(Task.objects.count(), 1)
+        self.assertEqual(TaskEvent.objects.count(), 1)
+
+    def test_worker_tasks_are_detached_not_deleted(self):
+        with self.captureOnCommitCallbacks():
+            job = deletion.start_deletion(self.worker)
+        deletion.run_deletion(job.pk)
+        self.assertFalse(
+            get_user_model().objects.filter(pk=self.worker.pk).exists()
+        )
+        self.assertEqual(
+            Task.objects.filter(assignee=None, created_by=None).count(), 4
+        )
+
+    def test_deleting_objects_are_hidden_from_lists_and_choices(self):
+        with self.captureOnCommitCallbacks():
+            deletion.start_deletion(self.project)
+            deletion.start_deletion(self.worker)
+        self.client.force_login(self.admin)
+        response = self.client.get(reverse("core:project-list"))
+        self.assertEqual(list(response.context["project_list"]), [self.other_project])
+        response = self.client.get(reverse("core:worker-list"))
+        self.assertEqual(list(response.context["worker_list"]), [self.admin])
+        form = TaskForm()
+        self.assertNotIn(self.project, form.fields["project"].queryset)
+        self.assertNotIn(self.worker, form.fields["assignee"].queryset)
+        response = self.client.get(
+            reverse("core:project-board", args=(self.project.pk,))
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_deleting_objects_are_hidden_from_api_index_and_filters(self):
+        with self.captureOnCommitCallbacks():
+            deletion.start_deletion(self.project)
+            deletion.start_deletion(self.worker)
+        self.client.force_login(self.admin)
+
+        response = self.client.get(reverse("core:api-project-list"))
+        self.assertEqual(
+            [item["id"] for item in response.json()["data"]], [self.other_project.pk]
+        )
+        response = self.client.get(
+            reverse("core:api-project-detail", args=(self.project.pk,))
+        )
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(reverse("core:api-worker-list"))
+        self.assertEqual(
+            [item["username"] for item in response.json()["data"]], ["admin_user"]
+        )
+        response = self.client.get(
+            reverse("core:api-task-list"), data={"include": "assignee,project"}
+        )
+        self.assertEqual(response.json()["included"]["workers"], [])
+        self.assertEqual(
+            [item["id"] for item in response.json()["included"]["projects"]],
+            [self.other_project.pk],
+        )
+
+        response = self.client.get(reverse("core:index"))
+        self.assertEqual(response.context["num_projects"], 1)
+        self.assertEqual(response.context["num_workers"], 1)
+        self.assertEqual(response.context["num_tasks"], 1)
+
+        for form_class in (
+            TaskSearchForm,
+            WorkerSearchForm,
+            CalendarSearchForm,
+            ReportSearchForm,
+        ):
+            with self.subTest(form=form_class.__name__):
+                fields = form_class().fields
+                self.assertNotIn(self.project, fields["project"].queryset)
+                if "assignee" in fields:
+                    self.assertNotIn(self.worker, fields["assignee"].queryset)
+
+    def test_api_deletes_in_background(self):
+        url = reverse("core:api-project-detail", args=(self.project.pk,))
+        self.client.force_login(self.worker)
+        self.assertEqual(self.client.delete(url).status_code, 403)
+
+        self.client.force_login(self.admin)
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.delete(url)
+        self.assertEqual(response.status_code, 202)
+        job = Deletion.objects.get(object_id=self.project.pk)
+        progress = reverse("core:deletion-detail", args=(job.pk,))
+        self.assertEqual(response["Location"], progress)
+        self.assertEqual(response.json(), {"data": {"deletion": progress}})
+        self.assertEqual(len(callbacks), 1)
+        self.assertTrue(Project.objects.get(pk=self.project.pk).is_deleting)
+        self.assertEqual(Task.objects.filter(project=self.project).count(), 3)
+
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, 409)
+
+        response = self.client.delete(
+            reverse("core:api-worker-detail", args=(self.worker.pk,))
+        )
+        self.assertEqual(response.status_code, 202)
+        self.assertTrue(get_user_model().objects.get(pk=self.worker.pk).is_deleting)
+
+    def test_starting_twice_reuses_the_job(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            first = deletion.start_deletion(self.project)
+            second = deletion.start_deletion(self.project)
+        self.assertEqual(first, second)
+        self.assertEqual(len(callbacks), 1)
+
+    def test_job_held_by_a_live_runner_is_not_taken_over(self):
+        with self.captureOnCommitCallbacks():
+            job = deletion.start_deletion(self.project)
+        Deletion.objects.filter(pk=job.pk).update(heartbeat=timezone.now())
+        self.assertFalse(deletion.run_deletion(job.pk))
+
+        Deletion.objects.filter(pk=job.pk).update(
+            heartbeat=timezone.now() - deletion.STALE_AFTER - timedelta(seconds=1)
+        )
+        out = StringIO()
+        call_command("process_deletions", stdout=out)
+        self.assertIn("Finished 1 deletion(s).", out.getvalue())
+        self.assertFalse(Project.objects.filter(pk=self.project.pk).exists())
+
+    def test_progress_page(self):
+        with self.captureOnCommitCallbacks():
+            job = deletion.start_deletion(self.project)
+        url = reverse("core:deletion-detail", args=(job.pk,))
+        self.client.force_login(self.worker)
+        self.assertEqual(self.client.get(url).status_code, 403)
+        self.client.force_login(self.admin)
+        response = self.client.get(url)
+        self.assertContains(response, "0 of 6 related records processed.")
+        self.assertContains(response, 'http-equiv="refresh"')
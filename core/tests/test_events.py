@@ -0,0 +1,120 @@
+import asyncio
+import os
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from datetime import timedelta
+
+from core.events import BaseBroker, LocalBroker, RedisBroker, get_broker
+from core.models import Project, Task
+
+
+class RecordingBroker(BaseBroker):
+    published = []
+
+    def publish(self, channel: str, event: dict) -> None:
+        self.published.append((channel, event))
+
+
+class LocalBrokerTests(TestCase):
+    def test_publish_reaches_channel_subscribers_only(self):
+        async def scenario():
+            broker = LocalBroker()
+            listener = broker.subscribe("project:1")
+            other = broker.subscribe("project:2")
+            broker.publish("project:1", {"type": "task.created"})
+            event = await listener.get(timeout=1)
+            missed = await other.get(timeout=0.01)
+            listener.close()
+            other.close()
+            return event, missed, broker._subscriptions
+
+        event, missed, subscriptions = asyncio.run(scenario())
+        self.assertEqual(event, {"type": "task.created", "id": 1})
+        self.assertIsNone(missed)
+        self.assertEqual(subscriptions, {})
+
+    def test_slow_listener_keeps_latest_events(self):
+        async def scenario():
+            broker = LocalBroker()
+            broker.max_queued = 2
+            listener = broker.subscribe("project:1")
+            for i in range(3):
+                broker.publish("project:1", {"type": "task.updated", "n": i})
+            await asyncio.sleep(0)
+            return [(await listener.get(timeout=1))["n"] for _ in range(2)]
+
+        self.assertEqual(asyncio.run(scenario()), [1, 2])
+
+
+@skipUnless(os.environ.get("REDIS_URL"), "needs a Redis server at REDIS_URL")
+class RedisBrokerTests(TestCase):
+    def test_publish_reaches_channel_subscribers_only(self):
+        async def scenario():
+            broker = RedisBroker()
+            listener = broker.subscribe("test:project:1")
+            other = broker.subscribe("test:project:2")
+            # Subscribes, so the event below is not published before it
+            await listener.get(timeout=0.1)
+            await other.get(timeout=0.1)
+            broker.publish("test:project:1", {"type": "task.created"})
+            event = await listener.get(timeout=1)
+            missed = await other.get(timeout=0.1)
+            listener.close()
+            other.close()
+            await asyncio.sleep(0.1)
+            return event, missed
+
+        with override_settings(TASK_EVENTS_REDIS_URL=os.environ["REDIS_URL"]):
+            event, missed = asyncio.run(scenario())
+        self.assertEqual(event["type"], "task.created")
+        self.assertIsInstance(event["id"], int)
+        self.assertIsNone(missed)
+
+
+@override_settings(TASK_EVENTS_BROKER="core.tests.test_events.RecordingBroker")
+class TaskEventPublishingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123", project=cls.project
+        )
+
+    def setUp(self):
+        get_broker.cache_clear()
+        self.addCleanup(get_broker.cache_clear)
+        RecordingBroker.published = []
+
+    def create_task(self) -> Task:
+        return Task.objects.create(
+            name="TaskName",
+            description="Description for Task",
+            deadline=timezone.now() + timedelta(hours=1),
+            priority=Task.Priority.LOW,
+            project=self.project,
+            assignee=self.user,
+        )
+
+    def test_events_are_published_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task = self.create_task()
+            self.assertEqual(RecordingBroker.published, [])
+        channel, event = RecordingBroker.published[0]
+        self.assertEqual(channel, f"project:{self.project.id}")
+        self.assertEqual(event["type"], "task.created")
+        self.assertEqual(event["task"]["id"], task.id)
+
+    def test_mark_completed_publishes_completed_event(self):
+        task = self.create_task()
+        self.client.login(username="user", password="ytrewq123")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse("core:task-mark-completed", args=(task.id,)))
+        channel, event = RecordingBroker.published[-1]
+        self.assertEqual(event["type"], "task.completed")
+        self.assertTrue(event["task"]["is_completed"])
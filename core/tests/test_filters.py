@@ -0,0 +1,141 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from core.filters import ProjectFilterSet, TaskFilterSet, WorkerFilterSet
+from core.models import Project, Task
+from core.views.project_views import ProjectListView
+from core.views.task_views import TaskListView
+from core.views.worker_views import WorkerListView
+
+
+class TaskFilterSetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+        cls.other_user = get_user_model().objects.create_user(
+            username="other_user", password="ytrewq123"
+        )
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        for name, assignee in (("Mine", cls.user), ("Theirs", cls.other_user)):
+            Task.objects.create(
+                name=name,
+                description="Description for Task",
+                deadline=timezone.now() + timedelta(hours=1),
+                priority=Task.Priority.LOW,
+                project=cls.project,
+                assignee=assignee,
+            )
+
+    def test_filters_in_one_query(self):
+        filterset = TaskFilterSet(
+            {"assigned_to_me": "yes", "status": "not_done"}, user=self.user
+        )
+        with self.assertNumQueries(1):
+            names = list(
+                filterset.filter(Task.objects.all()).values_list("name", flat=True)
+            )
+        self.assertEqual(names, ["Mine"])
+
+    def test_indexed_predicates_run_before_pattern_matches(self):
+        filterset = TaskFilterSet(
+            {"name": "Mine", "status": "not_done", "project": self.project.pk},
+            user=self.user,
+        )
+        sql = str(filterset.filter(Task.objects.all()).query)
+        where = sql[sql.index("WHERE"):]
+        self.assertLess(where.index("project_id"), where.index("is_completed"))
+        self.assertLess(where.index("is_completed"), where.index("LIKE"))
+
+    def test_canonical_key_ignores_order_defaults_and_other_params(self):
+        first = TaskFilterSet(
+            {"status": "not_done", "project": str(self.project.pk), "page": "2"},
+            user=self.user,
+        )
+        second = TaskFilterSet(
+            {"name": "", "project": str(self.project.pk), "status": "not_done"},
+            user=self.other_user,
+        )
+        self.assertEqual(first.canonical_key(), second.canonical_key())
+        self.assertEqual(
+            first.canonical_key(), f"project={self.project.pk}&status=not_done"
+        )
+
+    def test_canonical_key_includes_non_default_sort(self):
+        self.assertEqual(TaskFilterSet({"sort": ""}).canonical_key(), "")
+        self.assertEqual(
+            TaskFilterSet({"sort": "priority"}).canonical_key(), "sort=priority"
+        )
+
+    def test_canonical_key_includes_user_for_personal_filters(self):
+        mine = TaskFilterSet({"assigned_to_me": "yes"}, user=self.user)
+        theirs = TaskFilterSet({"assigned_to_me": "yes"}, user=self.other_user)
+        self.assertNotEqual(mine.canonical_key(), theirs.canonical_key())
+        self.assertIn(f"user={self.user.pk}", mine.canonical_key())
+
+    def test_overdue_depends_on_time(self):
+        self.assertTrue(TaskFilterSet({"status": "overdue"}).depends_on_time())
+        self.assertFalse(TaskFilterSet({"status": "done"}).depends_on_time())
+
+    def test_invalid_data_has_no_active_filters(self):
+        filterset = TaskFilterSet({"status": "unknown"}, user=self.user)
+        self.assertFalse(filterset.is_valid())
+        self.assertEqual(filterset.active(), [])
+
+
+class WorkerFilterSetTests(TestCase):
+    def test_username_is_matched_case_insensitively(self):
+        get_user_model().objects.create_user(username="JohnDoe", password="ytrewq123")
+        filterset = WorkerFilterSet({"username": "johnd"})
+        self.assertEqual(
+            list(filterset.filter(get_user_model().objects.all())),
+            list(get_user_model().objects.filter(username="JohnDoe")),
+        )
+
+
+class SortTests(TestCase):
+    list_views = {
+        TaskFilterSet: TaskListView,
+        WorkerFilterSet: WorkerListView,
+        ProjectFilterSet: ProjectListView,
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+
+    def test_form_offers_exactly_the_whitelisted_sorts(self):
+        for filterset_class in self.list_views:
+            with self.subTest(filterset_class.__name__):
+                choices = filterset_class.form_class.base_fields["sort"].choices
+                self.assertEqual(
+                    [value for value, _ in choices], list(filterset_class.orderings)
+                )
+
+    def test_unknown_sort_falls_back_to_default_ordering(self):
+        filterset = WorkerFilterSet({"sort": "password"})
+        self.assertFalse(filterset.is_valid())
+        self.assertEqual(
+            filterset.order(get_user_model().objects.all()).query.order_by,
+            ("username",),
+        )
+
+    def test_every_sort_is_read_from_an_index(self):
+        for filterset_class, view_class in self.list_views.items():
+            for sort in filterset_class.orderings:
+                with self.subTest(view=view_class.__name__, sort=sort):
+                    request = RequestFactory().get("/", data={"sort": sort})
+                    request.user = self.user
+                    view = view_class()
+                    view.setup(request)
+                    plan = view.get_queryset().explain()
+                    self.assertNotIn("TEMP B-TREE", plan)
+                    self.assertNotRegex(plan, r"(?m)SCAN core_\w+$")
@@ -3,7 +3,7 @@ from django.utils import timezone
 from datetime import timedelta
 
 from core.forms.user_forms import MyProfileForm, SignUpForm
-from core.models import Position, Project, Worker, TaskType
+from core.models import Position, Project, Task, Worker, TaskType
 from core.forms.create_update_forms import (
     TaskForm,
     WorkerUpdateForm,
@@ -87,7 +87,7 @@ class TaskFormTest(CreateUpdateFormSetup):
             "name": "Fix issue",
             "description": "Fix a major bug",
             "deadline": timezone.now() + timedelta(hours=1),
-            "priority": "HIGH",
+            "priority": Task.Priority.HIGH,
             "is_completed": False,
             "task_type": self.task_type,
             "project": self.project,
@@ -101,7 +101,7 @@ class TaskFormTest(CreateUpdateFormSetup):
             "name": "Task without project",
             "description": "Description for task",
             "deadline": timezone.now() + timedelta(hours=1),
-            "priority": "MEDIUM",
+            "priority": Task.Priority.MEDIUM,
             "is_completed": False,
             "task_type": self.task_type,
             "assignee": self.worker,
@@ -0,0 +1,69 @@
+import os
+import runpy
+from unittest import mock
+
+from django.conf import settings
+from django.test import RequestFactory, SimpleTestCase
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
+CONFIG_PATH = str(settings.BASE_DIR / "gunicorn.conf.py")
+
+
+def load_config(**env) -> dict:
+    with mock.patch.dict(os.environ, env), mock.patch(
+        "multiprocessing.cpu_count", return_value=4
+    ):
+        return runpy.run_path(CONFIG_PATH)
+
+
+class GunicornConfigTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name in ("GUNICORN_PRESET", "WEB_CONCURRENCY", "GUNICORN_THREADS"):
+            os.environ.pop(name, None)
+
+    def test_gthread_is_the_default_preset(self):
+        config = load_config()
+        self.assertEqual(config["worker_class"], "gthread")
+        self.assertEqual(config["workers"], 5)
+        self.assertEqual(config["threads"], 4)
+        self.assertTrue(config["preload_app"])
+
+    def test_sync_preset_uses_two_workers_per_cpu(self):
+        config = load_config(GUNICORN_PRESET="sync")
+        self.assertEqual(config["workers"], 9)
+        self.assertEqual(config["wsgi_app"], "task_manager.wsgi:application")
+
+    def test_uvicorn_preset_serves_the_asgi_app(self):
+        config = load_config(GUNICORN_PRESET="uvicorn")
+        self.assertEqual(config["worker_class"], "uvicorn.workers.UvicornWorker")
+        self.assertEqual(config["wsgi_app"], "task_manager.asgi:application")
+
+    def test_wsgi_presets_do_not_stream_task_events(self):
+        environ = RequestFactory().get(reverse("core:task-events")).environ
+        for preset in ("gthread", "sync"):
+            with self.subTest(preset=preset):
+                app = import_string(
+                    load_config(GUNICORN_PRESET=preset)["wsgi_app"].replace(":", ".")
+                )
+                statuses = []
+                response = app(environ, lambda status, headers: statuses.append(status))
+                response.close()
+                self.assertEqual(statuses, ["204 No Content"])
+
+    def test_environment_overrides_counts(self):
+        config = load_config(WEB_CONCURRENCY="2", GUNICORN_THREADS="8", PORT="9000")
+        self.assertEqual((config["workers"], config["threads"]), (2, 8))
+        self.assertEqual(config["bind"], "0.0.0.0:9000")
+
+    def test_max_requests_are_jittered(self):
+        config = load_config(GUNICORN_MAX_REQUESTS="500")
+        self.assertEqual(config["max_requests"], 500)
+        self.assertEqual(config["max_requests_jitter"], 50)
+
+    def test_unknown_preset_is_rejected(self):
+        with self.assertRaisesMessage(RuntimeError, "Unknown GUNICORN_PRESET"):
+            load_config(GUNICORN_PRESET="eventlet")
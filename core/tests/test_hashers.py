@@ -0,0 +1,23 @@
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    check_password,
+    identify_hasher,
+    make_password,
+)
+from django.test import SimpleTestCase, override_settings
+
+from core.hashers import TunedArgon2PasswordHasher
+
+
+@override_settings(PASSWORD_HASHERS=["core.hashers.TunedArgon2PasswordHasher"])
+class TunedArgon2PasswordHasherTests(SimpleTestCase):
+    def test_hashes_with_owasp_parameters(self):
+        encoded = make_password("ytrewq123")
+        self.assertIn("$m=19456,t=2,p=1$", encoded)
+        self.assertTrue(check_password("ytrewq123", encoded))
+
+    def test_upgrades_hashes_made_with_django_defaults(self):
+        encoded = Argon2PasswordHasher().encode("ytrewq123", "saltsaltsalt")
+        hasher = identify_hasher(encoded)
+        self.assertIsInstance(hasher, TunedArgon2PasswordHasher)
+        self.assertTrue(hasher.must_update(encoded))
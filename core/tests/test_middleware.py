@@ -0,0 +1,62 @@
+import gzip
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls.resolvers import URLResolver
+
+CSS = b".card{color:#7dbfff}" * 50
+
+
+class StaticFilesMiddlewareTests(TestCase):
+    def setUp(self):
+        static_root = tempfile.TemporaryDirectory()
+        self.addCleanup(static_root.cleanup)
+        root = Path(static_root.name)
+        (root / "css").mkdir()
+        (root / "css" / "app.css").write_bytes(CSS)
+        (root / "css" / "app.css.gz").write_bytes(gzip.compress(CSS))
+        (root / "docs").mkdir()
+        (root / "docs" / "index.html").write_text("<h1>Docs</h1>")
+
+        # The middleware indexes STATIC_ROOT when the test client first loads it
+        override = override_settings(STATIC_ROOT=root)
+        override.enable()
+        self.addCleanup(override.disable)
+        patcher = mock.patch.object(
+            URLResolver, "resolve", side_effect=AssertionError("URLconf reached")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_serves_file_without_touching_views(self):
+        with self.assertNumQueries(0):
+            response = self.client.get("/static/css/app.css")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), CSS)
+        self.assertNotIn("Cookie", response.get("Vary", ""))
+
+    def test_serves_precompressed_variant(self):
+        response = self.client.get(
+            "/static/css/app.css", HTTP_ACCEPT_ENCODING="gzip, deflate"
+        )
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(
+            gzip.decompress(b"".join(response.streaming_content)), CSS
+        )
+
+    def test_serves_directory_index(self):
+        response = self.client.get("/static/docs/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"<h1>Docs</h1>")
+
+    def test_missing_static_file_stops_before_url_resolution(self):
+        with self.assertNumQueries(0):
+            response = self.client.get("/static/css/missing.css")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.content, b"")
+
+    def test_non_static_paths_reach_the_urlconf(self):
+        with self.assertRaisesMessage(AssertionError, "URLconf reached"):
+            self.client.get("/tasks/")
@@ -0,0 +1,15 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+
+class MigrationsTests(TestCase):
+    # makemigrations checks the migration history of every database
+    databases = {"default", "replica"}
+
+    @override_settings(MIGRATION_MODULES={})
+    def test_models_have_no_unmigrated_changes(self):
+        out = StringIO()
+        call_command("makemigrations", check=True, dry_run=True, stdout=out)
+        self.assertIn("No changes detected", out.getvalue())
@@ -105,7 +105,7 @@ class TaskModelTests(TestCase):
             name="TestTask",
             description="Description for TestTask",
             deadline=timezone.now() + timedelta(minutes=45),
-            priority="LOW",
+            priority=Task.Priority.LOW,
             is_completed=False,
             project=cls.project,
         )
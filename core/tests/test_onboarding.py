@@ -0,0 +1,106 @@
+import csv
+import tempfile
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from core.models import Position, Project
+from core.onboarding import hash_passwords, onboard_workers
+
+
+def onboarding_row(username: str, **fields) -> dict:
+    return {
+        "username": username,
+        "password": "Onboard-2024!",
+        "email": f"{username}@example.com",
+        "first_name": "John",
+        "last_name": "Doe",
+        "position": "Developer",
+        "project": "ProjectName",
+        **fields,
+    }
+
+
+class OnboardWorkersTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="Developer")
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+
+    def test_hash_passwords_in_process_pool(self):
+        hashes = hash_passwords(["first-secret", "second-secret"], processes=2)
+        self.assertEqual(len(hashes), 2)
+        worker = get_user_model()(password=hashes[1])
+        self.assertTrue(worker.check_password("second-secret"))
+
+    def test_creates_workers_with_usable_passwords(self):
+        onboard_workers(
+            [onboarding_row("first"), onboarding_row("second")], processes=2
+        )
+        worker = get_user_model().objects.get(username="second")
+        self.assertEqual(worker.position, self.position)
+        self.assertEqual(worker.project, self.project)
+        self.assertTrue(worker.check_password("Onboard-2024!"))
+
+    def test_invalid_rows_create_nothing(self):
+        get_user_model().objects.create_user(username="taken", password="ytrewq123")
+        rows = [
+            onboarding_row("fine"),
+            onboarding_row("taken"),
+            onboarding_row("weak", password="123"),
+            onboarding_row("lost", position="Astronaut"),
+        ]
+        with self.assertRaises(ValidationError) as context:
+            onboard_workers(rows, processes=1)
+        self.assertEqual(
+            sorted(context.exception.message_dict), ["row 2", "row 3", "row 4"]
+        )
+        self.assertFalse(get_user_model().objects.filter(username="fine").exists())
+
+    def test_missing_columns_are_reported_before_any_row(self):
+        row = onboarding_row("no_password")
+        del row["password"], row["project"]
+        with self.assertRaises(ValidationError) as context:
+            onboard_workers([row], processes=1)
+        self.assertEqual(
+            context.exception.message_dict,
+            {"header": ["Missing column(s): password, project."]},
+        )
+
+    def test_command_reports_missing_columns(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=["username", "email"])
+            writer.writeheader()
+            writer.writerow({"username": "bad", "email": "bad@example.com"})
+            csv_file.flush()
+            with self.assertRaisesMessage(
+                CommandError,
+                "header: Missing column(s): password, first_name, last_name, "
+                "position, project.",
+            ):
+                call_command("onboard_workers", csv_file.name, processes=1)
+
+    def test_command_reads_csv(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=onboarding_row("x"))
+            writer.writeheader()
+            writer.writerow(onboarding_row("from_csv"))
+            csv_file.flush()
+            out = StringIO()
+            call_command("onboard_workers", csv_file.name, processes=1, stdout=out)
+        self.assertIn("Created 1 worker(s)", out.getvalue())
+        self.assertTrue(get_user_model().objects.filter(username="from_csv").exists())
+
+    def test_command_reports_invalid_rows(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=onboarding_row("x"))
+            writer.writeheader()
+            writer.writerow(onboarding_row("bad", email="not-an-email"))
+            csv_file.flush()
+            with self.assertRaisesMessage(CommandError, "row 1"):
+                call_command("onboard_workers", csv_file.name, processes=1)
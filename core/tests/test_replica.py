@@ -0,0 +1,115 @@
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from core.models import Project, Worker
+from core.replica import (
+    STICKY_COOKIE,
+    ReplicaMiddleware,
+    ReplicaRouter,
+    replica_reads,
+)
+
+
+@override_settings(REPLICA_DATABASE_ALIAS="replica")
+class ReplicaRoutingTests(TestCase):
+    """
+    The replica is a second database that never receives the writes made
+    through the site, like a replica far behind its primary
+    """
+
+    databases = {"default", "replica"}
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = Worker.objects.create_superuser(
+            username="admin", password="ytrewq123"
+        )
+        Worker.objects.using("replica").bulk_create(
+            [
+                Worker(
+                    pk=cls.user.pk,
+                    username=cls.user.username,
+                    password=cls.user.password,
+                    is_staff=True,
+                    is_superuser=True,
+                )
+            ]
+        )
+        Project.objects.create(name="On primary", description="Description")
+        Project.objects.using("replica").bulk_create(
+            [Project(name="On replica", description="Description")]
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def project_names(self) -> list[str]:
+        response = self.client.get(reverse("core:project-list"))
+        return [project.name for project in response.context["project_list"]]
+
+    def test_list_pages_read_from_replica(self):
+        self.assertEqual(self.project_names(), ["On replica"])
+        response = self.client.get(reverse("core:index"))
+        self.assertEqual(response.context["num_workers"], 1)
+
+    def test_other_pages_read_from_primary(self):
+        project = Project.objects.get(name="On primary")
+        response = self.client.get(reverse("core:project-board", args=(project.pk,)))
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(REPLICA_DATABASE_ALIAS=None)
+    def test_without_replica_everything_reads_from_primary(self):
+        self.assertEqual(self.project_names(), ["On primary"])
+
+    def test_write_keeps_the_browser_on_primary(self):
+        response = self.client.post(
+            reverse("core:project-create"),
+            {"name": "New project", "description": "Description"},
+        )
+        cookie = response.cookies[STICKY_COOKIE]
+        self.assertEqual(cookie["max-age"], 10)
+        self.assertTrue(cookie["httponly"])
+        self.assertEqual(self.project_names(), ["New project", "On primary"])
+
+        self.client.cookies.pop(STICKY_COOKIE)
+        self.assertEqual(self.project_names(), ["On replica"])
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.db")
+    def test_login_is_read_from_primary_with_an_empty_replica(self):
+        Worker.objects.using("replica").all().delete()
+        self.client.logout()
+        self.assertTrue(self.client.login(username="admin", password="ytrewq123"))
+        response = self.client.get(reverse("core:project-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.wsgi_request.user, self.user)
+        self.assertEqual(
+            [project.name for project in response.context["project_list"]],
+            ["On replica"],
+        )
+
+    def test_reads_after_a_write_in_the_same_request_use_primary(self):
+        router = ReplicaRouter()
+        aliases = []
+
+        @replica_reads
+        def view(request):
+            return HttpResponse()
+
+        def get_response(request):
+            middleware.process_view(request, view, (), {})
+            aliases.append(router.db_for_read(Project))
+            aliases.append(router.db_for_write(Project))
+            aliases.append(router.db_for_read(Project))
+            return HttpResponse()
+
+        middleware = ReplicaMiddleware(get_response)
+        response = middleware(RequestFactory().get("/"))
+        self.assertEqual(aliases, ["replica", "default", None])
+        self.assertIn(STICKY_COOKIE, response.cookies)
+
+    def test_objects_read_from_replica_are_saved_to_primary(self):
+        project = Project.objects.using("replica").get()
+        self.assertEqual(
+            ReplicaRouter().db_for_write(Project, instance=project), "default"
+        )
@@ -0,0 +1,138 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.checks import run_checks
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from core import result_cache
+from core.models import Project, Task
+
+
+@override_settings(TASK_RESULT_CACHE_ALIAS="default")
+class ResultCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        cls.tasks = [
+            Task.objects.create(
+                name=f"TaskName{i}",
+                description="Description for Task",
+                deadline=timezone.now() + timedelta(hours=i + 1),
+                priority=Task.Priority.LOW,
+                project=cls.project,
+                assignee=cls.user,
+            )
+            for i in range(6)
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user)
+
+    def task_names(self, query: str = "") -> list[str]:
+        response = self.client.get(reverse("core:task-list") + query)
+        return [task.name for task in response.context["task_list"]]
+
+    def test_hit_fetches_page_by_primary_key_only(self):
+        url = reverse("core:task-list") + "?assigned_to_me=yes&status=not_done"
+        first = self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(url)
+        task_queries = [q["sql"] for q in queries if '"core_task"' in q["sql"]]
+        self.assertEqual(len(task_queries), 1)
+        self.assertIn(".\"id\" IN (", task_queries[0])
+        self.assertEqual(
+            list(first.context["task_list"]), list(second.context["task_list"])
+        )
+        self.assertEqual(second.context["paginator"].count, 6)
+        self.assertEqual(second.context["page_obj"].number, 1)
+
+    def test_last_page_is_served_from_cache(self):
+        self.task_names("?page=last")
+        with CaptureQueriesContext(connection) as queries:
+            names = self.task_names("?page=last")
+        self.assertEqual(names, ["TaskName4", "TaskName5"])
+        self.assertFalse(any("COUNT(" in query["sql"] for query in queries))
+
+    def test_saving_a_task_invalidates_cached_pages(self):
+        self.assertEqual(len(self.task_names("?page=last")), 2)
+        Task.objects.create(
+            name="Latest",
+            description="Description for Task",
+            deadline=timezone.now() + timedelta(days=1),
+            priority=Task.Priority.LOW,
+            project=self.project,
+        )
+        self.assertIn("Latest", self.task_names("?page=last"))
+
+    def test_mark_completed_invalidates_cached_pages(self):
+        self.assertIn("TaskName0", self.task_names("?status=not_done"))
+        self.client.post(
+            reverse("core:task-mark-completed", args=(self.tasks[0].pk,))
+        )
+        self.assertNotIn("TaskName0", self.task_names("?status=not_done"))
+
+    def test_deleting_a_task_invalidates_cached_pages(self):
+        self.assertIn("TaskName0", self.task_names())
+        self.tasks[0].delete()
+        self.assertNotIn("TaskName0", self.task_names())
+
+    def test_time_dependent_filters_are_not_cached(self):
+        with mock.patch.object(result_cache, "set_page") as set_page:
+            self.task_names("?status=overdue")
+        set_page.assert_not_called()
+
+    def test_write_in_transaction_bumps_again_on_commit(self):
+        before = result_cache.generation(Task)
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                result_cache.bump_generation(Task)
+                self.assertEqual(result_cache.generation(Task), before + 1)
+        self.assertEqual(result_cache.generation(Task), before + 2)
+
+    def test_lost_generation_restarts_above_previous_values(self):
+        before = result_cache.generation(Task)
+        cache.delete(result_cache.generation_key(Task))
+        self.assertGreater(result_cache.generation(Task), before)
+
+
+class ResultCacheCheckTests(TestCase):
+    @override_settings(SERVER_PROCESSES=3, TASK_RESULT_CACHE_ALIAS="default")
+    def test_process_local_cache_with_several_processes_fails(self):
+        errors = [message.id for message in run_checks()]
+        self.assertIn("core.E002", errors)
+
+    @override_settings(SERVER_PROCESSES=1, TASK_RESULT_CACHE_ALIAS="default")
+    def test_process_local_cache_with_one_process_passes(self):
+        errors = [message.id for message in run_checks()]
+        self.assertNotIn("core.E002", errors)
+
+    @override_settings(
+        SERVER_PROCESSES=3,
+        TASK_RESULT_CACHE_ALIAS="default",
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://localhost:6379/0",
+            }
+        },
+    )
+    def test_shared_cache_passes(self):
+        errors = [message.id for message in run_checks()]
+        self.assertNotIn("core.E002", errors)
+
+    @override_settings(SERVER_PROCESSES=3, TASK_RESULT_CACHE_ALIAS=None)
+    def test_disabled_cache_passes(self):
+        errors = [message.id for message in run_checks()]
+        self.assertNotIn("core.E002", errors)
@@ -0,0 +1,224 @@
+from datetime import date, datetime, time, timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from core import rollups
+from core.models import Project, Task, TaskEvent, TaskRollup
+
+
+class RollupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        cls.other_project = Project.objects.create(
+            name="OtherProject", description="Description for project"
+        )
+
+    def create_task(self, **kwargs) -> Task:
+        fields = {
+            "name": "TaskName",
+            "description": "Description for Task",
+            "deadline": timezone.now() + timedelta(hours=1),
+            "priority": Task.Priority.LOW,
+            "project": self.project,
+            "assignee": self.user,
+        }
+        fields.update(kwargs)
+        return Task.objects.create(**fields)
+
+    def log(self, kind: str, occurred_at: datetime, **kwargs) -> TaskEvent:
+        fields = {
+            "project": self.project,
+            "assignee": self.user,
+            "priority": Task.Priority.LOW,
+        }
+        fields.update(kwargs)
+        return TaskEvent.objects.create(kind=kind, occurred_at=occurred_at, **fields)
+
+    def at(self, day: date, hour: int, minute: int = 0) -> datetime:
+        return timezone.make_aware(datetime.combine(day, time(hour, minute)))
+
+    def counts(self) -> list[tuple]:
+        return list(
+            TaskRollup.objects.order_by("day", "project", "priority").values_list(
+                "day",
+                "project",
+                "priority",
+                "created_count",
+                "completed_count",
+                "overdue_count",
+            )
+        )
+
+    def test_creating_and_completing_tasks_is_logged(self):
+        task = self.create_task()
+        task.name = "Renamed"
+        task.save()
+        task.is_completed = True
+        task.save()
+        task.save()
+        self.assertEqual(
+            list(TaskEvent.objects.order_by("pk").values_list("kind", flat=True)),
+            [TaskEvent.Kind.CREATED, TaskEvent.Kind.COMPLETED],
+        )
+
+    def test_mark_completed_view_logs_completion(self):
+        task = self.create_task()
+        self.client.force_login(self.user)
+        self.client.post(reverse("core:task-mark-completed", args=(task.pk,)))
+        self.assertTrue(
+            TaskEvent.objects.filter(kind=TaskEvent.Kind.COMPLETED).exists()
+        )
+
+    def test_events_are_rolled_up_per_local_day_and_key(self):
+        day = date(2026, 3, 10)
+        # Half past midnight in Kyiv is still the previous day in UTC
+        self.log(TaskEvent.Kind.CREATED, self.at(day, 0, 30))
+        self.log(TaskEvent.Kind.CREATED, self.at(day, 23, 30))
+        self.log(TaskEvent.Kind.COMPLETED, self.at(day, 12))
+        self.log(
+            TaskEvent.Kind.CREATED,
+            self.at(day, 12),
+            priority=Task.Priority.HIGH,
+        )
+        self.log(TaskEvent.Kind.CREATED, self.at(day, 12), project=self.other_project)
+
+        self.assertEqual(rollups.build_rollups(self.at(day, 12) + timedelta(days=1)), 5)
+        self.assertEqual(
+            self.counts(),
+            [
+                (day, self.project.pk, Task.Priority.LOW, 2, 1, 0),
+                (day, self.project.pk, Task.Priority.HIGH, 1, 0, 0),
+                (day, self.other_project.pk, Task.Priority.LOW, 1, 0, 0),
+            ],
+        )
+
+    def test_each_run_rolls_up_only_the_new_window(self):
+        day = date(2026, 3, 10)
+        self.log(TaskEvent.Kind.CREATED, self.at(day, 10))
+        rollups.build_rollups(self.at(day, 11))
+        # Logged into the window that is already rolled up: not counted again
+        self.log(TaskEvent.Kind.CREATED, self.at(day, 10))
+        self.log(TaskEvent.Kind.CREATED, self.at(day, 12))
+        self.assertEqual(rollups.build_rollups(self.at(day, 13)), 1)
+        self.assertEqual(self.counts()[0][3], 2)
+
+        self.assertEqual(rollups.build_rollups(self.at(day, 14), rebuild=True), 3)
+        self.assertEqual(self.counts()[0][3], 3)
+
+    def test_recent_events_wait_for_open_transactions_to_commit(self):
+        now = self.at(date(2026, 3, 10), 12)
+        self.log(TaskEvent.Kind.CREATED, now - timedelta(minutes=1))
+        self.assertEqual(rollups.build_rollups(now), 0)
+        self.assertEqual(rollups.build_rollups(now + rollups.SETTLE_TIME), 1)
+
+    def test_overdue_snapshot_is_replaced_not_added(self):
+        task = self.create_task()
+        self.create_task(is_completed=True)
+        later = timezone.now() + timedelta(hours=2)
+        rollups.build_rollups(later)
+        rollups.build_rollups(later)
+        today = timezone.localdate(later)
+        self.assertEqual(
+            TaskRollup.objects.get(day=today, overdue_count__gt=0).overdue_count, 1
+        )
+
+        task.is_completed = True
+        task.save()
+        rollups.build_rollups(later)
+        self.assertFalse(
+            TaskRollup.objects.filter(day=today, overdue_count__gt=0).exists()
+        )
+
+    def test_overdue_by_project_compares_first_and_last_snapshot(self):
+        first, last = date(2026, 3, 1), date(2026, 3, 5)
+        for day, project, overdue in (
+            (first, self.project, 4),
+            (last, self.project, 1),
+            (last, self.other_project, 3),
+        ):
+            TaskRollup.objects.create(
+                day=day,
+                project=project,
+                priority=Task.Priority.LOW,
+                overdue_count=overdue,
+            )
+        self.assertEqual(
+            rollups.overdue_by_project(first, last + timedelta(days=1)),
+            [
+                rollups.ProjectOverdue("OtherProject", 0, 3),
+                rollups.ProjectOverdue("ProjectName", 4, 1),
+            ],
+        )
+
+    def test_command(self):
+        out = StringIO()
+        call_command("build_rollups", stdout=out)
+        self.assertIn("Rolled up 0 event(s).", out.getvalue())
+
+
+class ReportViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        cls.today = timezone.localdate()
+        TaskRollup.objects.create(
+            day=cls.today,
+            project=cls.project,
+            assignee=cls.user,
+            priority=Task.Priority.LOW,
+            created_count=5,
+            completed_count=2,
+            overdue_count=1,
+        )
+        TaskRollup.objects.create(
+            day=cls.today - timedelta(days=40),
+            project=cls.project,
+            priority=Task.Priority.LOW,
+            created_count=7,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_redirect_for_not_logged_in_users(self):
+        self.client.logout()
+        response = self.client.get(reverse("core:reports"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_report_reads_only_rollups(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("core:reports"))
+        self.assertTemplateUsed(response, "core/reports.html")
+        tables = {"core_task", "core_taskevent"}
+        self.assertFalse(
+            [q["sql"] for q in queries for table in tables if f'"{table}"' in q["sql"]]
+        )
+        trend = response.context["trend"]
+        self.assertEqual(len(trend), 30)
+        self.assertEqual(trend[-1], rollups.DayTrend(self.today, 5, 2, 1))
+        self.assertEqual(
+            response.context["overdue_projects"],
+            [rollups.ProjectOverdue("ProjectName", 1, 1)],
+        )
+
+    def test_longer_period(self):
+        response = self.client.get(reverse("core:reports"), data={"days": 90})
+        self.assertEqual(sum(day.created for day in response.context["trend"]), 12)
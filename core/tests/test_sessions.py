@@ -0,0 +1,116 @@
+from unittest import mock
+
+from django.contrib.auth import BACKEND_SESSION_KEY, get_user_model
+from django.core.checks import run_checks
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from core.models import Position, Project, Worker
+from task_manager.settings.base import SESSION_ENGINES
+
+
+class WorkerBackendTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user",
+            password="ytrewq123",
+            position=Position.objects.create(name="Developer"),
+            project=Project.objects.create(
+                name="ProjectName", description="Description for project"
+            ),
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_request_user_comes_with_position_and_project(self):
+        response = self.client.get(reverse("core:my-profile"))
+        user = response.wsgi_request.user
+        with self.assertNumQueries(0):
+            self.assertEqual(user.position.name, "Developer")
+            self.assertEqual(user.project.name, "ProjectName")
+
+    def test_inactive_user_is_not_loaded(self):
+        get_user_model().objects.filter(pk=self.user.pk).update(is_active=False)
+        response = self.client.get(reverse("core:my-profile"))
+        self.assertRedirects(
+            response, f"{reverse('login')}?next={reverse('core:my-profile')}"
+        )
+
+
+    def test_sessions_logged_in_through_model_backend_still_resolve(self):
+        self.client.force_login(
+            self.user, backend="django.contrib.auth.backends.ModelBackend"
+        )
+        self.assertEqual(
+            self.client.session[BACKEND_SESSION_KEY],
+            "django.contrib.auth.backends.ModelBackend",
+        )
+        response = self.client.get(reverse("core:my-profile"))
+        self.assertEqual(response.wsgi_request.user, self.user)
+
+    def test_failed_login_checks_the_password_once(self):
+        self.client.logout()
+        with mock.patch.object(
+            Worker, "check_password", autospec=True, return_value=False
+        ) as check_password:
+            logged_in = self.client.login(username="user", password="wrong")
+        self.assertFalse(logged_in)
+        self.assertEqual(check_password.call_count, 1)
+
+
+class SessionEngineTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+
+    def page_queries(self, engine: str) -> list[str]:
+        # SessionMiddleware binds its engine when the client first loads it
+        self.client = self.client_class()
+        with self.settings(SESSION_ENGINE=SESSION_ENGINES[engine]):
+            self.client.login(username="user", password="ytrewq123")
+            self.client.get(reverse("core:my-profile"))
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse("core:my-profile"))
+        self.assertEqual(response.status_code, 200)
+        return [query["sql"] for query in queries]
+
+    def test_logged_in_page_reads_session_table_only_with_db_engine(self):
+        for engine in SESSION_ENGINES:
+            with self.subTest(engine=engine):
+                queries = self.page_queries(engine)
+                session_queries = [sql for sql in queries if "django_session" in sql]
+                self.assertEqual(len(session_queries), engine == "db")
+
+    @override_settings(SESSION_ENGINE=SESSION_ENGINES["cache"])
+    def test_cache_engine_on_process_local_cache_warns(self):
+        warnings = [message.id for message in run_checks()]
+        self.assertIn("core.W001", warnings)
+
+    @override_settings(SESSION_ENGINE=SESSION_ENGINES["cached_db"])
+    def test_cached_db_engine_on_process_local_cache_warns(self):
+        warnings = [message.id for message in run_checks()]
+        self.assertIn("core.W001", warnings)
+
+    @override_settings(
+        SESSION_ENGINE=SESSION_ENGINES["cached_db"],
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://localhost:6379",
+            }
+        },
+    )
+    def test_cached_db_engine_on_shared_cache_does_not_warn(self):
+        warnings = [message.id for message in run_checks()]
+        self.assertNotIn("core.W001", warnings)
+
+    @override_settings(SESSION_ENGINE=SESSION_ENGINES["db"])
+    def test_db_engine_does_not_warn(self):
+        warnings = [message.id for message in run_checks()]
+        self.assertNotIn("core.W001", warnings)
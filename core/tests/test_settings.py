@@ -0,0 +1,133 @@
+import importlib
+import os
+import tempfile
+from unittest import mock
+
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.db.utils import ConnectionHandler
+from django.test import SimpleTestCase
+
+PROD_ENV = {
+    "SECRET_KEY": "secret",
+    "POSTGRES_DB": "db",
+    "POSTGRES_USER": "user",
+    "POSTGRES_PASSWORD": "password",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_DB_PORT": "5432",
+}
+
+
+class SettingsAssemblyTests(SimpleTestCase):
+    def load(self, name: str):
+        with mock.patch.dict(os.environ, PROD_ENV):
+            module = importlib.import_module(f"task_manager.settings.{name}")
+            return importlib.reload(module)
+
+    def test_prod_excludes_debug_toolbar(self):
+        prod = self.load("prod")
+        self.assertNotIn("debug_toolbar", prod.INSTALLED_APPS)
+        self.assertFalse(any("debug_toolbar" in entry for entry in prod.MIDDLEWARE))
+
+    def test_dev_installs_debug_toolbar_after_static_files(self):
+        dev = self.load("dev")
+        self.assertIn("debug_toolbar", dev.INSTALLED_APPS)
+        static_files = dev.MIDDLEWARE.index("core.middleware.StaticFilesMiddleware")
+        self.assertEqual(
+            dev.MIDDLEWARE[static_files + 1],
+            "debug_toolbar.middleware.DebugToolbarMiddleware",
+        )
+
+    def test_prod_hashes_new_passwords_with_tuned_argon2(self):
+        prod = self.load("prod")
+        self.assertEqual(
+            prod.PASSWORD_HASHERS[0], "core.hashers.TunedArgon2PasswordHasher"
+        )
+        self.assertIn(
+            "django.contrib.auth.hashers.PBKDF2PasswordHasher", prod.PASSWORD_HASHERS
+        )
+
+    def test_hasher_profile_is_chosen_from_environment(self):
+        base = importlib.import_module("task_manager.settings.base")
+        self.addCleanup(self.load, "base")
+        with mock.patch.dict(os.environ, {"PASSWORD_HASHER_PROFILE": "scrypt"}):
+            importlib.reload(base)
+            prod = self.load("prod")
+        self.assertEqual(
+            prod.PASSWORD_HASHERS[0], "django.contrib.auth.hashers.ScryptPasswordHasher"
+        )
+
+    def test_prod_adds_replica_from_environment(self):
+        self.assertNotIn("replica", self.load("prod").DATABASES)
+        with mock.patch.dict(os.environ, {"POSTGRES_REPLICA_HOST": "replica-host"}):
+            prod = self.load("prod")
+        self.assertEqual(prod.DATABASES["replica"]["HOST"], "replica-host")
+        self.assertEqual(prod.DATABASES["replica"]["NAME"], "db")
+
+    def test_dev_sqlite_connections_are_tuned_for_concurrent_writers(self):
+        dev = self.load("dev")
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        database = ConnectionHandler(
+            {
+                "default": {
+                    **dev.DATABASES["default"],
+                    "NAME": os.path.join(directory.name, "db.sqlite3"),
+                }
+            }
+        ).settings["default"]
+        # Under an alias of its own, which SimpleTestCase lets connect
+        connection = DatabaseWrapper(database, alias="dev")
+        self.addCleanup(connection.close)
+        with connection.cursor() as cursor:
+            pragmas = {
+                pragma: cursor.execute(f"PRAGMA {pragma}").fetchone()[0]
+                for pragma in ("journal_mode", "synchronous", "busy_timeout")
+            }
+        self.assertEqual(
+            pragmas, {"journal_mode": "wal", "synchronous": 1, "busy_timeout": 5000}
+        )
+        self.assertEqual(connection.transaction_mode, "IMMEDIATE")
+
+    def test_prod_shares_the_redis_cache_between_its_workers(self):
+        with mock.patch.dict(
+            os.environ, REDIS_URL="redis://cache:6379/0", WEB_CONCURRENCY="3"
+        ):
+            os.environ.pop("SESSION_BACKEND", None)
+            prod = self.load("prod")
+        self.assertEqual(
+            prod.CACHES["default"],
+            {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://cache:6379/0",
+            },
+        )
+        self.assertEqual(prod.SESSION_ENGINE, prod.SESSION_ENGINES["cached_db"])
+        self.assertEqual(prod.TASK_RESULT_CACHE_ALIAS, "default")
+        self.assertEqual(prod.TASK_EVENTS_BROKER, "core.events.RedisBroker")
+        self.assertEqual(prod.TASK_EVENTS_REDIS_URL, "redis://cache:6379/0")
+        self.assertEqual(prod.SERVER_PROCESSES, 3)
+
+    def test_prod_without_redis_disables_the_result_cache(self):
+        with mock.patch.dict(os.environ, WEB_CONCURRENCY="3"):
+            os.environ.pop("REDIS_URL", None)
+            os.environ.pop("SESSION_BACKEND", None)
+            prod = self.load("prod")
+        self.assertIsNone(prod.TASK_RESULT_CACHE_ALIAS)
+        self.assertEqual(prod.TASK_EVENTS_BROKER, "core.events.LocalBroker")
+        self.assertEqual(prod.SESSION_ENGINE, prod.SESSION_ENGINES["db"])
+
+    def test_sessions_use_the_cache_only_when_it_is_shared(self):
+        base = importlib.import_module("task_manager.settings.base")
+        backends = "django.core.cache.backends"
+        local = {"default": {"BACKEND": f"{backends}.locmem.LocMemCache"}}
+        shared = {"default": {"BACKEND": f"{backends}.redis.RedisCache"}}
+        with mock.patch.dict(os.environ):
+            os.environ.pop("SESSION_BACKEND", None)
+            self.assertEqual(base.session_engine(local), base.SESSION_ENGINES["db"])
+            self.assertEqual(
+                base.session_engine(shared), base.SESSION_ENGINES["cached_db"]
+            )
+            os.environ["SESSION_BACKEND"] = "cached_db"
+            self.assertEqual(
+                base.session_engine(local), base.SESSION_ENGINES["cached_db"]
+            )
@@ -0,0 +1,110 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from datetime import timedelta
+
+from core.models import Project, ProjectStats, Task
+from core.stats import rebuild_project_stats, sweep_overdue
+
+
+class ProjectStatsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        cls.other_project = Project.objects.create(
+            name="OtherProject", description="Description for project"
+        )
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+
+    def create_task(self, hours: int = 1, priority: int = Task.Priority.LOW) -> Task:
+        return Task.objects.create(
+            name="TaskName",
+            description="Description for Task",
+            deadline=timezone.now() + timedelta(hours=hours),
+            priority=priority,
+            project=self.project,
+            assignee=self.user,
+        )
+
+    def counters(self, project: Project) -> dict:
+        stats = ProjectStats.objects.get(project=project)
+        return {
+            "open": stats.open_count,
+            "overdue": stats.overdue_count,
+            "completed": stats.completed_count,
+            "low": stats.low_priority_count,
+            "medium": stats.medium_priority_count,
+            "high": stats.high_priority_count,
+        }
+
+    def test_new_project_gets_empty_stats(self):
+        self.assertEqual(self.project.stats.tasks_count, 0)
+        self.assertEqual(self.project.stats.progress, 0)
+
+    def test_task_changes_update_counters(self):
+        task = self.create_task()
+        self.create_task(priority=Task.Priority.HIGH)
+        self.assertEqual(
+            self.counters(self.project),
+            {"open": 2, "overdue": 0, "completed": 0, "low": 1, "medium": 0, "high": 1},
+        )
+
+        task.priority = Task.Priority.MEDIUM
+        task.project = self.other_project
+        task.save()
+        self.assertEqual(self.counters(self.project)["low"], 0)
+        self.assertEqual(self.counters(self.other_project)["medium"], 1)
+        self.assertEqual(self.counters(self.other_project)["open"], 1)
+
+        task.delete()
+        self.assertEqual(self.counters(self.other_project)["open"], 0)
+        self.assertEqual(self.counters(self.other_project)["medium"], 0)
+
+    def test_mark_completed_moves_task_once(self):
+        task = self.create_task()
+        self.client.login(username="user", password="ytrewq123")
+        url = reverse("core:task-mark-completed", args=(task.id,))
+        self.client.post(url)
+        self.client.post(url)
+        counters = self.counters(self.project)
+        self.assertEqual((counters["open"], counters["completed"]), (0, 1))
+
+    def test_sweep_moves_only_newly_overdue_tasks(self):
+        self.create_task(hours=1)
+        self.create_task(hours=5)
+        now = timezone.now() + timedelta(hours=2)
+        self.assertEqual(sweep_overdue(now), 1)
+        self.assertEqual(sweep_overdue(now), 0)
+        counters = self.counters(self.project)
+        self.assertEqual((counters["open"], counters["overdue"]), (1, 1))
+
+    def test_completing_overdue_task(self):
+        task = self.create_task(hours=1)
+        sweep_overdue(timezone.now() + timedelta(hours=2))
+        self.client.login(username="user", password="ytrewq123")
+        self.client.post(reverse("core:task-mark-completed", args=(task.id,)))
+        counters = self.counters(self.project)
+        self.assertEqual((counters["overdue"], counters["completed"]), (0, 1))
+
+    def test_rebuild_matches_incremental_counters(self):
+        self.create_task(hours=1)
+        self.create_task(hours=5, priority=Task.Priority.HIGH)
+        self.create_task(hours=3, priority=Task.Priority.MEDIUM)
+        now = timezone.now() + timedelta(hours=2)
+        sweep_overdue(now)
+        incremental = self.counters(self.project)
+        rebuild_project_stats(now)
+        self.assertEqual(self.counters(self.project), incremental)
+
+    def test_command_runs_sweep(self):
+        self.create_task()
+        call_command("sweep_overdue_tasks", "--rebuild", stdout=StringIO())
+        self.assertEqual(self.counters(self.project)["open"], 1)
@@ -0,0 +1,169 @@
+from datetime import UTC, date, datetime, time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core import result_cache, task_calendar
+from core.models import Project, Task
+from core.task_calendar import (
+    DayCount,
+    local_midnight,
+    month_counts,
+    month_range,
+    month_scope,
+)
+
+
+class CalendarTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        cls.other_project = Project.objects.create(
+            name="OtherProject", description="Description for project"
+        )
+        cls.month = (timezone.localdate() + timedelta(days=62)).replace(day=1)
+        cls.next_month = (cls.month + timedelta(days=31)).replace(day=1)
+        cls.last_day = cls.next_month - timedelta(days=1)
+
+    def create_task(self, deadline: datetime, **kwargs) -> Task:
+        fields = {
+            "name": "TaskName",
+            "description": "Description for Task",
+            "priority": Task.Priority.LOW,
+            "project": self.project,
+        }
+        fields.update(kwargs)
+        return Task.objects.create(deadline=deadline, **fields)
+
+    def at(self, day: date, hour: int, minute: int = 0) -> datetime:
+        return timezone.make_aware(datetime.combine(day, time(hour, minute)))
+
+    def test_month_range_spans_local_midnights_across_dst(self):
+        start, end = month_range(date(2024, 3, 15))
+        self.assertEqual(start, local_midnight(date(2024, 3, 1)))
+        self.assertEqual(end, local_midnight(date(2024, 4, 1)))
+        # Clocks in Kyiv go forward on the last Sunday of March
+        self.assertEqual(
+            end.astimezone(UTC) - start.astimezone(UTC), timedelta(days=31, hours=-1)
+        )
+
+    def test_task_due_at_midnight_belongs_to_the_day_it_starts(self):
+        self.create_task(local_midnight(self.next_month) - timedelta(minutes=1))
+        self.create_task(local_midnight(self.next_month))
+        self.assertEqual(month_counts(self.month), {self.last_day: DayCount(1, 0)})
+        self.assertEqual(
+            month_counts(self.next_month), {self.next_month: DayCount(1, 0)}
+        )
+
+    def test_days_are_cut_in_local_time(self):
+        day = self.month + timedelta(days=9)
+        # Half past midnight in Kyiv is still the previous day in UTC
+        self.create_task(self.at(day, 0, 30))
+        self.create_task(self.at(day, 23, 30), is_completed=True)
+        self.assertEqual(month_counts(self.month), {day: DayCount(2, 1)})
+
+    def test_counts_by_project_and_assignee(self):
+        day = self.month + timedelta(days=4)
+        self.create_task(self.at(day, 12), assignee=self.user)
+        self.create_task(self.at(day, 12))
+        self.create_task(self.at(day, 12), project=self.other_project)
+        self.assertEqual(month_counts(self.month)[day].total, 3)
+        self.assertEqual(month_counts(self.month, self.project)[day].total, 2)
+        self.assertEqual(
+            month_counts(self.month, self.project, self.user)[day].total, 1
+        )
+
+    def test_week_tasks_by_local_day(self):
+        monday = task_calendar.week_start(self.month + timedelta(days=14))
+        late = self.create_task(self.at(monday + timedelta(days=6), 23, 59))
+        early = self.create_task(self.at(monday, 0, 0))
+        self.create_task(local_midnight(monday + timedelta(days=7)))
+        days = task_calendar.week_tasks(monday + timedelta(days=3))
+        self.assertEqual(list(days), [monday + timedelta(days=i) for i in range(7)])
+        self.assertEqual(days[monday], [early])
+        self.assertEqual(days[monday + timedelta(days=6)], [late])
+        self.assertEqual(sum(len(tasks) for tasks in days.values()), 2)
+
+    def test_month_is_read_from_the_deadline_index(self):
+        plan = task_calendar.deadline_tasks(*month_range(self.month)).explain()
+        self.assertRegex(plan, r"USING (COVERING )?INDEX \w*deadline\w*")
+
+
+@override_settings(TASK_RESULT_CACHE_ALIAS="default")
+class CalendarCacheTests(CalendarTests):
+    # Runs the tests above again with the counts served from the cache
+
+    def setUp(self):
+        cache.clear()
+
+    def test_counts_are_cached_until_a_task_of_that_month_changes(self):
+        day = self.month + timedelta(days=2)
+        task = self.create_task(self.at(day, 12))
+        self.assertEqual(month_counts(self.month, self.project)[day].total, 1)
+
+        self.create_task(self.at(self.next_month, 12))
+        with self.assertNumQueries(0):
+            self.assertEqual(month_counts(self.month, self.project)[day].total, 1)
+
+        self.create_task(self.at(day, 15))
+        self.assertEqual(month_counts(self.month, self.project)[day].total, 2)
+
+        task.deadline = self.at(self.next_month, 15)
+        task.save()
+        self.assertEqual(month_counts(self.month, self.project)[day].total, 1)
+
+    def test_change_invalidates_the_all_projects_month_too(self):
+        day = self.month + timedelta(days=2)
+        self.assertEqual(month_counts(self.month), {})
+        self.create_task(self.at(day, 12))
+        self.assertEqual(month_counts(self.month), {day: DayCount(1, 0)})
+
+    def test_deleting_a_task_invalidates_its_month(self):
+        day = self.month + timedelta(days=2)
+        task = self.create_task(self.at(day, 12))
+        self.assertEqual(month_counts(self.month, self.project)[day].total, 1)
+        task.delete()
+        self.assertEqual(month_counts(self.month, self.project), {})
+
+    def test_reassigning_a_task_invalidates_both_assignees(self):
+        other = get_user_model().objects.create_user(
+            username="other", password="ytrewq123"
+        )
+        day = self.month + timedelta(days=2)
+        task = self.create_task(self.at(day, 12), assignee=self.user)
+        self.assertEqual(month_counts(self.month, None, self.user)[day].total, 1)
+        self.assertEqual(month_counts(self.month, None, other), {})
+
+        task.assignee = other
+        task.save()
+        self.assertEqual(month_counts(self.month, None, self.user), {})
+        self.assertEqual(month_counts(self.month, None, other)[day].total, 1)
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "shared": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "shared",
+            },
+        },
+        TASK_RESULT_CACHE_ALIAS="shared",
+    )
+    def test_months_live_in_the_result_cache_alias(self):
+        # In prod that alias is the Redis cache every worker shares
+        day = self.month + timedelta(days=2)
+        self.create_task(self.at(day, 12))
+        self.assertEqual(month_counts(self.month, self.project)[day].total, 1)
+
+        key = result_cache.generation_key(
+            Task, month_scope(self.project.pk, self.month)
+        )
+        self.assertIsNotNone(caches["shared"].get(key))
+        self.assertIsNone(caches["default"].get(key))
@@ -0,0 +1,211 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from datetime import timedelta
+
+from core.models import Position, Project, Task, TaskType
+
+
+class TaskApiViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        cls.other_project = Project.objects.create(
+            name="OtherProject", description="Description for project"
+        )
+        cls.task_type = TaskType.objects.create(name="TaskType")
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123", project=cls.project
+        )
+        cls.other_user = get_user_model().objects.create_user(
+            username="other_user", password="ytrewq123"
+        )
+        cls.tasks = []
+        for i in range(5):
+            task = Task.objects.create(
+                name=f"TaskName{i}",
+                description="Description for Task",
+                deadline=timezone.now() + timedelta(hours=1, minutes=i % 2),
+                priority=Task.Priority.LOW,
+                project=cls.project if i < 4 else cls.other_project,
+                task_type=cls.task_type,
+                assignee=cls.user,
+                created_by=cls.other_user,
+                is_completed=(i % 2 == 0),
+            )
+            cls.tasks.append(task)
+
+    def setUp(self):
+        self.client.login(username="user", password="ytrewq123")
+
+    def test_unauthenticated_request_returns_401(self):
+        self.client.logout()
+        response = self.client.get(reverse("core:api-task-list"))
+        self.assertEqual(response.status_code, 401)
+
+    def test_sparse_fieldset(self):
+        response = self.client.get(
+            reverse("core:api-task-list"), data={"fields": "name,priority"}
+        )
+        self.assertEqual(response.status_code, 200)
+        for item in response.json()["data"]:
+            self.assertEqual(set(item), {"id", "name", "priority"})
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get(
+            reverse("core:api-task-list"), data={"fields": "password"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_includes_use_one_query_per_relation(self):
+        # user (session is served from the cache), tasks, projects, workers
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                reverse("core:api-task-list"),
+                data={
+                    "include": "project,assignee",
+                    "fields[projects]": "name",
+                },
+            )
+        included = response.json()["included"]
+        self.assertEqual(
+            included["projects"],
+            [
+                {"id": self.project.id, "name": "ProjectName"},
+                {"id": self.other_project.id, "name": "OtherProject"},
+            ],
+        )
+        self.assertEqual(len(included["workers"]), 1)
+        self.assertNotIn("password", included["workers"][0])
+
+    def test_keyset_pagination_visits_every_task_once(self):
+        seen = []
+        data = {"limit": 2, "fields": "name"}
+        while True:
+            response = self.client.get(reverse("core:api-task-list"), data=data)
+            body = response.json()
+            seen.extend(item["id"] for item in body["data"])
+            if body["next"] is None:
+                break
+            data["cursor"] = body["next"]
+        expected = Task.objects.order_by("deadline", "pk").values_list("pk", flat=True)
+        self.assertEqual(seen, list(expected))
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(
+            reverse("core:api-task-list"), data={"cursor": "not-a-cursor"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_filters_reuse_task_search_form(self):
+        response = self.client.get(
+            reverse("core:api-task-list"),
+            data={"status": "done", "project": self.project.pk},
+        )
+        ids = [item["id"] for item in response.json()["data"]]
+        self.assertCountEqual(ids, [self.tasks[0].id, self.tasks[2].id])
+        response = self.client.get(
+            reverse("core:api-task-list"), data={"priority": "INVALID"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_sort_is_rejected(self):
+        response = self.client.get(
+            reverse("core:api-task-list"), data={"sort": "name"}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()["errors"],
+            {"sort": ["Not supported; lists are ordered by deadline, then id."]},
+        )
+
+    def test_create_sets_created_by(self):
+        response = self.client.post(
+            reverse("core:api-task-list"),
+            data=json.dumps(
+                {
+                    "name": "NewTask",
+                    "description": "Description for new task",
+                    "deadline": (timezone.now() + timedelta(hours=2)).isoformat(),
+                    "priority": Task.Priority.HIGH,
+                    "project": self.project.id,
+                }
+            ),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        task = Task.objects.get(pk=response.json()["data"]["id"])
+        self.assertEqual(task.created_by, self.user)
+
+    def test_update_requires_creator_or_admin(self):
+        response = self.client.patch(
+            reverse("core:api-task-detail", args=(self.tasks[1].id,)),
+            data=json.dumps({"name": "Renamed"}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 403)
+        self.client.login(username="other_user", password="ytrewq123")
+        response = self.client.patch(
+            reverse("core:api-task-detail", args=(self.tasks[1].id,)),
+            data=json.dumps({"name": "Renamed"}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.tasks[1].refresh_from_db()
+        self.assertEqual(self.tasks[1].name, "Renamed")
+
+    def test_detail_not_found(self):
+        response = self.client.get(reverse("core:api-task-detail", args=(0,)))
+        self.assertEqual(response.status_code, 404)
+
+
+class ReferenceApiViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(name="PositionName")
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123", position=cls.position
+        )
+        cls.admin = get_user_model().objects.create_superuser(
+            username="admin_user", password="ytrewq123"
+        )
+
+    def test_regular_users_cannot_create_positions(self):
+        self.client.login(username="user", password="ytrewq123")
+        response = self.client.post(
+            reverse("core:api-position-list"),
+            data=json.dumps({"name": "NewPosition"}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 403)
+
+    def test_admins_can_create_and_delete_positions(self):
+        self.client.login(username="admin_user", password="ytrewq123")
+        response = self.client.post(
+            reverse("core:api-position-list"),
+            data=json.dumps({"name": "NewPosition"}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        pk = response.json()["data"]["id"]
+        response = self.client.delete(reverse("core:api-position-detail", args=(pk,)))
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(Position.objects.filter(pk=pk).exists())
+
+    def test_worker_list_includes_positions(self):
+        self.client.login(username="user", password="ytrewq123")
+        response = self.client.get(
+            reverse("core:api-worker-list"),
+            data={"position": self.position.id, "include": "position"},
+        )
+        body = response.json()
+        self.assertEqual([item["username"] for item in body["data"]], ["user"])
+        self.assertEqual(
+            body["included"]["positions"],
+            [{"id": self.position.id, "name": "PositionName"}],
+        )
@@ -0,0 +1,98 @@
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIHandler
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from core.events import LocalBroker, get_broker
+from core.models import Project
+
+
+class SharedBroker(LocalBroker):
+    shared = True
+
+
+@override_settings(TASK_EVENTS_BROKER="core.events.LocalBroker")
+class TaskEventsViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123", project=cls.project
+        )
+        cls.user_without_project = get_user_model().objects.create_user(
+            username="no_project", password="ytrewq123"
+        )
+
+    def setUp(self):
+        get_broker.cache_clear()
+        self.addCleanup(get_broker.cache_clear)
+
+    async def test_unauthenticated_request_returns_401(self):
+        response = await self.async_client.get(reverse("core:task-events"))
+        self.assertEqual(response.status_code, 401)
+
+    async def test_worker_without_project_gets_no_content(self):
+        await self.async_client.aforce_login(self.user_without_project)
+        response = await self.async_client.get(reverse("core:task-events"))
+        self.assertEqual(response.status_code, 204)
+
+    async def test_stream_delivers_project_events(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("core:task-events"))
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b"retry: 5000\n\n")
+
+        broker = get_broker()
+        self.assertIsInstance(broker, LocalBroker)
+        broker.publish(
+            f"project:{self.project.id}",
+            {"type": "task.completed", "task": {"id": 7}},
+        )
+        self.assertEqual(
+            await anext(stream),
+            b'id: 1\nevent: task.completed\ndata: {"id": 7}\n\n',
+        )
+
+    async def test_task_list_opens_the_stream_over_asgi(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("core:task-list"))
+        self.assertContains(response, 'id="task-events"')
+
+    @override_settings(SERVER_PROCESSES=3)
+    async def test_process_local_broker_with_several_processes_streams_nothing(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("core:task-list"))
+        self.assertNotContains(response, 'id="task-events"')
+        response = await self.async_client.get(reverse("core:task-events"))
+        self.assertEqual(response.status_code, 204)
+
+    @override_settings(
+        SERVER_PROCESSES=3,
+        TASK_EVENTS_BROKER="core.tests.test_views.test_event_views.SharedBroker",
+    )
+    async def test_shared_broker_streams_with_several_processes(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse("core:task-list"))
+        self.assertContains(response, 'id="task-events"')
+
+    def test_task_list_does_not_open_the_stream_over_wsgi(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("core:task-list"))
+        self.assertNotContains(response, 'id="task-events"')
+
+
+class TaskEventsWsgiTests(SimpleTestCase):
+    def test_wsgi_request_returns_at_once(self):
+        # A stream would never end; under WSGI it would pin the worker thread
+        environ = RequestFactory().get(reverse("core:task-events")).environ
+        statuses = []
+        response = WSGIHandler()(
+            environ, lambda status, headers: statuses.append(status)
+        )
+        body = b"".join(response)
+        response.close()
+        self.assertEqual(statuses, ["204 No Content"])
+        self.assertEqual(body, b"")
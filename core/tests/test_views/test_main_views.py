@@ -17,7 +17,7 @@ class IndexViewTest(TestCase):
             name="TestTask",
             description="Description for TestTask",
             deadline=timezone.now() + timedelta(minutes=45),
-            priority="LOW",
+            priority=Task.Priority.LOW,
             is_completed=False,
             project=cls.project,
         )
@@ -4,9 +4,12 @@ from django.test import TestCase, RequestFactory
 from django.urls import reverse
 from django.utils import timezone
 from datetime import timedelta
+from unittest import mock
 
-from core.models import Task, Project
-from core.views.project_views import ProjectListView
+from core import board
+from core.deletion import run_deletion
+from core.models import Deletion, Task, Project
+from core.views.project_views import ProjectBoardView, ProjectListView
 
 
 class ProjectListViewTests(TestCase):
@@ -23,7 +26,7 @@ class ProjectListViewTests(TestCase):
             name="TaskName",
             description="Description for TaskName",
             deadline=timezone.now() + timedelta(minutes=45),
-            priority="LOW",
+            priority=Task.Priority.LOW,
             project=cls.projects[0],
         )
         cls.user = get_user_model().objects.create_user(
@@ -48,6 +51,16 @@ class ProjectListViewTests(TestCase):
         response = self.client.get(reverse("core:project-list") + "?page=2")
         self.assertEqual(len(response.context["project_list"]), 2)
 
+    def test_sort_by_most_open_tasks(self):
+        request = RequestFactory().get(
+            reverse("core:project-list"), data={"sort": "-open"}
+        )
+        view = ProjectListView()
+        view.request = request
+        projects = list(view.get_queryset())
+        self.assertEqual(len(projects), 10)
+        self.assertEqual(projects[0], self.projects[0])
+
     def test_get_queryset(self):
         request = RequestFactory().get(
             reverse("core:project-list"), data={"name": self.projects[0].name}
@@ -75,6 +88,116 @@ class ProjectListViewTests(TestCase):
         )
 
 
+class ProjectBoardViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        other_project = Project.objects.create(
+            name="OtherProject", description="Description for project"
+        )
+        cls.tasks = {}
+        layout = {
+            "open": (None, False, 3),
+            "in_progress": (cls.user, False, 2),
+            "overdue": (cls.user, False, 2),
+            "done": (None, True, 1),
+        }
+        for column, (assignee, is_completed, count) in layout.items():
+            cls.tasks[column] = [
+                Task.objects.create(
+                    name=f"{column}{i}",
+                    description="Description for Task",
+                    deadline=timezone.now() + timedelta(hours=i + 1),
+                    priority=Task.Priority.LOW,
+                    project=cls.project,
+                    assignee=assignee,
+                    is_completed=is_completed,
+                )
+                for i in range(count)
+            ]
+        Task.objects.filter(name__startswith="overdue").update(
+            deadline=timezone.now() - timedelta(hours=1)
+        )
+        Task.objects.create(
+            name="elsewhere",
+            description="Description for Task",
+            deadline=timezone.now() + timedelta(hours=1),
+            priority=Task.Priority.LOW,
+            project=other_project,
+        )
+        cls.url = reverse("core:project-board", args=(cls.project.pk,))
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_redirect_for_not_logged_in_users(self):
+        self.client.logout()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 302)
+
+    def test_all_columns_load_in_one_windowed_query(self):
+        with self.assertNumQueries(2):
+            columns = board.load_columns(self.project, timezone.now(), 2)
+        self.assertEqual(
+            [(column.key, column.count, column.next_page) for column in columns],
+            [
+                ("open", 3, 2),
+                ("in_progress", 2, None),
+                ("overdue", 2, None),
+                ("done", 1, None),
+            ],
+        )
+        self.assertEqual(columns[0].tasks, self.tasks["open"][:2])
+
+    def test_board_page(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "core/project_board.html")
+        self.assertEqual(
+            [column.tasks for column in response.context["columns"]],
+            list(self.tasks.values()),
+        )
+        self.assertNotContains(response, "elsewhere")
+
+    def test_fragment_request_loads_one_column_page(self):
+        with mock.patch.object(ProjectBoardView, "per_column", 2):
+            response = self.client.get(
+                self.url,
+                data={"column": "open", "page": 2},
+                headers={"X-Fragment": "column"},
+            )
+        self.assertTemplateUsed(response, "includes/board_cards.html")
+        self.assertTemplateNotUsed(response, "base.html")
+        self.assertNotIn("columns", response.context)
+        self.assertEqual(response.context["column"].tasks, self.tasks["open"][2:])
+        self.assertIsNone(response.context["column"].next_page)
+
+    def test_more_link_without_javascript_opens_board_at_that_page(self):
+        with mock.patch.object(ProjectBoardView, "per_column", 2):
+            response = self.client.get(self.url, data={"column": "open", "page": 2})
+        self.assertTemplateUsed(response, "core/project_board.html")
+        columns = response.context["columns"]
+        self.assertEqual(columns[0].tasks, self.tasks["open"][2:])
+        self.assertEqual(columns[1].tasks, self.tasks["in_progress"])
+
+    def test_fragment_request_without_column_renders_the_board(self):
+        response = self.client.get(self.url, headers={"X-Fragment": "column"})
+        self.assertTemplateUsed(response, "core/project_board.html")
+        self.assertEqual(len(response.context["columns"]), 4)
+
+    def test_unknown_column_or_page_is_not_found(self):
+        for data in ({"column": "archived"}, {"column": "done", "page": 5}):
+            for headers in ({}, {"X-Fragment": "column"}):
+                with self.subTest(**data, **headers):
+                    response = self.client.get(self.url, data=data, headers=headers)
+                    self.assertEqual(response.status_code, 404)
+
+
 class ProjectCreateViewTests(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -115,16 +238,17 @@ class ProjectCreateViewTests(TestCase):
 
 
 class ProjectUpdateViewTests(TestCase):
-    def setUp(self):
-        self.regular_user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.regular_user = get_user_model().objects.create_user(
             username="regular_user",
             password="ytrewq123",
         )
-        self.admin = get_user_model().objects.create_superuser(
+        cls.admin = get_user_model().objects.create_superuser(
             username="admin_user",
             password="ytrewq123",
         )
-        self.project = Project.objects.create(
+        cls.project = Project.objects.create(
             name="ProjectName", description="Description for ProjectName"
         )
 
@@ -165,16 +289,17 @@ class ProjectUpdateViewTests(TestCase):
 
 
 class ProjectDeleteViewTests(TestCase):
-    def setUp(self):
-        self.regular_user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.regular_user = get_user_model().objects.create_user(
             username="regular_user",
             password="ytrewq123",
         )
-        self.admin = get_user_model().objects.create_superuser(
+        cls.admin = get_user_model().objects.create_superuser(
             username="admin_user",
             password="ytrewq123",
         )
-        self.project = Project.objects.create(
+        cls.project = Project.objects.create(
             name="ProjectName", description="Description for ProjectName"
         )
 
@@ -203,8 +328,17 @@ class ProjectDeleteViewTests(TestCase):
 
     def test_post_method_for_admin_users(self):
         self.client.login(username="admin_user", password="ytrewq123")
-        response = self.client.post(
-            reverse("core:project-delete", args=(self.project.pk,))
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(
+                reverse("core:project-delete", args=(self.project.pk,))
+            )
+        deletion = Deletion.objects.get(object_id=self.project.pk)
+        self.assertRedirects(
+            response, reverse("core:deletion-detail", args=(deletion.pk,))
         )
-        self.assertRedirects(response, reverse("core:project-list"))
+        self.assertEqual(len(callbacks), 1)
+        self.project.refresh_from_db()
+        self.assertTrue(self.project.is_deleting)
+
+        run_deletion(deletion.pk)
         self.assertFalse(Project.objects.filter(pk=self.project.id).exists())
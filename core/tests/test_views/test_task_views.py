@@ -5,7 +5,7 @@ from django.utils import timezone
 from datetime import timedelta
 
 from core.models import TaskType, Position, Task, Project
-from core.views.task_views import TaskListView
+from core.views.task_views import MyOverdueTaskListView, TaskListView
 
 
 class TaskListViewTests(TestCase):
@@ -33,7 +33,7 @@ class TaskListViewTests(TestCase):
                 name=f"TaskName{i}",
                 description="Description for Task",
                 deadline=timezone.now() + timedelta(minutes=45),
-                priority="LOW",
+                priority=Task.Priority.LOW,
                 project=cls.project,
                 task_type=cls.task_type,
                 assignee=cls.users[i],
@@ -60,6 +60,34 @@ class TaskListViewTests(TestCase):
         response = self.client.get(reverse("core:task-list") + "?page=3")
         self.assertEqual(len(response.context["task_list"]), 2)
 
+    def test_fragment_request_renders_only_results(self):
+        self.client.login(username="user0", password="ytrewq123")
+        response = self.client.get(
+            reverse("core:task-list") + "?page=2", headers={"X-Fragment": "results"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "includes/task_results.html")
+        self.assertTemplateNotUsed(response, "base.html")
+        self.assertNotIn("search_form", response.context)
+        self.assertEqual(len(response.context["task_list"]), 4)
+        self.assertIn("X-Fragment", response["Vary"])
+
+    def test_sort_by_priority_then_deadline(self):
+        Task.objects.filter(pk=self.tasks[7].pk).update(priority=Task.Priority.HIGH)
+        Task.objects.filter(pk=self.tasks[3].pk).update(
+            priority=Task.Priority.MEDIUM
+        )
+        request = RequestFactory().get(
+            reverse("core:task-list"), data={"sort": "priority"}
+        )
+        request.user = self.users[0]
+        view = TaskListView()
+        view.request = request
+        queryset = view.get_queryset()
+        low = [task for task in self.tasks if task not in self.tasks[3:8:4]]
+        self.assertEqual(list(queryset), [self.tasks[7], self.tasks[3], *low])
+        self.assertIn("task_priority_deadline_idx", queryset.explain())
+
     def test_get_queryset_with_valid_form(self):
         request = RequestFactory().get(
             reverse("core:task-list"),
@@ -68,7 +96,7 @@ class TaskListViewTests(TestCase):
                 "created_by_me": "yes",
                 "status": "done",
                 "name": "TaskName0",
-                "priority": "LOW",
+                "priority": Task.Priority.LOW,
                 "task_type": self.task_type.pk,
                 "project": self.project.pk,
             },
@@ -84,7 +112,7 @@ class TaskListViewTests(TestCase):
                 created_by=self.users[0],
                 is_completed=True,
                 name__icontains="TaskName0",
-                priority="LOW",
+                priority=Task.Priority.LOW,
                 task_type=self.task_type,
                 project=self.project,
             )
@@ -114,7 +142,7 @@ class TaskListViewTests(TestCase):
                 "created_by_me": "yes",
                 "status": "done",
                 "name": "TaskName0",
-                "priority": "LOW",
+                "priority": Task.Priority.LOW,
                 "task_type": self.task_type,
                 "project": self.project,
             },
@@ -135,7 +163,8 @@ class TaskListViewTests(TestCase):
         )
         self.assertEqual(response.context_data["search_form"].initial["status"], "done")
         self.assertEqual(
-            response.context_data["search_form"].initial["priority"], "LOW"
+            response.context_data["search_form"].initial["priority"],
+            str(Task.Priority.LOW),
         )
         self.assertEqual(
             response.context_data["search_form"].initial["task_type"],
@@ -146,6 +175,116 @@ class TaskListViewTests(TestCase):
         )
 
 
+class TaskExportViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        for name, assignee in (("=HYPERLINK()", cls.user), ("NotMine", None)):
+            Task.objects.create(
+                name=name,
+                description="Description for Task",
+                deadline=timezone.now() + timedelta(minutes=45),
+                priority=Task.Priority.HIGH,
+                project=cls.project,
+                assignee=assignee,
+            )
+
+    def test_redirect_for_not_logged_in_users(self):
+        response = self.client.get(reverse("core:task-export"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_exports_tasks_matching_list_filters(self):
+        self.client.login(username="user", password="ytrewq123")
+        response = self.client.get(
+            reverse("core:task-export"), {"assigned_to_me": "yes", "page": "3"}
+        )
+        self.assertEqual(response["Content-Type"], "text/csv")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0].split(",")[:3], ["ID", "Name", "Deadline"])
+        self.assertEqual(len(lines), 2)
+        self.assertIn("'=HYPERLINK()", lines[1])
+        self.assertIn("High", lines[1])
+
+
+class TaskCalendarViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+        cls.project = Project.objects.create(
+            name="ProjectName", description="Description for project"
+        )
+        cls.deadline = timezone.now() + timedelta(days=40)
+        cls.day = timezone.localdate(cls.deadline)
+        cls.task = Task.objects.create(
+            name="Due",
+            description="Description for Task",
+            deadline=cls.deadline,
+            priority=Task.Priority.LOW,
+            project=cls.project,
+            assignee=cls.user,
+        )
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_redirect_for_not_logged_in_users(self):
+        self.client.logout()
+        for name in ("core:task-calendar", "core:task-calendar-week"):
+            with self.subTest(name):
+                response = self.client.get(reverse(name))
+                self.assertEqual(response.status_code, 302)
+
+    def test_month_view_shows_counts_in_a_grid_of_weeks(self):
+        response = self.client.get(
+            reverse("core:task-calendar"),
+            data={"month": self.day.strftime("%Y-%m"), "project": self.project.pk},
+        )
+        self.assertTemplateUsed(response, "core/task_calendar_month.html")
+        self.assertEqual(response.context["month"], self.day.replace(day=1))
+        days = dict(day for week in response.context["weeks"] for day in week)
+        self.assertEqual(days[self.day].total, 1)
+        self.assertTrue(all(len(week) == 7 for week in response.context["weeks"]))
+        self.assertContains(response, "1 due")
+
+    def test_invalid_month_shows_the_current_month(self):
+        response = self.client.get(reverse("core:task-calendar"), data={"month": "x"})
+        self.assertEqual(
+            response.context["month"], timezone.localdate().replace(day=1)
+        )
+
+    def test_months_and_weeks_at_the_ends_of_the_calendar_show_today(self):
+        today = timezone.localdate()
+        current_month = today.replace(day=1)
+        current_week = today - timedelta(days=today.weekday())
+        for name, data, key, expected in (
+            ("core:task-calendar", {"month": "9999-12"}, "month", current_month),
+            ("core:task-calendar", {"month": "0001-01"}, "month", current_month),
+            ("core:task-calendar-week", {"week": "9999-12-31"}, "week", current_week),
+            ("core:task-calendar-week", {"week": "0001-01-01"}, "week", current_week),
+        ):
+            with self.subTest(**data):
+                response = self.client.get(reverse(name), data=data)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.context[key], expected)
+
+    def test_week_view_lists_tasks_by_day(self):
+        response = self.client.get(
+            reverse("core:task-calendar-week"),
+            data={"week": self.day.isoformat(), "assignee": self.user.pk},
+        )
+        self.assertTemplateUsed(response, "core/task_calendar_week.html")
+        self.assertEqual(response.context["week"].weekday(), 0)
+        self.assertEqual(response.context["days"][self.day], [self.task])
+        self.assertContains(response, "Due")
+
+
 class TaskCreateViewTests(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -177,7 +316,7 @@ class TaskCreateViewTests(TestCase):
                 "name": "NewTask",
                 "description": "Description for new task",
                 "deadline": timezone.now() + timedelta(minutes=45),
-                "priority": "LOW",
+                "priority": Task.Priority.LOW,
                 "project": self.project.id,
                 "assignee": self.user.id,
             },
@@ -189,26 +328,27 @@ class TaskCreateViewTests(TestCase):
 
 
 class TaskUpdateViewTests(TestCase):
-    def setUp(self):
-        self.admin = get_user_model().objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser(
             username="admin_user", password="ytrewq123"
         )
-        self.regular_user = get_user_model().objects.create_user(
+        cls.regular_user = get_user_model().objects.create_user(
             username="regular_user", password="ytrewq123"
         )
-        self.creator = get_user_model().objects.create_user(
+        cls.creator = get_user_model().objects.create_user(
             username="creator", password="ytrewq123"
         )
-        self.project = Project.objects.create(
+        cls.project = Project.objects.create(
             name="TestProject", description="Description for project"
         )
-        self.task = Task.objects.create(
+        cls.task = Task.objects.create(
             name="Task1",
             description="Description",
             deadline=timezone.now() + timedelta(minutes=45),
-            priority="HIGH",
-            project=self.project,
-            created_by=self.creator,
+            priority=Task.Priority.HIGH,
+            project=cls.project,
+            created_by=cls.creator,
         )
 
     def test_redirect_for_not_logged_in_users(self):
@@ -253,7 +393,7 @@ class TaskUpdateViewTests(TestCase):
 
     def test_post_method_for_creators(self):
         self.client.login(username="creator", password="ytrewq123")
-        new_priority = "MEDIUM"
+        new_priority = Task.Priority.MEDIUM
         new_deadline = timezone.now() + timedelta(hours=4)
         self.client.post(
             reverse("core:task-update", args=(self.task.id,)),
@@ -271,26 +411,27 @@ class TaskUpdateViewTests(TestCase):
 
 
 class TaskDeleteViewTests(TestCase):
-    def setUp(self):
-        self.project = Project.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(
             name="TestProject", description="Description for project"
         )
-        self.admin = get_user_model().objects.create_superuser(
+        cls.admin = get_user_model().objects.create_superuser(
             username="admin_user", password="ytrewq123"
         )
-        self.regular_user = get_user_model().objects.create_user(
+        cls.regular_user = get_user_model().objects.create_user(
             username="regular_user", password="ytrewq123"
         )
-        self.creator = get_user_model().objects.create_user(
+        cls.creator = get_user_model().objects.create_user(
             username="creator", password="ytrewq123"
         )
-        self.task = Task.objects.create(
+        cls.task = Task.objects.create(
             name="Task1",
             description="Description",
             deadline=timezone.now() + timedelta(minutes=45),
-            priority="HIGH",
-            project=self.project,
-            created_by=self.creator,
+            priority=Task.Priority.HIGH,
+            project=cls.project,
+            created_by=cls.creator,
         )
 
     def test_redirect_for_not_logged_in_users(self):
@@ -324,30 +465,31 @@ class TaskDeleteViewTests(TestCase):
 
 
 class TaskMarkCompletedViewTests(TestCase):
-    def setUp(self):
-        self.admin = get_user_model().objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = get_user_model().objects.create_superuser(
             username="admin", password="ytrewq123"
         )
-        self.creator = get_user_model().objects.create_user(
+        cls.creator = get_user_model().objects.create_user(
             username="creator", password="ytrewq123"
         )
-        self.assignee = get_user_model().objects.create_user(
+        cls.assignee = get_user_model().objects.create_user(
             username="assignee", password="ytrewq123"
         )
-        self.regular_user = get_user_model().objects.create_user(
+        cls.regular_user = get_user_model().objects.create_user(
             username="regular_user", password="ytrewq123"
         )
-        self.project = Project.objects.create(
+        cls.project = Project.objects.create(
             name="TestProject", description="Description for project"
         )
-        self.task = Task.objects.create(
+        cls.task = Task.objects.create(
             name="Task1",
             description="Test task",
             deadline=timezone.now() + timedelta(minutes=45),
-            priority="HIGH",
-            project=self.project,
-            assignee=self.assignee,
-            created_by=self.creator,
+            priority=Task.Priority.HIGH,
+            project=cls.project,
+            assignee=cls.assignee,
+            created_by=cls.creator,
         )
 
     def test_redirect_for_not_logged_in_users(self):
@@ -400,3 +542,69 @@ class TaskMarkCompletedViewTests(TestCase):
         self.assertEqual(response.status_code, 302)
         self.task.refresh_from_db()
         self.assertFalse(self.task.is_completed)
+
+
+class MyOverdueTaskListViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            username="user", password="ytrewq123"
+        )
+        cls.other_user = get_user_model().objects.create_user(
+            username="other_user", password="ytrewq123"
+        )
+        cls.project = Project.objects.create(
+            name="TestProject", description="Description for project"
+        )
+        cls.tasks = []
+        for i, (assignee, is_completed) in enumerate(
+            [(cls.user, False), (cls.user, True), (cls.other_user, False)]
+        ):
+            task = Task.objects.create(
+                name=f"Overdue{i}",
+                description="Description",
+                deadline=timezone.now() + timedelta(minutes=45),
+                priority=Task.Priority.HIGH,
+                project=cls.project,
+                assignee=assignee,
+                is_completed=is_completed,
+            )
+            cls.tasks.append(task)
+        cls.upcoming = Task.objects.create(
+            name="Upcoming",
+            description="Description",
+            deadline=timezone.now() + timedelta(hours=2),
+            priority=Task.Priority.LOW,
+            project=cls.project,
+            assignee=cls.user,
+        )
+        Task.objects.filter(name__startswith="Overdue").update(
+            deadline=timezone.now() - timedelta(hours=1)
+        )
+
+    def test_redirect_for_not_logged_in_users(self):
+        response = self.client.get(reverse("core:my-overdue-tasks"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_lists_only_own_unfinished_overdue_tasks(self):
+        self.client.login(username="user", password="ytrewq123")
+        response = self.client.get(reverse("core:my-overdue-tasks"))
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, "core/my_overdue_tasks.html")
+        self.assertEqual(list(response.context["task_list"]), [self.tasks[0]])
+
+    def test_query_uses_partial_index(self):
+        request = RequestFactory().get(reverse("core:my-overdue-tasks"))
+        request.user = self.user
+        view = MyOverdueTaskListView()
+        view.request = request
+        self.assertIn("task_open_assignee_dl_idx", view.get_queryset().explain())
+
+    def test_status_filter_overdue(self):
+        request = RequestFactory().get(
+            reverse("core:task-list"), data={"status": "overdue"}
+        )
+        request.user = self.user
+        view = TaskListView()
+        view.request = request
+        self.assertCountEqual(view.get_queryset(), [self.tasks[0], self.tasks[2]])
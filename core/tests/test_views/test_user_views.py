@@ -40,19 +40,20 @@ class SignUpViewTests(TestCase):
 
 
 class MyProfileViewTests(TestCase):
-    def setUp(self):
-        self.position = Position.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.position = Position.objects.create(
             name="TestPosition",
         )
-        self.project = Project.objects.create(
+        cls.project = Project.objects.create(
             name="TestProject", description="Description for TestProject"
         )
-        self.user = get_user_model().objects.create_user(
+        cls.user = get_user_model().objects.create_user(
             username="user",
             password="ytrewq123",
             email="example@gmail.com",
-            position=self.position,
-            project=self.project,
+            position=cls.position,
+            project=cls.project,
         )
 
     def test_redirect_for_not_logged_in_users(self):
@@ -5,7 +5,8 @@ from django.urls import reverse
 from django.utils import timezone
 from datetime import timedelta
 
-from core.models import Project, Position, Task, Worker
+from core.deletion import run_deletion
+from core.models import Deletion, Project, Position, Task, Worker
 from core.views.worker_views import WorkerListView
 
 
@@ -33,7 +34,7 @@ class WorkerListViewTests(TestCase):
                 name=f"TaskName{i}",
                 description="Description for Task",
                 deadline=timezone.now() + timedelta(minutes=45),
-                priority="LOW",
+                priority=Task.Priority.LOW,
                 project=cls.project,
                 assignee=cls.users[i],
             )
@@ -57,6 +58,15 @@ class WorkerListViewTests(TestCase):
         response = self.client.get(reverse("core:worker-list") + "?page=2")
         self.assertEqual(len(response.context["worker_list"]), 2)
 
+    def test_sort_is_kept_by_pagination_links(self):
+        self.client.login(username="user0", password="ytrewq123")
+        response = self.client.get(reverse("core:worker-list") + "?sort=-username")
+        self.assertEqual(
+            [worker.username for worker in response.context["worker_list"]],
+            [f"user{i}" for i in range(9, 1, -1)],
+        )
+        self.assertContains(response, 'href="?sort=-username&amp;page=2"')
+
     def test_get_queryset_with_valid_form(self):
         request = RequestFactory().get(
             reverse("core:worker-list") + "?position=1&project=1&username=user0"
@@ -165,12 +175,13 @@ class WorkerCreateViewTests(TestCase):
 
 
 class WorkerUpdateViewTests(TestCase):
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             username="user",
             password="ytrewq123",
         )
-        self.admin = get_user_model().objects.create_superuser(
+        cls.admin = get_user_model().objects.create_superuser(
             username="admin_user",
             password="ytrewq123",
         )
@@ -206,12 +217,13 @@ class WorkerUpdateViewTests(TestCase):
 
 
 class WorkerDeleteViewTests(TestCase):
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             username="user",
             password="ytrewq123",
         )
-        self.admin = get_user_model().objects.create_superuser(
+        cls.admin = get_user_model().objects.create_superuser(
             username="admin_user",
             password="ytrewq123",
         )
@@ -235,6 +247,17 @@ class WorkerDeleteViewTests(TestCase):
 
     def test_post_method_for_admin_users(self):
         self.client.login(username="admin_user", password="ytrewq123")
-        response = self.client.post(reverse("core:worker-delete", args=(self.user.id,)))
-        self.assertRedirects(response, reverse("core:worker-list"))
+        with self.captureOnCommitCallbacks():
+            response = self.client.post(
+                reverse("core:worker-delete", args=(self.user.id,))
+            )
+        deletion = Deletion.objects.get(object_id=self.user.pk)
+        self.assertRedirects(
+            response, reverse("core:deletion-detail", args=(deletion.pk,))
+        )
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_deleting)
+        self.assertFalse(self.user.is_active)
+
+        run_deletion(deletion.pk)
         self.assertFalse(get_user_model().objects.filter(pk=self.user.id).exists())
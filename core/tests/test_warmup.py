@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.template import engines
+from django.test import SimpleTestCase, override_settings
+
+from task_manager.warmup import warm_up_templates
+
+CACHED_TEMPLATES = [
+    {
+        **settings.TEMPLATES[0],
+        "APP_DIRS": False,
+        "OPTIONS": {
+            **settings.TEMPLATES[0]["OPTIONS"],
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
+        },
+    },
+]
+
+
+@override_settings(TEMPLATES=CACHED_TEMPLATES)
+class WarmUpTemplatesTests(SimpleTestCase):
+    def test_disabled_by_default(self):
+        with self.settings(TEMPLATE_WARMUP=False):
+            self.assertEqual(warm_up_templates(), 0)
+
+    def test_compiles_every_project_template(self):
+        with self.settings(TEMPLATE_WARMUP=True):
+            compiled = warm_up_templates()
+        loader = engines["django"].engine.template_loaders[0]
+        cached = set(loader.get_template_cache)
+        self.assertGreaterEqual(compiled, 19)
+        self.assertIn("core/task_list.html", cached)
+        self.assertIn("includes/pagination.html", cached)
@@ -1,15 +1,30 @@
 from django.urls import path
 
+from core.views.api_views import (
+    TaskApiView,
+    ProjectApiView,
+    WorkerApiView,
+    PositionApiView,
+    TaskTypeApiView
+)
+from core.views.deletion_views import DeletionDetailView
+from core.views.event_views import task_events
 from core.views.main_views import index
+from core.views.report_views import ReportView
 from core.views.user_views import sign_up, MyProfileView
 from core.views.project_views import (
     ProjectListView,
+    ProjectBoardView,
     ProjectUpdateView,
     ProjectDeleteView,
     ProjectCreateView
 )
 from core.views.task_views import (
     TaskListView,
+    TaskExportView,
+    TaskCalendarMonthView,
+    TaskCalendarWeekView,
+    MyOverdueTaskListView,
     TaskUpdateView,
     TaskDeleteView,
     TaskCreateView,
@@ -28,6 +43,23 @@ urlpatterns = [
     path("projects/", ProjectListView.as_view(), name="project-list"),
     path("workers/", WorkerListView.as_view(), name="worker-list"),
     path("tasks/", TaskListView.as_view(), name="task-list"),
+    path("tasks/events/", task_events, name="task-events"),
+    path("tasks/export/", TaskExportView.as_view(), name="task-export"),
+    path(
+        "tasks/calendar/", TaskCalendarMonthView.as_view(), name="task-calendar"
+    ),
+    path(
+        "tasks/calendar/week/",
+        TaskCalendarWeekView.as_view(),
+        name="task-calendar-week"
+    ),
+    path(
+        "tasks/my-overdue/", MyOverdueTaskListView.as_view(), name="my-overdue-tasks"
+    ),
+    path("reports/", ReportView.as_view(), name="reports"),
+    path(
+        "deletions/<int:pk>/", DeletionDetailView.as_view(), name="deletion-detail"
+    ),
     path("my-profile/", MyProfileView.as_view(), name="my-profile"),
     path(
         "workers/<int:pk>/update/", WorkerUpdateView.as_view(), name="worker-update"
@@ -35,6 +67,9 @@ urlpatterns = [
     path(
         "workers/<int:pk>/delete/", WorkerDeleteView.as_view(), name="worker-delete"
     ),
+    path(
+        "projects/<int:pk>/board/", ProjectBoardView.as_view(), name="project-board"
+    ),
     path(
         "projects/<int:pk>/update/", ProjectUpdateView.as_view(), name="project-update"
     ),
@@ -58,7 +93,29 @@ urlpatterns = [
     ),
     path(
         "tasks/<int:pk>/complete/", task_mark_completed, name="task-mark-completed"
-    )
+    ),
+    path("api/tasks/", TaskApiView.as_view(), name="api-task-list"),
+    path("api/tasks/<int:pk>/", TaskApiView.as_view(), name="api-task-detail"),
+    path("api/projects/", ProjectApiView.as_view(), name="api-project-list"),
+    path(
+        "api/projects/<int:pk>/", ProjectApiView.as_view(), name="api-project-detail"
+    ),
+    path("api/workers/", WorkerApiView.as_view(), name="api-worker-list"),
+    path(
+        "api/workers/<int:pk>/", WorkerApiView.as_view(), name="api-worker-detail"
+    ),
+    path("api/positions/", PositionApiView.as_view(), name="api-position-list"),
+    path(
+        "api/positions/<int:pk>/",
+        PositionApiView.as_view(),
+        name="api-position-detail"
+    ),
+    path("api/task-types/", TaskTypeApiView.as_view(), name="api-task-type-list"),
+    path(
+        "api/task-types/<int:pk>/",
+        TaskTypeApiView.as_view(),
+        name="api-task-type-detail"
+    ),
 ]
 
 app_name = "core"
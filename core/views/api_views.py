@@ -0,0 +1,386 @@
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+from django.forms import BaseForm, model_to_dict, modelform_factory
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.urls import reverse
+from django.views import generic
+
+from core.deletion import start_deletion
+from core.filters import (
+    FilterSet,
+    ProjectFilterSet,
+    TaskFilterSet,
+    WorkerFilterSet
+)
+from core.forms.create_update_forms import (
+    TaskForm,
+    WorkerCreationForm,
+    WorkerUpdateForm
+)
+from core.models import Position, Project, Task, TaskType, Worker
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, errors: dict) -> None:
+        super().__init__(errors)
+        self.status = status
+        self.errors = errors
+
+
+class ApiResourceView(generic.View):
+    """
+    Base JSON endpoint for a single model.
+
+    Lists support ``fields=``/``fields[<type>]=`` sparse fieldsets,
+    ``include=`` compound documents (one query per relation) and keyset
+    pagination through an opaque ``cursor`` over (ordering_field, pk).
+    The search forms' ``sort=`` is rejected: the cursor fixes the order.
+    """
+
+    model: type[Model]
+    resource_type: str
+    fields: tuple[str, ...]
+    ordering_field: str
+    includes: dict[str, str] = {}
+    filterset_class: type[FilterSet] | None = None
+    create_form_class: type[BaseForm] | None = None
+    update_form_class: type[BaseForm] | None = None
+    # Models that core.deletion removes batch by batch; objects marked
+    # is_deleting are hidden until it is done
+    deleted_in_background = False
+    default_page_size = 20
+    max_page_size = 100
+    http_method_names = ["get", "post", "patch", "delete"]
+
+    def dispatch(self, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        if not request.user.is_authenticated:
+            return JsonResponse(
+                {"errors": {"detail": ["Authentication required."]}}, status=401
+            )
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        except ApiError as error:
+            return JsonResponse({"errors": error.errors}, status=error.status)
+
+    def get_queryset(self) -> QuerySet:
+        queryset = self.model.objects.all()
+        if self.deleted_in_background:
+            queryset = queryset.filter(is_deleting=False)
+        return queryset
+
+    def get(self, request: HttpRequest, pk: int | None = None) -> JsonResponse:
+        fieldset = self.get_fieldset(type(self))
+        include = self.get_include()
+        queryset = self.get_queryset().only(
+            *self.get_loaded_fields(fieldset, include)
+        )
+        if pk is not None:
+            obj = self.get_object(queryset)
+            return JsonResponse(
+                {
+                    "data": self.serialize(type(self), obj, fieldset),
+                    "included": self.get_included([obj], include),
+                }
+            )
+
+        objects, next_cursor = self.paginate(self.filter_queryset(queryset))
+        return JsonResponse(
+            {
+                "data": [self.serialize(type(self), obj, fieldset) for obj in objects],
+                "included": self.get_included(objects, include),
+                "next": next_cursor,
+            }
+        )
+
+    def post(self, request: HttpRequest, pk: int | None = None) -> HttpResponse:
+        if pk is not None or self.create_form_class is None:
+            return self.http_method_not_allowed(request)
+        self.check_write_permission(None)
+        form = self.create_form_class(data=self.get_json_body())
+        return self.save_form(form, status=201)
+
+    def patch(self, request: HttpRequest, pk: int | None = None) -> HttpResponse:
+        if pk is None or self.update_form_class is None:
+            return self.http_method_not_allowed(request)
+        obj = self.get_object(self.get_queryset())
+        self.check_write_permission(obj)
+        data = model_to_dict(obj, fields=list(self.update_form_class.base_fields))
+        data.update(self.get_json_body())
+        form = self.update_form_class(data=data, instance=obj)
+        return self.save_form(form, status=200)
+
+    def delete(self, request: HttpRequest, pk: int | None = None) -> HttpResponse:
+        if pk is None:
+            return self.http_method_not_allowed(request)
+        if self.deleted_in_background:
+            return self.delete_in_background()
+        obj = self.get_object(self.get_queryset())
+        self.check_write_permission(obj)
+        obj.delete()
+        return HttpResponse(status=204)
+
+    def delete_in_background(self) -> JsonResponse:
+        """Hands the object to core.deletion; 202 with its progress page"""
+
+        obj = self.get_object(self.model.objects.all())
+        self.check_write_permission(obj)
+        if obj.is_deleting:
+            raise ApiError(409, {"detail": ["Deletion already in progress."]})
+        deletion = start_deletion(obj)
+        url = reverse("core:deletion-detail", args=(deletion.pk,))
+        response = JsonResponse({"data": {"deletion": url}}, status=202)
+        response["Location"] = url
+        return response
+
+    def has_write_permission(self, obj: Model | None) -> bool:
+        return self.request.user.is_superuser
+
+    def check_write_permission(self, obj: Model | None) -> None:
+        if not self.has_write_permission(obj):
+            raise ApiError(403, {"detail": ["Permission denied."]})
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        if "sort" in self.request.GET:
+            raise ApiError(
+                400,
+                {
+                    "sort": [
+                        "Not supported; lists are ordered by "
+                        f"{self.ordering_field}, then id."
+                    ]
+                },
+            )
+        if self.filterset_class is None:
+            return queryset
+        filterset = self.filterset_class(self.request.GET, user=self.request.user)
+        if not filterset.is_valid():
+            raise ApiError(400, filterset.errors.get_json_data())
+        return filterset.filter(queryset)
+
+    def get_object(self, queryset: QuerySet) -> Model:
+        try:
+            return queryset.get(pk=self.kwargs["pk"])
+        except self.model.DoesNotExist:
+            raise ApiError(404, {"detail": ["Not found."]})
+
+    def get_json_body(self) -> dict:
+        try:
+            data = json.loads(self.request.body or b"{}")
+        except ValueError:
+            raise ApiError(400, {"detail": ["Malformed JSON body."]})
+        if not isinstance(data, dict):
+            raise ApiError(400, {"detail": ["JSON body must be an object."]})
+        return data
+
+    def save_form(self, form: BaseForm, status: int) -> JsonResponse:
+        if not form.is_valid():
+            raise ApiError(400, form.errors.get_json_data())
+        obj = self.perform_save(form)
+        return JsonResponse(
+            {"data": self.serialize(type(self), obj, self.fields)}, status=status
+        )
+
+    def perform_save(self, form: BaseForm) -> Model:
+        return form.save()
+
+    def get_fieldset(self, resource: type["ApiResourceView"]) -> list[str]:
+        key = f"fields[{resource.resource_type}]"
+        raw = self.request.GET.get(key)
+        if raw is None and resource is type(self):
+            key = "fields"
+            raw = self.request.GET.get(key)
+        if not raw:
+            return list(resource.fields)
+
+        requested = [name.strip() for name in raw.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(resource.fields))
+        if unknown:
+            raise ApiError(400, {key: [f"Unknown fields: {', '.join(unknown)}."]})
+        return ["id"] + [name for name in requested if name != "id"]
+
+    def get_include(self) -> list[str]:
+        raw = self.request.GET.get("include", "")
+        requested = [name.strip() for name in raw.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(self.includes))
+        if unknown:
+            raise ApiError(
+                400, {"include": [f"Unknown relations: {', '.join(unknown)}."]}
+            )
+        return list(dict.fromkeys(requested))
+
+    def get_loaded_fields(self, fieldset: list[str], include: list[str]) -> set[str]:
+        return {*fieldset, *include, self.ordering_field}
+
+    def get_included(self, objects: list[Model], include: list[str]) -> dict:
+        included = {}
+        for relation in include:
+            resource = API_RESOURCES[self.includes[relation]]
+            attname = self.model._meta.get_field(relation).attname
+            bucket = included.setdefault(resource.resource_type, {})
+            missing = {getattr(obj, attname) for obj in objects} - {None}
+            missing -= bucket.keys()
+            if not missing:
+                continue
+
+            fieldset = self.get_fieldset(resource)
+            related_objects = resource().get_queryset().filter(pk__in=missing)
+            for related in related_objects.only(*fieldset):
+                bucket[related.pk] = self.serialize(resource, related, fieldset)
+
+        return {
+            resource_type: sorted(bucket.values(), key=lambda item: item["id"])
+            for resource_type, bucket in included.items()
+        }
+
+    def paginate(self, queryset: QuerySet) -> tuple[list[Model], str | None]:
+        limit = self.get_page_size()
+        ordering_field = self.ordering_field
+        queryset = queryset.order_by(ordering_field, "pk")
+
+        cursor = self.request.GET.get("cursor")
+        if cursor:
+            value, pk = self.decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(**{f"{ordering_field}__gt": value})
+                | Q(**{ordering_field: value, "pk__gt": pk})
+            )
+
+        objects = list(queryset[:limit + 1])
+        if len(objects) <= limit:
+            return objects, None
+        objects = objects[:limit]
+        return objects, self.encode_cursor(objects[-1])
+
+    def get_page_size(self) -> int:
+        raw = self.request.GET.get("limit")
+        if raw is None:
+            return self.default_page_size
+        try:
+            limit = int(raw)
+        except ValueError:
+            raise ApiError(400, {"limit": ["Enter a whole number."]})
+        return max(1, min(limit, self.max_page_size))
+
+    def encode_cursor(self, obj: Model) -> str:
+        field = self.model._meta.get_field(self.ordering_field)
+        payload = json.dumps([field.value_to_string(obj), obj.pk])
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> tuple:
+        field = self.model._meta.get_field(self.ordering_field)
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return field.to_python(value), int(pk)
+        except (binascii.Error, ValueError, TypeError, ValidationError):
+            raise ApiError(400, {"cursor": ["Invalid cursor."]})
+
+    @staticmethod
+    def serialize(
+        resource: type["ApiResourceView"], obj: Model, fieldset: list[str]
+    ) -> dict:
+        opts = resource.model._meta
+        return {
+            name: getattr(obj, opts.get_field(name).attname) for name in fieldset
+        }
+
+
+class TaskApiView(ApiResourceView):
+    """JSON endpoint for tasks filtered with TaskFilterSet"""
+
+    model = Task
+    resource_type = "tasks"
+    fields = (
+        "id", "name", "description",
+        "deadline", "priority", "is_completed",
+        "task_type", "project", "assignee", "created_by"
+    )
+    ordering_field = "deadline"
+    includes = {
+        "task_type": "task_types",
+        "project": "projects",
+        "assignee": "workers",
+        "created_by": "workers",
+    }
+    filterset_class = TaskFilterSet
+    create_form_class = TaskForm
+    update_form_class = TaskForm
+
+    def has_write_permission(self, obj: Task | None) -> bool:
+        return (
+            obj is None
+            or self.request.user.is_superuser
+            or obj.created_by_id == self.request.user.id
+        )
+
+    def perform_save(self, form: BaseForm) -> Task:
+        if form.instance.pk is None:
+            form.instance.created_by = self.request.user
+        return form.save()
+
+
+class ProjectApiView(ApiResourceView):
+    """JSON endpoint for projects filtered with ProjectFilterSet"""
+
+    model = Project
+    resource_type = "projects"
+    fields = ("id", "name", "description")
+    ordering_field = "name"
+    filterset_class = ProjectFilterSet
+    create_form_class = modelform_factory(Project, fields=("name", "description"))
+    update_form_class = create_form_class
+    deleted_in_background = True
+
+
+class WorkerApiView(ApiResourceView):
+    """JSON endpoint for workers filtered with WorkerFilterSet"""
+
+    model = Worker
+    resource_type = "workers"
+    fields = (
+        "id", "username", "first_name",
+        "last_name", "email", "position", "project"
+    )
+    ordering_field = "username"
+    includes = {"position": "positions", "project": "projects"}
+    filterset_class = WorkerFilterSet
+    create_form_class = WorkerCreationForm
+    update_form_class = WorkerUpdateForm
+    deleted_in_background = True
+
+
+class PositionApiView(ApiResourceView):
+    """JSON endpoint for positions"""
+
+    model = Position
+    resource_type = "positions"
+    fields = ("id", "name")
+    ordering_field = "name"
+    create_form_class = modelform_factory(Position, fields=("name",))
+    update_form_class = create_form_class
+
+
+class TaskTypeApiView(ApiResourceView):
+    """JSON endpoint for task types"""
+
+    model = TaskType
+    resource_type = "task_types"
+    fields = ("id", "name")
+    ordering_field = "name"
+    create_form_class = modelform_factory(TaskType, fields=("name",))
+    update_form_class = create_form_class
+
+
+API_RESOURCES = {
+    view.resource_type: view
+    for view in (
+        TaskApiView,
+        ProjectApiView,
+        WorkerApiView,
+        PositionApiView,
+        TaskTypeApiView,
+    )
+}
@@ -0,0 +1,15 @@
+from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.views import generic
+
+from core.models import Deletion
+
+
+class DeletionDetailView(LoginRequiredMixin, UserPassesTestMixin, generic.DetailView):
+    """Displays the progress of a project or worker deletion to admins"""
+
+    model = Deletion
+    context_object_name = "deletion"
+    template_name = "core/deletion_detail.html"
+
+    def test_func(self) -> bool:
+        return self.request.user.is_superuser
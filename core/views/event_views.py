@@ -0,0 +1,43 @@
+import json
+from collections.abc import AsyncIterator
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+
+from core.events import Subscription, get_broker, project_channel, streams_events
+
+
+async def task_events(request: HttpRequest) -> HttpResponse:
+    """Streams task events for the user's project as Server-Sent Events"""
+
+    if not streams_events(request):
+        # 204 tells EventSource clients to stop reconnecting.
+        return HttpResponse(status=204)
+    user = await request.auser()
+    if not user.is_authenticated:
+        return HttpResponse(status=401)
+    if user.project_id is None:
+        return HttpResponse(status=204)
+
+    subscription = get_broker().subscribe(project_channel(user.project_id))
+    response = StreamingHttpResponse(
+        stream_events(subscription), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+async def stream_events(subscription: Subscription) -> AsyncIterator[str]:
+    try:
+        yield "retry: 5000\n\n"
+        while True:
+            event = await subscription.get(timeout=settings.TASK_EVENTS_KEEPALIVE)
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            data = json.dumps(event["task"], cls=DjangoJSONEncoder)
+            yield f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
+    finally:
+        subscription.close()
@@ -1,18 +1,29 @@
+from django.db.models import Sum
+from django.db.models.functions import Coalesce
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 
-from core.models import Project, Task, Worker
+from core.models import Project, ProjectStats, Worker
+from core.replica import replica_reads
 
 
+@replica_reads
 def index(request: HttpRequest) -> HttpResponse:
     """Renders the home page with counts of projects, tasks and workers"""
-    num_projects = Project.objects.count()
-    num_tasks = Task.objects.count()
-    num_workers = Worker.objects.count()
+    # Projects and workers being deleted are gone as far as users can tell
+    num_projects = Project.objects.filter(is_deleting=False).count()
+    num_workers = Worker.objects.filter(is_deleting=False).count()
+    totals = ProjectStats.objects.filter(project__is_deleting=False).aggregate(
+        open=Coalesce(Sum("open_count"), 0),
+        overdue=Coalesce(Sum("overdue_count"), 0),
+        completed=Coalesce(Sum("completed_count"), 0)
+    )
 
     context = {
         "num_projects": num_projects,
-        "num_tasks": num_tasks,
+        "num_tasks": sum(totals.values()),
+        "num_completed_tasks": totals["completed"],
+        "num_overdue_tasks": totals["overdue"],
         "num_workers": num_workers
     }
 
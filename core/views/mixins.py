@@ -0,0 +1,129 @@
+from django.core.paginator import Page
+from django.db.models import QuerySet
+from django.http import HttpResponse, HttpResponseRedirect
+from django.urls import reverse
+from django.utils.cache import patch_vary_headers
+from django.utils.functional import cached_property
+
+from core import replica, result_cache
+from core.deletion import start_deletion
+from core.filters import FilterSet
+
+FRAGMENT_HEADER = "X-Fragment"
+
+
+class FragmentResponseMixin:
+    """
+    Renders only fragment_template_name when the request carries the
+    X-Fragment header, so filtering and pagination can swap the results
+    without reloading the whole page.
+    """
+
+    fragment_template_name: str | None = None
+
+    def is_fragment_request(self) -> bool:
+        return (
+            self.fragment_template_name is not None
+            and FRAGMENT_HEADER in self.request.headers
+        )
+
+    def get_template_names(self) -> list[str]:
+        if self.is_fragment_request():
+            return [self.fragment_template_name]
+        return super().get_template_names()
+
+    def render_to_response(self, context: dict, **response_kwargs) -> HttpResponse:
+        response = super().render_to_response(context, **response_kwargs)
+        patch_vary_headers(response, (FRAGMENT_HEADER,))
+        return response
+
+
+class FilterSetMixin:
+    """Filters the queryset with filterset_class built from the query string"""
+
+    filterset_class: type[FilterSet]
+
+    @cached_property
+    def filterset(self) -> FilterSet:
+        user = getattr(self.request, "user", None)
+        return self.filterset_class(self.request.GET, user=user)
+
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
+        # Invalid search input shows the unfiltered list, like an empty form
+        if not self.filterset.is_valid():
+            return self.filterset.order(queryset)
+        return self.filterset.filter(queryset)
+
+
+class CachedPageMixin:
+    """
+    Serves the pages of a FilterSetMixin list view from the result cache.
+    The cache holds the primary keys and total count of each page, so a hit
+    costs one pk__in query instead of the filtered, sorted scan and COUNT(*).
+    """
+
+    def is_page_cacheable(self) -> bool:
+        return (
+            result_cache.get_cache() is not None
+            and self.filterset.is_valid()
+            and not self.filterset.depends_on_time()
+        )
+
+    def paginate_queryset(self, queryset: QuerySet, page_size: int) -> tuple:
+        if not self.is_page_cacheable():
+            return super().paginate_queryset(queryset, page_size)
+
+        page_number = (
+            self.kwargs.get(self.page_kwarg)
+            or self.request.GET.get(self.page_kwarg)
+            or 1
+        )
+        key = result_cache.page_key(
+            queryset.model,
+            self.filterset.canonical_key(),
+            str(page_number),
+            page_size,
+        )
+        cached = result_cache.get_page(key)
+        if cached is None:
+            paginator, page, object_list, is_paginated = (
+                super().paginate_queryset(queryset, page_size)
+            )
+            # A lagging replica could cache rows older than the generation
+            # in the key, so only pages read from the primary are stored
+            if not replica.reads_from_replica():
+                result_cache.set_page(
+                    key,
+                    result_cache.CachedPage(
+                        paginator.count, [obj.pk for obj in object_list]
+                    ),
+                )
+            return paginator, page, object_list, is_paginated
+
+        paginator = self.get_paginator(
+            queryset,
+            page_size,
+            orphans=self.get_paginate_orphans(),
+            allow_empty_first_page=self.get_allow_empty(),
+        )
+        paginator.count = cached.count
+        number = (
+            paginator.num_pages if page_number == "last" else page_number
+        )
+        rows = queryset.in_bulk(cached.pks)
+        object_list = [rows[pk] for pk in cached.pks if pk in rows]
+        page = Page(object_list, paginator.validate_number(number), paginator)
+        return paginator, page, object_list, page.has_other_pages()
+
+
+class BackgroundDeletionMixin:
+    """
+    Makes a DeleteView hand its object to core.deletion and redirect to
+    the progress page instead of deleting everything within the request.
+    """
+
+    def form_valid(self, form) -> HttpResponseRedirect:
+        deletion = start_deletion(self.object)
+        return HttpResponseRedirect(
+            reverse("core:deletion-detail", args=(deletion.pk,))
+        )
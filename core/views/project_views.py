@@ -1,38 +1,117 @@
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.db.models import Count, QuerySet
+from django.db.models import Count, F, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+from django.core.paginator import InvalidPage
+from django.http import Http404
 from django.urls import reverse_lazy
+from django.utils import timezone
 from django.views import generic
 
+from core import board
+from core.filters import ProjectFilterSet
 from core.forms.search_forms import ProjectSearchForm
-from core.models import Project
+from core.models import Project, Worker
+from core.views.mixins import (
+    BackgroundDeletionMixin,
+    FilterSetMixin,
+    FragmentResponseMixin,
+)
 
 
-class ProjectListView(LoginRequiredMixin, generic.ListView):
+class ProjectListView(LoginRequiredMixin, FilterSetMixin, generic.ListView):
     """Displays a paginated list of projects with filtering support"""
 
     model = Project
     context_object_name = "project_list"
     template_name = "core/project_list.html"
+    filterset_class = ProjectFilterSet
     paginate_by = 8
+    replica_reads = True
 
     def get_queryset(self) -> QuerySet:
         queryset = (
             super()
             .get_queryset()
+            .filter(is_deleting=False)
+            .select_related("stats")
             .annotate(
-                workers_count=Count("workers", distinct=True),
-                tasks_count=Count("tasks", distinct=True)
+                # A subquery per row of the page instead of a GROUP BY over
+                # every project, so the sort can walk an index
+                workers_count=Coalesce(
+                    Subquery(
+                        Worker.objects.filter(project=OuterRef("pk"))
+                        .order_by()
+                        .values("project")
+                        .annotate(count=Count("pk"))
+                        .values("count")
+                    ),
+                    0,
+                ),
+                tasks_count=Coalesce(
+                    F("stats__open_count")
+                    + F("stats__overdue_count")
+                    + F("stats__completed_count"),
+                    0
+                )
             )
         )
-        form = ProjectSearchForm(self.request.GET)
-        if form.is_valid():
-            queryset = queryset.filter(name__icontains=form.cleaned_data["name"])
-        return queryset
+        return self.filter_queryset(queryset)
 
     def get_context_data(self, *, object_list=None, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
-        name = self.request.GET.get("name", "")
-        context["search_form"] = ProjectSearchForm(initial={"name": name})
+        context["search_form"] = ProjectSearchForm(
+            initial={
+                "name": self.request.GET.get("name", ""),
+                "sort": self.request.GET.get("sort", ""),
+            }
+        )
+        return context
+
+
+class ProjectBoardView(LoginRequiredMixin, FragmentResponseMixin, generic.DetailView):
+    """
+    Displays a project's tasks as a kanban board. Every column shows its
+    first tasks; "more" links load the next page of a single column.
+    """
+
+    queryset = Project.objects.filter(is_deleting=False)
+    context_object_name = "project"
+    template_name = "core/project_board.html"
+    fragment_template_name = "includes/board_cards.html"
+    per_column = 10
+
+    def is_fragment_request(self) -> bool:
+        # The fragment is a single column; without one, render the whole board
+        return super().is_fragment_request() and "column" in self.request.GET
+
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        context["now"] = now = timezone.now()
+        key = self.request.GET.get("column")
+        if key is not None:
+            if key not in board.COLUMNS:
+                raise Http404("Unknown column.")
+            try:
+                context["column"] = board.load_column_page(
+                    self.object,
+                    key,
+                    now,
+                    self.request.GET.get("page", 1),
+                    self.per_column,
+                )
+            except InvalidPage as error:
+                raise Http404(str(error))
+        if self.is_fragment_request():
+            return context
+
+        columns = board.load_columns(self.object, now, self.per_column)
+        if key is not None:
+            # Without JavaScript a "more" link opens the board at that page
+            columns = [
+                context["column"] if column.key == key else column
+                for column in columns
+            ]
+        context["columns"] = columns
         return context
 
 
@@ -62,8 +141,13 @@ class ProjectUpdateView(LoginRequiredMixin, UserPassesTestMixin, generic.UpdateV
         return self.request.user.is_superuser
 
 
-class ProjectDeleteView(LoginRequiredMixin, UserPassesTestMixin, generic.DeleteView):
-    """Allows admins to delete projects"""
+class ProjectDeleteView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    BackgroundDeletionMixin,
+    generic.DeleteView,
+):
+    """Allows admins to delete projects along with their tasks"""
 
     model = Project
     context_object_name = "project"
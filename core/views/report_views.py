@@ -0,0 +1,36 @@
+from datetime import timedelta
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.utils import timezone
+from django.views import generic
+
+from core.forms.search_forms import ReportSearchForm
+from core.rollups import daily_trend, overdue_by_project
+
+
+class ReportView(LoginRequiredMixin, generic.TemplateView):
+    """Displays daily task trends read from the rollup tables only"""
+
+    template_name = "core/reports.html"
+
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        form = ReportSearchForm(self.request.GET)
+        filters = form.cleaned_data if form.is_valid() else {}
+        project = filters.get("project")
+        end = timezone.localdate() + timedelta(days=1)
+        start = end - timedelta(days=filters.get("days") or 30)
+
+        trend = daily_trend(start, end, project)
+        context["trend"] = trend
+        context["peak"] = max(
+            [max(day.created, day.completed, day.overdue) for day in trend] + [1]
+        )
+        context["overdue_projects"] = overdue_by_project(start, end, project)
+        context["search_form"] = ReportSearchForm(
+            initial={
+                "project": self.request.GET.get("project", ""),
+                "days": self.request.GET.get("days", ""),
+            }
+        )
+        return context
@@ -1,61 +1,87 @@
+import csv
+from datetime import timedelta
+from itertools import chain
+
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.db.models import QuerySet
-from django.http import HttpResponse, HttpRequest, HttpResponseRedirect
+from django.http import (
+    HttpResponse,
+    HttpRequest,
+    HttpResponseRedirect,
+    StreamingHttpResponse
+)
 from django.shortcuts import get_object_or_404
 from django.urls import reverse_lazy
 from django.utils import timezone
 from django.views import generic
 
+from core.events import publish_task_event, streams_events
+from core.filters import TaskFilterSet
 from core.forms.create_update_forms import TaskForm
-from core.forms.search_forms import TaskSearchForm
-from core.models import Task
+from core.forms.search_forms import CalendarSearchForm, TaskSearchForm
+from core.models import ArchivedTask, Task
+from core.result_cache import bump_generation
+from core.rollups import record_task_events
+from core.stats import apply_task_change, task_state
+from core.task_calendar import (
+    WEEKDAYS,
+    invalidate_months,
+    month_counts,
+    month_weeks,
+    week_start,
+    week_tasks,
+)
+from core.views.mixins import (
+    CachedPageMixin,
+    FilterSetMixin,
+    FragmentResponseMixin,
+)
 
 
-class TaskListView(LoginRequiredMixin, generic.ListView):
+class TaskListView(
+    LoginRequiredMixin,
+    FilterSetMixin,
+    CachedPageMixin,
+    FragmentResponseMixin,
+    generic.ListView,
+):
     """Displays a paginated list of tasks with filtering support"""
 
     model = Task
     context_object_name = "task_list"
     template_name = "core/task_list.html"
+    fragment_template_name = "includes/task_results.html"
+    filterset_class = TaskFilterSet
     paginate_by = 4
+    replica_reads = True
 
     def get_queryset(self) -> QuerySet:
         queryset = (
             super().get_queryset().select_related("task_type", "project", "assignee")
         )
-        form = TaskSearchForm(self.request.GET)
-        if not form.is_valid():
-            return queryset
-
-        data = form.cleaned_data
-        if data["assigned_to_me"] == "yes":
-            queryset = queryset.filter(assignee=self.request.user)
-        if data["assigned_to_me"] == "no":
-            queryset = queryset.exclude(assignee=self.request.user)
-        if data["created_by_me"] == "yes":
-            queryset = queryset.filter(created_by=self.request.user)
-        if data["created_by_me"] == "no":
-            queryset = queryset.exclude(created_by=self.request.user)
-        if data["status"] == "done":
-            queryset = queryset.filter(is_completed=True)
-        if data["status"] == "not_done":
-            queryset = queryset.filter(is_completed=False)
-        if data["name"]:
-            queryset = queryset.filter(name__icontains=data["name"])
-        if data["priority"]:
-            queryset = queryset.filter(priority=data["priority"])
-        if data["task_type"]:
-            queryset = queryset.filter(task_type=data["task_type"])
-        if data["project"]:
-            queryset = queryset.filter(project=data["project"])
-
-        return queryset
+        if self.filterset.includes_archived():
+            return self.filterset.with_archive(
+                queryset,
+                ArchivedTask.objects.select_related("task_type", "project", "assignee"),
+            )
+        return self.filter_queryset(queryset)
+
+    def is_page_cacheable(self) -> bool:
+        # Cached pages are primary keys of live tasks only
+        return (
+            super().is_page_cacheable() and not self.filterset.includes_archived()
+        )
 
     def get_context_data(self, *, object_list=None, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
         context["now"] = timezone.now()
+        if self.is_fragment_request():
+            return context
+
+        context["live_updates"] = streams_events(self.request)
         context["search_form"] = TaskSearchForm(
             initial={
                 "name": self.request.GET.get("name", ""),
@@ -63,11 +89,154 @@ class TaskListView(LoginRequiredMixin, generic.ListView):
                 "assigned_to_me": self.request.GET.get("assigned_to_me", ""),
                 "created_by_me": self.request.GET.get("created_by_me", ""),
                 "priority": self.request.GET.get("priority", ""),
+                "sort": self.request.GET.get("sort", ""),
                 "task_type": self.request.GET.get("task_type", ""),
                 "project": self.request.GET.get("project", ""),
+                "include_archived": self.request.GET.get("include_archived", ""),
+            }
+        )
+
+        return context
+
+
+class CalendarMixin:
+    """Reads the project and assignee filters of the calendar views"""
+
+    def get_filters(self) -> dict:
+        form = CalendarSearchForm(self.request.GET)
+        return form.cleaned_data if form.is_valid() else {}
+
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        context["search_form"] = CalendarSearchForm(
+            initial={
+                "project": self.request.GET.get("project", ""),
+                "assignee": self.request.GET.get("assignee", ""),
+                "month": self.request.GET.get("month", ""),
+                "week": self.request.GET.get("week", ""),
             }
         )
+        context["weekdays"] = WEEKDAYS
+        return context
+
+
+class TaskCalendarMonthView(LoginRequiredMixin, CalendarMixin, generic.TemplateView):
+    """Displays how many tasks are due on each day of a month"""
+
+    template_name = "core/task_calendar_month.html"
+
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        filters = self.get_filters()
+        month = (filters.get("month") or timezone.localdate()).replace(day=1)
+        counts = month_counts(month, filters.get("project"), filters.get("assignee"))
+        context["month"] = month
+        context["weeks"] = [
+            [(day, counts.get(day)) for day in week] for week in month_weeks(month)
+        ]
+        context["previous_month"] = (month - timedelta(days=1)).replace(day=1)
+        context["next_month"] = (month + timedelta(days=31)).replace(day=1)
+        return context
+
+
+class TaskCalendarWeekView(LoginRequiredMixin, CalendarMixin, generic.TemplateView):
+    """Displays the tasks due on each day of a week"""
+
+    template_name = "core/task_calendar_week.html"
+
+    def get_context_data(self, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        filters = self.get_filters()
+        monday = week_start(filters.get("week") or timezone.localdate())
+        context["week"] = monday
+        context["days"] = week_tasks(
+            monday, filters.get("project"), filters.get("assignee")
+        )
+        context["previous_week"] = monday - timedelta(days=7)
+        context["next_week"] = monday + timedelta(days=7)
+        return context
+
+
+class EchoBuffer:
+    """File-like object handing every row csv.writer writes straight back"""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class TaskExportView(LoginRequiredMixin, FilterSetMixin, generic.View):
+    """Streams the tasks matching the list filters as a CSV file"""
+
+    filterset_class = TaskFilterSet
+    columns = {
+        "id": "ID",
+        "name": "Name",
+        "deadline": "Deadline",
+        "priority": "Priority",
+        "is_completed": "Completed",
+        "task_type__name": "Task type",
+        "project__name": "Project",
+        "assignee__username": "Assignee",
+        "created_by__username": "Created by",
+    }
+
+    def get(self, request: HttpRequest) -> StreamingHttpResponse:
+        if self.filterset.includes_archived():
+            tasks = self.filterset.with_archive(
+                Task.objects.all(), ArchivedTask.objects.all()
+            )
+        else:
+            tasks = self.filter_queryset(Task.objects.all())
+        rows = tasks.values_list(*self.columns).iterator(chunk_size=2000)
+        writer = csv.writer(EchoBuffer())
+        response = StreamingHttpResponse(
+            (
+                writer.writerow(row)
+                for row in chain(
+                    [self.columns.values()], (self.format_row(row) for row in rows)
+                )
+            ),
+            content_type="text/csv",
+        )
+        response["Content-Disposition"] = 'attachment; filename="tasks.csv"'
+        return response
+
+    @staticmethod
+    def format_row(row: tuple) -> list:
+        row = list(row)
+        row[2] = timezone.localtime(row[2]).strftime("%Y-%m-%d %H:%M")
+        row[3] = Task.Priority(row[3]).label
+        row[4] = "yes" if row[4] else "no"
+        # Spreadsheet apps run cells starting with these characters as formulas
+        return [
+            f"'{value}" if isinstance(value, str) and value[:1] in "=+-@" else value
+            for value in row
+        ]
+
+
+class MyOverdueTaskListView(LoginRequiredMixin, generic.ListView):
+    """Displays unfinished tasks assigned to the user whose deadline has passed"""
+
+    model = Task
+    context_object_name = "task_list"
+    template_name = "core/my_overdue_tasks.html"
+    paginate_by = 4
+
+    def get_queryset(self) -> QuerySet:
+        # Matches the task_open_assignee_dl_idx partial index exactly.
+        return (
+            Task.objects.filter(
+                assignee=self.request.user,
+                is_completed=False,
+                deadline__lt=timezone.now()
+            )
+            .select_related("task_type", "project", "assignee")
+            .order_by("deadline")
+        )
 
+    def get_context_data(self, *, object_list=None, **kwargs) -> dict:
+        context = super().get_context_data(**kwargs)
+        context["now"] = timezone.now()
         return context
 
 
@@ -128,6 +297,15 @@ def task_mark_completed(request: HttpRequest, pk: int) -> HttpResponseRedirect:
     ):
         raise PermissionDenied
     if request.method == "POST":
+        previous = task_state(task)
         task.is_completed = True
-        Task.objects.filter(pk=pk).update(is_completed=True)
+        with transaction.atomic():
+            if Task.objects.filter(pk=pk, is_completed=False).update(
+                is_completed=True
+            ):
+                apply_task_change(previous, task_state(task))
+                record_task_events(task, previous)
+                bump_generation(Task)
+                invalidate_months(previous)
+                publish_task_event(task, "task.completed")
     return HttpResponseRedirect(request.META.get("HTTP_REFERER", "/"))
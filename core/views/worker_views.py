@@ -1,41 +1,48 @@
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.db.models import QuerySet, Count
+from django.db.models import Count, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
 from django.urls import reverse_lazy
 from django.views import generic
 
+from core.filters import WorkerFilterSet
 from core.forms.create_update_forms import WorkerUpdateForm, WorkerCreationForm
 from core.forms.search_forms import WorkerSearchForm
-from core.models import Worker
+from core.models import Task, Worker
+from core.views.mixins import BackgroundDeletionMixin, FilterSetMixin
 
 
-class WorkerListView(LoginRequiredMixin, generic.ListView):
+class WorkerListView(LoginRequiredMixin, FilterSetMixin, generic.ListView):
     """Displays a paginated list of workers with filtering support"""
 
     model = Worker
     context_object_name = "worker_list"
     template_name = "core/worker_list.html"
+    filterset_class = WorkerFilterSet
     paginate_by = 8
+    replica_reads = True
 
     def get_queryset(self) -> QuerySet:
         queryset = (
             super()
             .get_queryset()
+            .filter(is_deleting=False)
             .select_related("position", "project")
-            .annotate(tasks_count=Count("assigned_tasks", distinct=True))
+            .annotate(
+                # A subquery per row of the page instead of a GROUP BY over
+                # every worker, so the sort can walk an index
+                tasks_count=Coalesce(
+                    Subquery(
+                        Task.objects.filter(assignee=OuterRef("pk"))
+                        .order_by()
+                        .values("assignee")
+                        .annotate(count=Count("pk"))
+                        .values("count")
+                    ),
+                    0,
+                )
+            )
         )
-
-        form = WorkerSearchForm(self.request.GET)
-        if not form.is_valid():
-            return queryset
-
-        data = form.cleaned_data
-        if data["position"]:
-            queryset = queryset.filter(position=data["position"])
-        if data["project"]:
-            queryset = queryset.filter(project=data["project"])
-        if data["username"]:
-            queryset = queryset.filter(username__icontains=data["username"])
-        return queryset
+        return self.filter_queryset(queryset)
 
     def get_context_data(self, *, object_list=None, **kwargs) -> dict:
         context = super().get_context_data(**kwargs)
@@ -44,6 +51,7 @@ class WorkerListView(LoginRequiredMixin, generic.ListView):
                 "position": self.request.GET.get("position", ""),
                 "project": self.request.GET.get("project", ""),
                 "username": self.request.GET.get("username", ""),
+                "sort": self.request.GET.get("sort", ""),
             }
         )
         return context
@@ -62,7 +70,12 @@ class WorkerUpdateView(LoginRequiredMixin, UserPassesTestMixin, generic.UpdateVi
         return self.request.user.is_superuser
 
 
-class WorkerDeleteView(LoginRequiredMixin, UserPassesTestMixin, generic.DeleteView):
+class WorkerDeleteView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    BackgroundDeletionMixin,
+    generic.DeleteView,
+):
     """Allows admins to delete workers"""
     model = Worker
     context_object_name = "worker"
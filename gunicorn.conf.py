@@ -0,0 +1,84 @@
+"""
+Gunicorn configuration for task_manager.
+
+Gunicorn reads this file automatically when started from the project root:
+
+    gunicorn                             # gthread preset
+    GUNICORN_PRESET=uvicorn gunicorn     # ASGI app, with live task updates
+
+Presets:
+- sync: one request per process, 2 * CPU + 1 processes. Cheapest per request,
+  but a slow query blocks the whole worker.
+- gthread: CPU + 1 processes with GUNICORN_THREADS threads each. Threads
+  overlap database I/O and keep idle keep-alive connections off the workers.
+- uvicorn: CPU + 1 event-loop processes serving the ASGI app, so live task
+  updates hold a coroutine instead of a worker. The processes share events
+  through Redis (REDIS_URL); without it live updates stay off unless
+  WEB_CONCURRENCY=1.
+
+The two WSGI presets switch live task updates off: the task list does not
+open the event stream and /tasks/events/ answers 204 at once (see
+core.events.streams_events), so no open page holds a thread.
+
+Overrides: WEB_CONCURRENCY (processes), GUNICORN_THREADS, GUNICORN_KEEPALIVE,
+GUNICORN_MAX_REQUESTS, GUNICORN_TIMEOUT and PORT.
+"""
+
+import multiprocessing
+import os
+
+PRESETS = {
+    "sync": {
+        "worker_class": "sync",
+        "wsgi_app": "task_manager.wsgi:application",
+        "workers": lambda cpus: 2 * cpus + 1,
+        "threads": 1,
+    },
+    "gthread": {
+        "worker_class": "gthread",
+        "wsgi_app": "task_manager.wsgi:application",
+        "workers": lambda cpus: cpus + 1,
+        "threads": 4,
+    },
+    "uvicorn": {
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "wsgi_app": "task_manager.asgi:application",
+        "workers": lambda cpus: cpus + 1,
+        "threads": 1,
+    },
+}
+
+preset_name = os.environ.get("GUNICORN_PRESET", "gthread")
+if preset_name not in PRESETS:
+    raise RuntimeError(
+        f"Unknown GUNICORN_PRESET {preset_name!r}, "
+        f"expected one of: {', '.join(PRESETS)}."
+    )
+preset = PRESETS[preset_name]
+cpus = multiprocessing.cpu_count()
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+wsgi_app = preset["wsgi_app"]
+worker_class = preset["worker_class"]
+workers = int(os.environ.get("WEB_CONCURRENCY", preset["workers"](cpus)))
+threads = int(os.environ.get("GUNICORN_THREADS", preset["threads"]))
+
+# Settings, URLconf and compiled templates are loaded once in the master and
+# shared copy-on-write with every forked worker
+preload_app = True
+
+# Recycle workers to cap slow memory growth; the jitter spreads the restarts
+# so the workers never go down together
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = max_requests // 10
+
+# Only gthread and uvicorn workers keep connections open between requests
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 5))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = timeout
+
+# Worker heartbeats go to tmpfs instead of a possibly slow container disk
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+accesslog = "-"
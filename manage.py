@@ -6,7 +6,12 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "task_manager.settings.prod")
+    default_settings = (
+        "task_manager.settings.test"
+        if sys.argv[1:2] == ["test"]
+        else "task_manager.settings.prod"
+    )
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", default_settings)
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
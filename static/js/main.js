@@ -1,23 +1,115 @@
+// select2 is set up lazily, the first time a dropdown is focused or clicked
+function initSelectField(select, open) {
+    if (!select.classList.contains("select2-hidden-accessible")) {
+        $(select).select2({
+            width: "100%",
+            dropdownAutoWidth: true,
+        });
+    }
+    if (open) {
+        $(select).select2("open");
+    } else {
+        $(select).next(".select2").find(".select2-selection").trigger("focus");
+    }
+}
+
+document.addEventListener("mousedown", function (event) {
+    if (event.target instanceof Element && event.target.matches("select.select-field")) {
+        event.preventDefault();
+        initSelectField(event.target, true);
+    }
+});
+
+document.addEventListener("focusin", function (event) {
+    if (event.target instanceof Element && event.target.matches("select.select-field")) {
+        initSelectField(event.target, false);
+    }
+});
+
 document.addEventListener("DOMContentLoaded", function () {
-    $(".select-field").select2({
-        width: "100%",
-        dropdownAutoWidth: true,
-        dropdownCssClass: "select-dropdown",
-    }).on("select2:open", function () {
-        $(".select-dropdown").css(
-            "color", "black",
-        );
-    });
-    $(".select2-selection").css({
-        "height": "38px",
-        "line-height": "38px",
-        "padding-top": "4px",
-        "padding-right": "15px"
-    });
-    $(".select2-container").css({
-        "margin-right": "15px"
-    });
-    $(".select2-selection__arrow").css({
-        "height": "38px"
+    const notice = document.getElementById("task-events");
+    if (!notice || !window.EventSource) {
+        return;
+    }
+    const counter = notice.querySelector(".task-events-count");
+    const source = new EventSource(notice.dataset.url);
+    let updates = 0;
+    ["task.created", "task.updated", "task.completed"].forEach(function (type) {
+        source.addEventListener(type, function () {
+            updates += 1;
+            counter.textContent = updates;
+            notice.hidden = false;
+        });
     });
 });
+
+// Filtering and pagination on list pages swap only the results fragment
+function loadFragment(container, url, push) {
+    fetch(url, {headers: {"X-Fragment": "results"}, credentials: "same-origin"})
+        .then(function (response) {
+            if (!response.ok) {
+                throw new Error(response.statusText);
+            }
+            return response.text();
+        })
+        .then(function (html) {
+            container.innerHTML = html;
+            if (push) {
+                if (!history.state) {
+                    history.replaceState({fragment: container.id}, "", window.location.href);
+                }
+                history.pushState({fragment: container.id}, "", url);
+            }
+        })
+        .catch(function () {
+            window.location.assign(url);
+        });
+}
+
+document.addEventListener("click", function (event) {
+    const link = event.target.closest("[data-fragment-container] .pagination a");
+    if (link) {
+        event.preventDefault();
+        loadFragment(link.closest("[data-fragment-container]"), link.href, true);
+    }
+});
+
+document.addEventListener("submit", function (event) {
+    const form = event.target;
+    const container = document.getElementById(form.dataset.fragmentTarget || "");
+    if (container) {
+        event.preventDefault();
+        const params = new URLSearchParams(new FormData(form));
+        loadFragment(container, form.action.split("?")[0] + "?" + params, true);
+    }
+});
+
+window.addEventListener("popstate", function (event) {
+    const container = event.state && document.getElementById(event.state.fragment);
+    if (container) {
+        loadFragment(container, window.location.href, false);
+    }
+});
+
+// "Show more" on a board column appends the column's next page in place
+document.addEventListener("click", function (event) {
+    const link = event.target.closest("a[data-board-more]");
+    if (!link) {
+        return;
+    }
+    event.preventDefault();
+    fetch(link.href, {headers: {"X-Fragment": "column"}, credentials: "same-origin"})
+        .then(function (response) {
+            if (!response.ok) {
+                throw new Error(response.statusText);
+            }
+            return response.text();
+        })
+        .then(function (html) {
+            link.insertAdjacentHTML("beforebegin", html);
+            link.remove();
+        })
+        .catch(function () {
+            window.location.assign(link.href);
+        });
+});
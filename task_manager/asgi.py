@@ -11,6 +11,10 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from task_manager.warmup import warm_up_templates
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "task_manager.settings")
 
 application = get_asgi_application()
+
+warm_up_templates()
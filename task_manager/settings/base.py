@@ -33,7 +33,6 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
-    "debug_toolbar",
     "core",
     "crispy_bootstrap5",
     "crispy_forms",
@@ -41,8 +40,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
+    "core.middleware.StaticFilesMiddleware",
+    "core.replica.ReplicaMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -68,6 +67,9 @@ TEMPLATES = [
     },
 ]
 
+# Compile every template in DIRS when a server worker boots (see warmup.py)
+TEMPLATE_WARMUP = False
+
 WSGI_APPLICATION = "task_manager.wsgi.application"
 
 # Password validation
@@ -88,6 +90,30 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing, chosen with the PASSWORD_HASHER_PROFILE environment
+# variable. The first hasher hashes new passwords; the rest still verify
+# existing hashes, which are rehashed with the first one on login.
+_LEGACY_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+PASSWORD_HASHER_PROFILES = {
+    "argon2": [
+        "core.hashers.TunedArgon2PasswordHasher",
+        "django.contrib.auth.hashers.ScryptPasswordHasher",
+        *_LEGACY_HASHERS,
+    ],
+    "scrypt": [
+        "django.contrib.auth.hashers.ScryptPasswordHasher",
+        "core.hashers.TunedArgon2PasswordHasher",
+        *_LEGACY_HASHERS,
+    ],
+}
+PASSWORD_HASHERS = PASSWORD_HASHER_PROFILES[
+    os.environ.get("PASSWORD_HASHER_PROFILE", "argon2")
+]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -106,12 +132,59 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
-STATIC_ROOT = "staticfiles"
+STATIC_ROOT = BASE_DIR / "staticfiles"
+
+# STATIC_ROOT is indexed once per worker; .gz/.br variants written by
+# collectstatic are picked by Accept-Encoding and never compressed per request
+WHITENOISE_AUTOREFRESH = False
+WHITENOISE_USE_FINDERS = False
+WHITENOISE_INDEX_FILE = True
+
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedStaticFilesStorage",
+    },
+}
 
 STATICFILES_DIRS = [
     BASE_DIR / "static"
 ]
 
+STATICFILES_FINDERS = [
+    "django.contrib.staticfiles.finders.FileSystemFinder",
+    "django.contrib.staticfiles.finders.AppDirectoriesFinder",
+    "core.staticfiles.BundleFinder",
+]
+
+# Bundles built by core.staticfiles.BundleFinder, in load order
+STATIC_BUNDLES = {
+    "css/bundle.css": [
+        "vendor/bootstrap-4.5.3.min.css",
+        "vendor/select2-4.0.13.min.css",
+        "css/base.css",
+        "css/index.css",
+        "css/header.css",
+        "css/footer.css",
+        "css/auth.css",
+        "css/cards-grid.css",
+        "css/board.css",
+        "css/calendar.css",
+        "css/reports.css",
+        "css/my_profile.css",
+        "css/forms.css",
+    ],
+    "js/bundle.js": [
+        "vendor/jquery-3.7.1.min.js",
+        "vendor/select2-4.0.13.min.js",
+        "js/main.js",
+    ],
+}
+
+STATIC_BUNDLE_ROOT = BASE_DIR / "build" / "static"
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -121,11 +194,78 @@ INTERNAL_IPS = [
     "127.0.0.1",
 ]
 
+# Read replica (core/replica.py): the list pages and the home page read from
+# the REPLICA_DATABASE_ALIAS database when DATABASES defines it. A browser
+# that wrote reads from the primary for the next REPLICA_STICKY_SECONDS,
+# which has to cover the replication lag.
+DATABASE_ROUTERS = ["core.replica.ReplicaRouter"]
+REPLICA_DATABASE_ALIAS = "replica"
+REPLICA_STICKY_SECONDS = 10
+
 AUTH_USER_MODEL = "core.Worker"
 
+# ModelBackend stays listed so sessions logged in before WorkerBackend
+# still resolve; WorkerBackend answers every login attempt itself
+AUTHENTICATION_BACKENDS = [
+    "core.backends.WorkerBackend",
+    "django.contrib.auth.backends.ModelBackend",
+]
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+}
+
+# Session storage, chosen with the SESSION_BACKEND environment variable:
+# - db: one django_session query per request
+# - cached_db: reads hit the cache, writes go through to the database
+# - cache: cache only
+# - signed_cookies: no server-side storage, the session lives in the cookie
+# cached_db and cache need a cache shared by every worker: a session deleted
+# on logout stays valid in the other workers' per-process caches.
+SESSION_ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "cache": "django.contrib.sessions.backends.cache",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+
+
+def session_engine(caches: dict) -> str:
+    """SESSION_BACKEND, by default cached_db on a shared cache and db otherwise"""
+
+    shared = caches["default"]["BACKEND"] not in (
+        "django.core.cache.backends.locmem.LocMemCache",
+        "django.core.cache.backends.dummy.DummyCache",
+    )
+    default = "cached_db" if shared else "db"
+    return SESSION_ENGINES[os.environ.get("SESSION_BACKEND", default)]
+
+
+SESSION_ENGINE = session_engine(CACHES)
+
+# Primary keys and counts of filtered task pages (core/result_cache.py) and
+# per-day counts of the deadline calendar (core/task_calendar.py).
+# Writes invalidate it through a counter in this cache, so with several
+# worker processes it has to be a cache they all share; None disables it.
+TASK_RESULT_CACHE_ALIAS = "default"
+TASK_RESULT_CACHE_TIMEOUT = 300
+
+# Server processes sharing CACHES: one under runserver. check_result_cache
+# (core/checks.py) rejects a per-process result cache when there are more.
+SERVER_PROCESSES = 1
+
 LOGIN_REDIRECT_URL = "/"
 LOGOUT_REDIRECT_URL = "/"
 
+# Live task updates (Server-Sent Events). LocalBroker only reaches listeners
+# in its own process, so with several SERVER_PROCESSES live updates are off
+# unless core.events.RedisBroker publishes on TASK_EVENTS_REDIS_URL.
+TASK_EVENTS_BROKER = "core.events.LocalBroker"
+TASK_EVENTS_REDIS_URL = None
+TASK_EVENTS_KEEPALIVE = 15
+
 # Add bootstrap
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap5"
 CRISPY_TEMPLATE_PACK = "bootstrap5"
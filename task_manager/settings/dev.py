@@ -5,11 +5,53 @@ DEBUG = False
 
 ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
 
+# Development-only tooling, kept out of the production import graph
+INSTALLED_APPS = [*INSTALLED_APPS, "debug_toolbar"]
+
+_after_static_files = MIDDLEWARE.index("core.middleware.StaticFilesMiddleware") + 1
+MIDDLEWARE = [
+    *MIDDLEWARE[:_after_static_files],
+    "debug_toolbar.middleware.DebugToolbarMiddleware",
+    *MIDDLEWARE[_after_static_files:],
+]
+
+# SQLite set up for several server processes writing to one file
+# (see benchmark_sqlite_writes):
+# - WAL: readers and the writer no longer block each other
+# - synchronous=NORMAL: fsync at WAL checkpoints instead of every commit; a
+#   power loss can drop the last commits but never corrupts the database
+# - mmap_size, cache_size: reads from a 256 MiB memory map of the file and
+#   a 32 MiB page cache per connection
+# - busy_timeout: wait up to 5 s for the write lock instead of failing
+# - IMMEDIATE: transactions take the write lock when they begin. A deferred
+#   one that has already read cannot wait for the lock at its first write,
+#   so it fails at once with "database is locked".
+_SQLITE_OPTIONS = {
+    "init_command": (
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA mmap_size=268435456;"
+        "PRAGMA cache_size=-32768;"
+        "PRAGMA busy_timeout=5000"
+    ),
+    "transaction_mode": "IMMEDIATE",
+}
+
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        "OPTIONS": _SQLITE_OPTIONS,
     }
 }
+
+# A second SQLite file standing in for a read replica (core/replica.py), e.g.
+# a copy of db.sqlite3 that lags behind it until it is copied again
+if os.environ.get("SQLITE_REPLICA"):
+    DATABASES["replica"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / os.environ["SQLITE_REPLICA"],
+        "OPTIONS": _SQLITE_OPTIONS,
+    }
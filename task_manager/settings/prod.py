@@ -1,3 +1,5 @@
+import runpy
+
 from .base import *
 
 # SECURITY WARNING: don't run with debug turned on in production!
@@ -5,6 +7,59 @@ DEBUG = False
 
 ALLOWED_HOSTS = ["task-manager-pxq2.onrender.com", "127.0.0.1", "localhost"]
 
+# Templates are compiled once per worker and kept in memory
+TEMPLATES = [
+    {
+        **TEMPLATES[0],
+        "APP_DIRS": False,
+        "OPTIONS": {
+            **TEMPLATES[0]["OPTIONS"],
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
+        },
+    },
+]
+
+TEMPLATE_WARMUP = True
+
+# Content-hashed file names plus gzip/brotli variants, cached forever by browsers
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
+# Redis shared by all gunicorn workers: the cache of sessions, task pages and
+# the calendar, and the pub/sub of live task updates. Without REDIS_URL the
+# per-process cache stays, the result cache is off (core.E002, see build.sh,
+# rejects enabling it there) and live updates need a single worker.
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+        },
+    }
+    TASK_RESULT_CACHE_ALIAS = "default"
+    TASK_EVENTS_BROKER = "core.events.RedisBroker"
+    TASK_EVENTS_REDIS_URL = os.environ["REDIS_URL"]
+else:
+    TASK_RESULT_CACHE_ALIAS = None
+SESSION_ENGINE = session_engine(CACHES)
+
+# The worker count of the GUNICORN_PRESET (gunicorn.conf.py)
+SERVER_PROCESSES = runpy.run_path(str(BASE_DIR / "gunicorn.conf.py"))["workers"]
+
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 DATABASES = {
@@ -20,3 +75,12 @@ DATABASES = {
         },
     }
 }
+
+# Optional streaming replica that serves the list pages (core/replica.py)
+if os.environ.get("POSTGRES_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "HOST": os.environ["POSTGRES_REPLICA_HOST"],
+        "PORT": os.environ.get("POSTGRES_REPLICA_PORT", os.environ["POSTGRES_DB_PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
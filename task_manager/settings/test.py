@@ -0,0 +1,36 @@
+import os
+
+os.environ.setdefault("SECRET_KEY", "insecure-test-secret-key")
+
+from .base import *  # noqa: E402
+
+# Passwords in tests protect nothing; a slow hasher only slows the suite down
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# One process, so its local cache is the one every request sees
+SESSION_ENGINE = SESSION_ENGINES["cached_db"]
+SILENCED_SYSTEM_CHECKS = ["core.W001"]
+
+# In-memory database whose tables are created straight from the models;
+# `manage.py test --parallel` clones it once per worker process.
+# core/tests/test_migrations.py keeps the migrations in step with the models.
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    },
+    # Created only for test cases that list it in their databases
+    "replica": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    },
+}
+MIGRATION_MODULES = {app.rsplit(".", 1)[-1]: None for app in INSTALLED_APPS}
+
+# The cache outlives the rollback at the end of every test, and with it
+# pages cached from rows that no longer exist; tests that exercise the
+# result cache enable it and clear the cache themselves.
+TASK_RESULT_CACHE_ALIAS = None
+
+# Reads stay on the default database unless a test enables the replica
+REPLICA_DATABASE_ALIAS = None